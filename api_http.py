@@ -0,0 +1,435 @@
+"""
+================================================================================
+SISTEMA UNITECH - API HTTP/JSON
+================================================================================
+
+DESCRIÇÃO:
+Expõe as principais operações do sistema para outros programas (ex: o portal)
+por HTTP, com requisições e respostas em JSON. Usa apenas a biblioteca padrão
+(http.server) e as mesmas regras do menu (servicos.py), sobre os dados dos
+arquivos database_*.json carregados uma única vez.
+
+USO:
+python api_http.py [porta]
+(padrão: porta 8080)
+
+ROTAS:
+    POST /login                            {"matricula", "senha"} → token
+    GET  /disciplinas                      disciplinas do usuário logado
+    GET  /disciplinas/<id>/atividades      postagens da disciplina (?pagina=N)
+    POST /atividades/<id>/entregas         {"resposta"} (alunos)
+    GET  /aprovacoes                       cadastros pendentes (?turma=, ?padrao=)
+                                           (administradores)
+    POST /aprovacoes                       {"aprovado": true/false} com "ids": [...],
+                                           "turma" ou "padrao": avaliação em
+                                           lote, gravada de uma vez (administradores)
+    POST /usuarios/<id>/aprovacao          {"aprovado": true/false}: avalia um
+                                           cadastro pendente (administradores;
+                                           409 se não estiver pendente)
+    POST /relatorios/presenca              {"disciplina", "turmas", "data"} ou
+                                           {"disciplina", "turmas", "inicio",
+                                            "fim", "dias_aula"} (professores)
+
+Os arquivos gerados (entregas e relatórios) são devolvidos com o caminho
+relativo à pasta dos dados (ex: "relatorios_presenca/DS2A25_02032026.txt").
+
+AUTENTICAÇÃO:
+O log-in devolve um token, que deve ser enviado nas demais rotas no cabeçalho
+"Authorization: Bearer <token>". Os tokens valem enquanto o servidor estiver
+no ar.
+
+DESEMPENHO:
+- Cada conexão é atendida por uma thread (ThreadingHTTPServer)
+- HTTP/1.1 com keep-alive: o cliente pode enviar muitas requisições pela
+  mesma conexão (todas as respostas têm Content-Length)
+- As consultas usam os índices dos repositórios. Uma trava de leitura e
+  escrita (TravaLeituraEscrita) deixa as requisições que só consultam os
+  dados (log-in, listagens, entregas, relatórios) rodarem ao mesmo tempo;
+  só as que alteram os dados (aprovações) esperam as demais e rodam sozinhas
+- Antes de cada requisição, as coleções alteradas por outros processos são
+  recarregadas, com a trava de escrita (as que não mudaram custam só um
+  os.stat, sem trava)
+- O registro de cada requisição no console fica desligado (custa mais que a
+  própria requisição em testes de carga)
+================================================================================
+"""
+
+import contextlib  # Contextos da trava de leitura e escrita
+import json       # Corpo das requisições e respostas
+import os         # Arquivos gerados, relativos à pasta dos dados
+import re         # Rotas
+import secrets    # Tokens de sessão
+import sys        # Argumentos da linha de comando e erros no console
+import threading  # Trava de leitura e escrita
+import traceback  # Erros inesperados no console
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import relatorios  # Datas dos relatórios de presença em lote
+from medicao import medir  # Tempo de cada rota (UNITECH_METRICAS)
+from servicos import (Sistema, ErroServico, ErroValidacao, ErroAutenticacao, ErroPermissao,
+                      ErroNaoEncontrado)
+
+PORTA_PADRAO = 8080
+
+# Status HTTP de cada tipo de erro dos serviços
+STATUS_ERROS = (
+    (ErroValidacao, 400),
+    (ErroAutenticacao, 401),
+    (ErroPermissao, 403),
+    (ErroNaoEncontrado, 404),
+)
+# Status dos demais erros dos serviços
+STATUS_ERRO_SERVICO = 400
+
+# Sessões abertas: {token: ID_USUARIO}
+sessoes = {}
+
+
+class ErroAPI(Exception):
+    """
+    Erro de uma requisição, devolvido ao cliente como {"erro": mensagem}.
+    """
+
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+class TravaLeituraEscrita:
+    """
+    Trava que deixa várias threads lerem ao mesmo tempo e uma só escrever.
+
+    USO:
+        with trava.leitura():   # junto com outras leituras
+            ...
+        with trava.escrita():   # sozinha: espera as leituras em andamento
+            ...
+
+    OBSERVAÇÃO:
+        Uma escrita esperando impede que novas leituras comecem, para que as
+        alterações não fiquem esperando para sempre sob carga de consultas.
+    """
+
+    def __init__(self):
+        self.condicao = threading.Condition()
+        self.leitores = 0
+        self.escrevendo = False
+        self.escritas_esperando = 0
+
+    @contextlib.contextmanager
+    def leitura(self):
+        with self.condicao:
+            while self.escrevendo or self.escritas_esperando > 0:
+                self.condicao.wait()
+            self.leitores += 1
+        try:
+            yield
+        finally:
+            with self.condicao:
+                self.leitores -= 1
+                if self.leitores == 0:
+                    self.condicao.notify_all()
+
+    @contextlib.contextmanager
+    def escrita(self):
+        with self.condicao:
+            self.escritas_esperando += 1
+            while self.escrevendo or self.leitores > 0:
+                self.condicao.wait()
+            self.escritas_esperando -= 1
+            self.escrevendo = True
+        try:
+            yield
+        finally:
+            with self.condicao:
+                self.escrevendo = False
+                self.condicao.notify_all()
+
+
+# ================================================================================
+# OPERAÇÕES
+# ================================================================================
+# Cada operação recebe o sistema, a sessão do usuário logado (ID do usuário,
+# ou None no log-in), os parâmetros da rota, a query string e o corpo JSON, e
+# retorna (status, resposta). As regras ficam em servicos.py.
+
+def resumo_disciplina(sistema, id_disciplina):
+    disciplina = sistema.disciplinas[id_disciplina]
+    professor = disciplina["professor"]
+    return {"id": id_disciplina, "nome": disciplina["nome"], "curso": disciplina["curso"],
+            "semestre": disciplina["semestre"],
+            "professor": sistema.usuarios[professor]["nome"] if professor != None else None}
+
+
+def nome_arquivo(sistema, caminho):
+    # Caminho relativo à pasta dos dados (ex: "relatorios_presenca/DS2A25_02032026.txt"):
+    # o cliente não precisa conhecer as pastas do servidor
+    return os.path.relpath(caminho, sistema.pasta).replace(os.sep, "/")
+
+
+def exigir_admin(sistema, id_usuario):
+    if sistema.usuarios[id_usuario]["admin"] != True:
+        raise ErroPermissao("Operação disponível apenas para administradores.")
+
+
+def login(sistema, _id_usuario, _parametros, _query, corpo):
+    id_usuario, usuario = sistema.autenticar(str(corpo.get("matricula", "")), str(corpo.get("senha", "")))
+    token = secrets.token_hex(16)
+    sessoes[token] = id_usuario
+    return 200, {"token": token, "id": id_usuario, "nome": usuario["nome"],
+                 "cargo": usuario["cargo"], "admin": usuario["admin"]}
+
+
+def listar_disciplinas(sistema, id_usuario, _parametros, _query, _corpo):
+    # Alunos: disciplinas da sua turma; professores: as que lecionam;
+    # administradores: todas (como no menu Disciplinas)
+    return 200, {"disciplinas": [resumo_disciplina(sistema, id_disciplina)
+                                 for id_disciplina in sistema.disciplinas_do_usuario(id_usuario)]}
+
+
+def listar_atividades(sistema, _id_usuario, parametros, query, _corpo):
+    id_disciplina = parametros[0].upper()
+    if id_disciplina not in sistema.disciplinas:
+        raise ErroNaoEncontrado("Digite uma disciplina válida!")
+    try:
+        pagina = int(query.get("pagina", ["1"])[0])
+    except ValueError:
+        raise ErroValidacao("Página inválida.")
+    if pagina < 1:
+        raise ErroValidacao("Página inválida.")
+
+    atividades = [dict(sistema.atividades[id_atividade], id=id_atividade)
+                  for id_atividade in sistema.atividades.atividades_da_disciplina(id_disciplina, pagina)]
+    return 200, {"disciplina": id_disciplina, "total": sistema.atividades.total_da_disciplina(id_disciplina),
+                 "pagina": pagina, "paginas": sistema.atividades.total_paginas(id_disciplina),
+                 "atividades": atividades}
+
+
+def entregar_atividade(sistema, id_usuario, parametros, _query, corpo):
+    if not isinstance(corpo.get("resposta"), str):
+        raise ErroValidacao("Envie a resposta da atividade.")
+    arquivo = sistema.entregar_atividade(id_usuario, parametros[0].upper(), corpo["resposta"])
+    return 201, {"mensagem": "Atividade enviada!", "arquivo": nome_arquivo(sistema, arquivo)}
+
+
+def listar_aprovacoes(sistema, id_usuario, _parametros, query, _corpo):
+    exigir_admin(sistema, id_usuario)
+    turma = query.get("turma", [None])[0]
+    padrao = query.get("padrao", [None])[0]
+    pendentes = []
+    for id_pendente in sistema.cadastros_pendentes(turma and turma.upper(), padrao):
+        pendente = sistema.usuarios[id_pendente]
+        pendentes.append({"id": id_pendente, "nome": pendente["nome"], "cargo": pendente["cargo"],
+                          "matricula": pendente["matricula"], "turma": pendente["turma"]})
+    return 200, {"pendentes": pendentes}
+
+
+def aprovar_usuario(sistema, id_usuario, parametros, _query, corpo):
+    exigir_admin(sistema, id_usuario)
+    if not isinstance(corpo.get("aprovado"), bool):
+        raise ErroValidacao("Envie \"aprovado\": true ou false.")
+    id_avaliado = parametros[0].upper()
+    if id_avaliado == id_usuario:
+        raise ErroValidacao("Você não pode avaliar o seu próprio cadastro.")
+    if id_avaliado not in sistema.usuarios:
+        raise ErroNaoEncontrado("Usuário não encontrado.")
+    # Contas já avaliadas (aprovadas, administradores) nunca são alteradas aqui
+    if not sistema.usuarios.pendente(id_avaliado):
+        raise ErroAPI(409, "Usuário sem cadastro pendente.")
+    sistema.avaliar_cadastro(id_avaliado, corpo["aprovado"])
+    return 200, {"id": id_avaliado,
+                 "mensagem": "Usuário aprovado!" if corpo["aprovado"] else "Usuário reprovado!"}
+
+
+def avaliar_em_lote(sistema, id_usuario, _parametros, _query, corpo):
+    exigir_admin(sistema, id_usuario)
+    if not isinstance(corpo.get("aprovado"), bool):
+        raise ErroValidacao("Envie \"aprovado\": true ou false.")
+    if "ids" in corpo:
+        if not isinstance(corpo["ids"], list):
+            raise ErroValidacao("Envie \"ids\" como uma lista.")
+        avaliados = sistema.avaliar_cadastros([str(id_avaliado).upper() for id_avaliado in corpo["ids"]],
+                                              corpo["aprovado"])
+    elif "turma" in corpo or "padrao" in corpo:
+        turma = corpo.get("turma")
+        avaliados = sistema.avaliar_pendentes(corpo["aprovado"], turma=turma and str(turma).upper(),
+                                              padrao=corpo.get("padrao") and str(corpo["padrao"]))
+    else:
+        raise ErroValidacao("Envie \"ids\", \"turma\" ou \"padrao\".")
+    return 200, {"avaliados": avaliados, "aprovado": corpo["aprovado"]}
+
+
+def gerar_relatorio_presenca(sistema, id_usuario, _parametros, _query, corpo):
+    if sistema.usuarios[id_usuario]["cargo"] != "professor":
+        raise ErroPermissao("Operação disponível apenas para professores.")
+    id_disciplina = str(corpo.get("disciplina", "")).upper()
+    if id_disciplina not in sistema.disciplinas or sistema.disciplinas[id_disciplina]["professor"] != id_usuario:
+        raise ErroNaoEncontrado("Digite uma disciplina válida!")
+
+    # Turmas: lista de códigos ou "*" para todas as turmas do curso da disciplina
+    turmas = corpo.get("turmas", "*")
+    if turmas == "*":
+        turmas = sistema.turmas_da_disciplina(id_disciplina)
+    elif isinstance(turmas, list) and all(isinstance(turma, str) for turma in turmas):
+        turmas = [turma.upper() for turma in turmas]
+    else:
+        raise ErroValidacao("Envie \"turmas\" como uma lista de códigos ou \"*\".")
+
+    # Data única ou período (um relatório por dia de aula)
+    try:
+        if "data" in corpo:
+            datas = [str(corpo["data"])]
+        else:
+            datas = relatorios.datas_do_periodo(corpo["inicio"], corpo["fim"], corpo.get("dias_aula", ""))
+    except (KeyError, TypeError, ValueError, AttributeError):
+        raise ErroValidacao("Digite uma data válida!")
+
+    arquivos = sistema.gerar_relatorios_presenca(id_usuario, turmas, datas)
+    return 201, {"arquivos": [nome_arquivo(sistema, arquivo) for arquivo in arquivos]}
+
+
+# Rotas: (método, expressão do caminho, operação, exige log-in, altera os
+# dados). Entregas e relatórios só escrevem os seus próprios arquivos .txt
+ROTAS = [
+    ("POST", re.compile(r"^/login$"), login, False, False),
+    ("GET", re.compile(r"^/disciplinas$"), listar_disciplinas, True, False),
+    ("GET", re.compile(r"^/disciplinas/([^/]+)/atividades$"), listar_atividades, True, False),
+    ("POST", re.compile(r"^/atividades/([^/]+)/entregas$"), entregar_atividade, True, False),
+    ("GET", re.compile(r"^/aprovacoes$"), listar_aprovacoes, True, False),
+    ("POST", re.compile(r"^/aprovacoes$"), avaliar_em_lote, True, True),
+    ("POST", re.compile(r"^/usuarios/([^/]+)/aprovacao$"), aprovar_usuario, True, True),
+    ("POST", re.compile(r"^/relatorios/presenca$"), gerar_relatorio_presenca, True, False),
+]
+
+
+# ================================================================================
+# SERVIDOR HTTP
+# ================================================================================
+
+class ManipuladorAPI(BaseHTTPRequestHandler):
+    """
+    Atende as requisições de uma conexão (HTTP/1.1, com keep-alive).
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "UniTechAPI/1.0"
+    # Cabeçalhos e corpo saem em um único envio (a resposta é enviada ao fim
+    # da requisição), sem esperar a confirmação do pacote anterior
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.atender("GET")
+
+    def do_POST(self):
+        self.atender("POST")
+
+    def atender(self, metodo):
+        try:
+            # O corpo é sempre lido, para que a próxima requisição da mesma
+            # conexão comece no lugar certo
+            corpo = self.ler_corpo()
+            url = urlsplit(self.path)
+            for metodo_rota, padrao, operacao, exige_login, altera in ROTAS:
+                encontrado = padrao.match(url.path)
+                if encontrado and metodo_rota == metodo:
+                    break
+            else:
+                raise ErroAPI(404, "Rota não encontrada.")
+
+            sistema = self.server.sistema
+            trava = self.server.trava
+            # Alterações feitas por outros processos (ex: menu no console):
+            # recarregar troca os índices, então só com a trava de escrita
+            if sistema.desatualizado():
+                with trava.escrita():
+                    sistema.sincronizar()
+            with trava.escrita() if altera else trava.leitura():
+                id_usuario = self.usuario_logado(sistema) if exige_login else None
+                with medir(f"api_{operacao.__name__}"):
+                    status, resposta = operacao(sistema, id_usuario, encontrado.groups(), parse_qs(url.query), corpo)
+        except ErroAPI as erro:
+            status, resposta = erro.status, {"erro": erro.mensagem}
+        except ErroServico as erro:
+            status = next((status for tipo, status in STATUS_ERROS if isinstance(erro, tipo)), STATUS_ERRO_SERVICO)
+            resposta = {"erro": erro.mensagem}
+        except Exception:
+            # Erro inesperado: registrado no console, e o cliente ainda recebe
+            # uma resposta (sem ela, a conexão cairia sem explicação)
+            print(f"Erro em {metodo} {self.path}:", file=sys.stderr)
+            traceback.print_exc()
+            status, resposta = 500, {"erro": "Erro interno do servidor."}
+        self.responder(status, resposta)
+
+    def ler_corpo(self):
+        try:
+            tamanho = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            tamanho = -1
+        if tamanho < 0:
+            # Sem um tamanho válido não há como saber onde o corpo termina
+            self.close_connection = True
+            raise ErroAPI(400, "Content-Length inválido.")
+        if tamanho == 0:
+            return {}
+        try:
+            corpo = json.loads(self.rfile.read(tamanho))
+        except ValueError:
+            raise ErroAPI(400, "Corpo da requisição não é um JSON válido.")
+        if not isinstance(corpo, dict):
+            raise ErroAPI(400, "O corpo da requisição deve ser um objeto JSON.")
+        return corpo
+
+    def usuario_logado(self, sistema):
+        autorizacao = self.headers.get("Authorization", "")
+        id_usuario = sessoes.get(autorizacao.removeprefix("Bearer ").strip())
+        if id_usuario == None or id_usuario not in sistema.usuarios:
+            raise ErroAPI(401, "Faça seu log-in.")
+        return id_usuario
+
+    def responder(self, status, resposta):
+        conteudo = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, formato, *argumentos):
+        pass
+
+
+class ServidorAPI(ThreadingHTTPServer):
+    """
+    Servidor HTTP com uma thread por conexão, compartilhando um único Sistema
+    (protegido pela trava de leitura e escrita do servidor).
+    """
+
+    # Fila de conexões maior para testes de carga com muitos clientes
+    request_queue_size = 1024
+    daemon_threads = True
+
+    def __init__(self, endereco, sistema):
+        super().__init__(endereco, ManipuladorAPI)
+        self.sistema = sistema
+        self.trava = TravaLeituraEscrita()
+
+
+def main():
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA_PADRAO
+    sistema = Sistema()
+    sistema.carregar_tudo()
+    servidor = ServidorAPI(("0.0.0.0", porta), sistema)
+    print(f"API UniTech na porta {porta}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1290 @@
+"""
+================================================================================
+SISTEMA UNITECH - ARMAZENAMENTO DOS BANCOS DE DADOS
+================================================================================
+
+DESCRIÇÃO:
+Define como cada coleção (usuários, disciplinas, atividades, turmas) é lida e
+gravada em disco. Os repositórios não escrevem arquivos diretamente: a cada
+alteração avisam o armazenamento qual registro mudou, e o armazenamento decide
+como persistir.
+
+MODOS DISPONÍVEIS (variável de ambiente UNITECH_ARMAZENAMENTO):
+- "json" (padrão): cada alteração regrava o arquivo JSON inteiro
+- "journal": cada alteração é acrescentada como uma linha pequena em um log
+  ao lado do JSON (database_users.json.log, ...). De tempos em tempos o log é
+  compactado: o JSON é regravado com o estado atual e o log é esvaziado.
+- "sqlite": as quatro coleções ficam em tabelas de um banco SQLite
+  (database_unitech.db, modo WAL). Os registros são lidos do banco sob
+  demanda em vez de ficarem todos na memória. Para migrar os arquivos JSON
+  existentes, use migrar_sqlite.py.
+
+FORMATO DO LOG (uma linha JSON por alteração):
+    {"op": "gravar", "id": "ABC1234", "registro": {...}}
+    {"op": "excluir", "id": "ABC1234"}
+
+CACHE COMPACTO (modos "json" e "journal"):
+Depois de cada leitura do JSON, e a cada vez que o sistema o regrava, uma
+cópia dos dados é gravada em formato binário ao lado dele
+(database_users.json.cache, ...). Nas próximas leituras, se o JSON não mudou,
+o cache é lido no lugar dele, cerca de duas vezes mais rápido que
+interpretar o texto (ver benchmark_cache.py).
+
+O cache começa com um cabeçalho (versão, formato, data de modificação,
+tamanho e hash do JSON):
+1. Mesmo tamanho e mesma data de modificação: o cache é usado direto
+2. Mesmo tamanho e data diferente (ex: arquivo copiado ou restaurado): o
+   JSON é lido e o hash confere se o conteúdo é o mesmo, o que ainda evita
+   interpretá-lo; a nova data é anotada no cabeçalho
+3. Qualquer outra diferença, cache ausente ou ilegível: o JSON é lido
+   normalmente e o cache é refeito
+Os dados são gravados com marshal, que já vem carregado no interpretador (não
+pesa no início do sistema); se houver objetos que o marshal não aceita (ex:
+os registros compactos de registros.py, depois de uma gravação), com pickle.
+
+ARQUIVOS GRANDES (modos "json" e "journal"):
+O JSON é sempre gravado em partes (escrever_registros_json): grupos de
+registros são convertidos em texto e escritos um de cada vez, sem montar o
+texto do arquivo inteiro na memória. O resultado é idêntico ao de json.dumps.
+JSON maiores que LIMITE_LEITURA_INTEIRA são também lidos em partes
+(ler_registros_json): o arquivo é lido em blocos e cada registro é
+interpretado assim que chega, então a memória usada além dos próprios
+registros fica limitada a um bloco, em vez do arquivo inteiro (bytes e texto)
+de json.loads. Esses arquivos não usam o cache compacto, que teria de ser lido
+(e gravado) inteiro de uma vez.
+
+VÁRIOS PROCESSOS NOS MESMOS ARQUIVOS (modos "json" e "journal"):
+Dois processos (ex: dois menus abertos, o servidor de sessões e a API) podem
+alterar a mesma coleção. Para que nenhuma alteração se perca:
+1. Escrita atômica: o JSON é escrito em um arquivo temporário, gravado em
+   disco (fsync) e só então colocado no lugar do antigo (os.replace). Uma
+   queda no meio da escrita deixa o arquivo antigo intacto.
+2. Trava entre processos: leituras e alterações de uma coleção são feitas com
+   uma trava exclusiva (fcntl.flock) no arquivo database_*.json.lock.
+3. Versão otimista: o armazenamento lembra a versão do arquivo (inode, data
+   de modificação e tamanho) que leu ou gravou por último. Se, ao alterar,
+   outro processo já tiver gravado a coleção, o repositório recarrega os
+   dados e os índices e reaplica a sua alteração sobre eles.
+4. Gravação em grupo: dentro de "with repositorio.lote():" as alterações são
+   aplicadas na memória e gravadas de uma só vez (um único fsync) no fim.
+5. Atualização entre sessões: antes das ações, o sistema compara a versão de
+   cada coleção carregada com a do arquivo (apenas um os.stat) e recarrega
+   só as que mudaram. No modo journal, se apenas o log cresceu, são lidas
+   somente as linhas novas.
+No Windows (sem fcntl) não há trava entre processos; os demais itens valem.
+
+RECUPERAÇÃO:
+Ao carregar, o JSON é lido e as linhas do log são reaplicadas em ordem. Uma
+última linha incompleta (queda no meio da escrita) é ignorada. Reaplicar o log
+sobre um JSON já compactado não altera o resultado, então uma queda entre a
+regravação do JSON e a limpeza do log também é segura.
+================================================================================
+"""
+
+import itertools  # Grupos de registros na gravação em partes
+import json       # Manipulação de arquivos JSON (banco de dados)
+import marshal    # Cache compacto dos arquivos JSON
+import os         # Caminhos, variáveis de ambiente e troca atômica de arquivos
+import struct     # Cabeçalho do cache compacto
+from collections.abc import MutableMapping  # Interface de dicionário das tabelas
+
+from medicao import medido  # Tempo das gravações (UNITECH_METRICAS)
+from registros import Registro  # Registros compactos (gravados como objetos JSON)
+
+try:
+    import fcntl  # Trava entre processos (Linux e macOS)
+except ImportError:
+    fcntl = None  # Windows: sem trava entre processos
+
+# sqlite3 é importado apenas por conectar_sqlite, e hashlib e pickle apenas
+# quando o cache precisa deles: o início do sistema não paga essas importações
+
+# Variável de ambiente que escolhe o modo de armazenamento
+VARIAVEL_MODO = "UNITECH_ARMAZENAMENTO"
+
+# Cabeçalho do cache compacto, de tamanho fixo para poder ser atualizado sem
+# regravar os dados: marca, versão, formato dos dados, data de modificação
+# (ns), tamanho e hash do JSON. Caches de outra versão são ignorados.
+CABECALHO_CACHE = struct.Struct("<4sBBqq16s")
+MAGICA_CACHE = b"UTCC"
+VERSAO_CACHE = 2
+FORMATO_MARSHAL = 1
+FORMATO_PICKLE = 2
+
+# JSON maiores que isto (bytes) são lidos em partes e não usam o cache
+LIMITE_LEITURA_INTEIRA = 64 * 1024 * 1024
+
+# Leitura e gravação em partes: caracteres lidos por vez e registros
+# convertidos em texto por vez (grupos de 256 gravam tão rápido quanto
+# json.dumps do dicionário inteiro)
+TAMANHO_BLOCO_LEITURA = 1024 * 1024
+REGISTROS_POR_PARTE = 256
+
+# Caracteres que podem continuar um número JSON
+CARACTERES_NUMERO = "0123456789.eE+-"
+
+# Cortes tentados por bloco no caminho rápido da leitura em partes
+TENTATIVAS_CORTE = 3
+
+# Número de alterações no log que dispara a compactação automática
+LIMITE_COMPACTACAO = 1000
+
+# Nome do arquivo do banco SQLite (na mesma pasta dos arquivos JSON)
+NOME_BANCO_SQLITE = "database_unitech.db"
+
+# ================================================================================
+# ESQUEMA DO BANCO SQLITE
+# ================================================================================
+# Para cada tabela: colunas (nome, tipo) na ordem dos campos do JSON e índices.
+# As colunas BOOLEAN são gravadas como 0/1 (ou NULL) e lidas de volta como bool.
+# Os índices atendem às consultas do sistema: login e cadastro (matrícula,
+# e-mail, CPF), alunos aprovados de uma turma (turma + cargo + aprovado),
+# aprovações pendentes, de todas as turmas ou de uma (aprovado + turma),
+# disciplinas de uma turma (curso + semestre), disciplinas de um professor e
+# atividades de uma disciplina. Cada índice cobre todos os campos da sua
+# consulta: com um índice só de "aprovado", o SQLite o escolheria para listar
+# os alunos de uma turma e percorreria quase todos os usuários. Os índices "unicos" (UNIQUE) recusam no próprio banco um valor
+# repetido, mesmo que dois processos tentem gravá-lo ao mesmo tempo.
+# A tabela "versoes" guarda um contador por tabela, aumentado a cada gravação
+# (ver ArmazenamentoSQLite.desatualizado).
+ESQUEMA_SQLITE = {
+    "users": {
+        "colunas": (("nome", "TEXT"), ("cargo", "TEXT"), ("matricula", "TEXT"),
+                    ("cpf", "TEXT"), ("data_nascimento", "TEXT"), ("email", "TEXT"),
+                    ("senha", "TEXT"), ("turma", "TEXT"), ("aprovado", "BOOLEAN"),
+                    ("admin", "BOOLEAN")),
+        "unicos": (("matricula",), ("email",), ("cpf",)),
+        "indices": (("turma", "cargo", "aprovado"), ("aprovado", "turma"))
+    },
+    "disciplinas": {
+        "colunas": (("nome", "TEXT"), ("curso", "TEXT"), ("semestre", "INTEGER"),
+                    ("professor", "TEXT")),
+        "unicos": (),
+        "indices": (("curso", "semestre"), ("professor",))
+    },
+    "atividades": {
+        "colunas": (("titulo", "TEXT"), ("conteudo", "TEXT"), ("prazo", "TEXT"),
+                    ("tipo", "TEXT"), ("disciplina", "TEXT")),
+        "unicos": (),
+        "indices": (("disciplina",),)
+    },
+    "turmas": {
+        "colunas": (("curso", "TEXT"), ("semestre", "INTEGER")),
+        "unicos": (),
+        "indices": (("curso", "semestre"),)
+    }
+}
+
+
+class TravaArquivo:
+    """
+    Trava exclusiva entre processos, feita com fcntl.flock em um arquivo .lock.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo de trava (None: não trava)
+
+    USO:
+        with trava:
+            ...  # nenhum outro processo entra em "with" na mesma trava
+
+    OBSERVAÇÕES:
+        - É reentrante: entrar de novo na mesma trava (ex: uma alteração
+          dentro de um lote) apenas aumenta o nível, sem travar outra vez
+        - Dentro de um processo, quem compartilha o armazenamento entre
+          threads usa também a trava do Sistema
+        - Se o arquivo de trava não puder ser criado (pasta sem permissão de
+          escrita) ou não houver fcntl, segue sem travar
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.arquivo = None
+        self.nivel = 0
+
+    def adquirir(self):
+        if self.nivel == 0 and self.caminho != None and fcntl != None:
+            try:
+                self.arquivo = open(self.caminho, "a")
+                fcntl.flock(self.arquivo.fileno(), fcntl.LOCK_EX)
+            except OSError:
+                if self.arquivo != None:
+                    self.arquivo.close()
+                self.arquivo = None
+        self.nivel += 1
+
+    def liberar(self):
+        self.nivel -= 1
+        if self.nivel == 0 and self.arquivo != None:
+            fcntl.flock(self.arquivo.fileno(), fcntl.LOCK_UN)
+            self.arquivo.close()
+            self.arquivo = None
+
+    def __enter__(self):
+        self.adquirir()
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento):
+        self.liberar()
+
+
+class Lote:
+    """
+    Agrupa várias alterações de uma coleção em uma única gravação.
+
+    PARÂMETROS:
+        armazenamento: Armazenamento da coleção
+        ao_iniciar (callable): Chamado logo depois de travar (o repositório o
+                               usa para se sincronizar antes das alterações)
+
+    USO:
+        with armazenamento.lote():   # ou repositorio.lote()
+            ...  # alterações aplicadas na memória, gravadas uma vez no fim
+
+    OBSERVAÇÃO:
+        A trava do armazenamento fica com o lote do início ao fim. Se houver
+        um erro no meio, o que já foi alterado na memória é gravado mesmo
+        assim, para que o disco não fique diferente da memória.
+    """
+
+    def __init__(self, armazenamento, ao_iniciar=None):
+        self.armazenamento = armazenamento
+        self.ao_iniciar = ao_iniciar
+
+    def __enter__(self):
+        self.armazenamento.iniciar_lote()
+        if self.ao_iniciar != None:
+            try:
+                self.ao_iniciar()
+            except BaseException:
+                self.armazenamento.concluir_lote()
+                raise
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento):
+        self.armazenamento.concluir_lote()
+
+
+def gravar_arquivo_atomico(caminho, conteudo):
+    """
+    Grava um arquivo sem nunca deixá-lo pela metade.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo
+        conteudo (bytes | iterável de bytes): Conteúdo completo, ou as suas
+                     partes em ordem (ex: escrever_registros_json)
+
+    FUNCIONAMENTO:
+        1. Escreve o conteúdo em caminho + ".tmp" e o grava em disco (fsync)
+        2. Troca o arquivo antigo pelo novo (os.replace é atômico)
+        3. Grava em disco a pasta, para que a troca sobreviva a uma queda
+    """
+    caminho_temporario = caminho + ".tmp"
+    with open(caminho_temporario, "wb") as arquivo_escrita:
+        if isinstance(conteudo, bytes):
+            arquivo_escrita.write(conteudo)
+        else:
+            for parte in conteudo:
+                arquivo_escrita.write(parte)
+        arquivo_escrita.flush()
+        os.fsync(arquivo_escrita.fileno())
+    os.replace(caminho_temporario, caminho)
+    if os.name == "posix":
+        pasta = os.open(os.path.dirname(os.path.abspath(caminho)), os.O_RDONLY)
+        try:
+            os.fsync(pasta)
+        finally:
+            os.close(pasta)
+
+
+class ArmazenamentoJSON:
+    """
+    Armazenamento padrão: o arquivo JSON é regravado inteiro a cada alteração.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo JSON da coleção
+
+    ATRIBUTOS:
+        trava (TravaArquivo): Trava entre processos da coleção
+        versao: Versão do arquivo na última leitura ou gravação deste objeto
+                (ver desatualizado)
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.caminho_cache = caminho + ".cache"
+        self.trava = TravaArquivo(caminho + ".lock")
+        self.versao = None
+        # De onde veio a última leitura: "cache" ou "json"
+        self.origem = None
+        # Lote em andamento: nível (lotes dentro de lotes) e dados a gravar
+        self.nivel_lote = 0
+        self.dados_pendentes = None
+
+    def _versao_atual(self):
+        # Identifica o conteúdo atual do arquivo: os.replace troca o inode e
+        # toda escrita muda a data de modificação (None: arquivo não existe)
+        try:
+            estado = os.stat(self.caminho)
+        except FileNotFoundError:
+            return None
+        return (estado.st_ino, estado.st_mtime_ns, estado.st_size)
+
+    def desatualizado(self):
+        """
+        Indica se outro processo gravou a coleção desde a última leitura ou
+        gravação feita por este armazenamento.
+        """
+        return self._versao_atual() != self.versao
+
+    def ler_alteracoes_novas(self):
+        """
+        Lê apenas as alterações gravadas por outros processos desde a última
+        leitura, quando isso é possível sem ler a coleção inteira de novo.
+
+        RETORNA:
+            list | None: Pares (ID, registro), com registro None nas exclusões,
+                         ou None se for preciso recarregar a coleção inteira
+                         (sempre, neste modo: o JSON é regravado inteiro)
+        """
+        return None
+
+    def carregar(self):
+        """
+        Lê o arquivo JSON da coleção (ou o seu cache compacto, se estiver em dia).
+
+        RETORNA:
+            dict: Registros {ID: registro}
+
+        EXCEÇÕES:
+            Lança exceção se o arquivo não existir ou estiver inválido
+        """
+        with self.trava:
+            self.versao = self._versao_atual()
+            return self._ler()
+
+    def _ler(self):
+        # Leitura em si (a trava já está com quem chamou)
+        estado = os.stat(self.caminho)
+        if estado.st_size > LIMITE_LEITURA_INTEIRA:
+            # Arquivo grande: lido em partes e sem o cache (ver ARQUIVOS GRANDES)
+            with open(self.caminho, "r", encoding="utf-8-sig") as arquivo_leitura:
+                dados = dict(ler_registros_json(arquivo_leitura))
+            self.origem = "json em partes"
+            return dados
+        try:
+            with open(self.caminho_cache, "rb") as arquivo_cache:
+                magica, versao, formato, mtime_ns, tamanho, hash_json = CABECALHO_CACHE.unpack(
+                    arquivo_cache.read(CABECALHO_CACHE.size))
+                if magica == MAGICA_CACHE and versao == VERSAO_CACHE and tamanho == estado.st_size:
+                    if mtime_ns == estado.st_mtime_ns:
+                        self.origem = "cache"
+                        return _ler_dados_cache(arquivo_cache, formato)
+                    # Data diferente: só o hash diz se o conteúdo mudou
+                    with open(self.caminho, "rb") as arquivo_leitura:
+                        conteudo = arquivo_leitura.read()
+                    if _hash_conteudo(conteudo) == hash_json:
+                        dados = _ler_dados_cache(arquivo_cache, formato)
+                        self._atualizar_data_cache(formato, estado, hash_json)
+                        self.origem = "cache"
+                        return dados
+        except Exception:
+            # Cache ausente, ilegível ou de outra versão: lê o JSON
+            pass
+
+        with open(self.caminho, "rb") as arquivo_leitura:
+            conteudo = arquivo_leitura.read()
+        dados = json.loads(conteudo)
+        self.origem = "json"
+        self._gravar_cache(dados, _hash_conteudo(conteudo), estado)
+        return dados
+
+    def _atualizar_data_cache(self, formato, estado, hash_json):
+        # Anota a nova data de modificação do JSON no cabeçalho, sem regravar
+        # os dados (o cabeçalho tem tamanho fixo)
+        try:
+            with open(self.caminho_cache, "r+b") as arquivo_cache:
+                arquivo_cache.write(CABECALHO_CACHE.pack(MAGICA_CACHE, VERSAO_CACHE, formato,
+                                                         estado.st_mtime_ns, estado.st_size, hash_json))
+        except OSError:
+            pass
+
+    def _gravar_cache(self, dados, hash_json, estado=None):
+        # Grava o cache dos dados cujo JSON tem o hash informado. O cache é só
+        # uma otimização: se não puder ser gravado (ex: pasta sem permissão de
+        # escrita), o JSON continua sendo lido normalmente
+        try:
+            if estado == None:
+                estado = os.stat(self.caminho)
+            if estado.st_size > LIMITE_LEITURA_INTEIRA:
+                # Arquivos grandes não usam o cache: apaga o de uma versão menor
+                os.remove(self.caminho_cache)
+                return
+            try:
+                dados_cache = marshal.dumps(dados)
+                formato = FORMATO_MARSHAL
+            except ValueError:
+                import pickle
+                dados_cache = pickle.dumps(dados, protocol=pickle.HIGHEST_PROTOCOL)
+                formato = FORMATO_PICKLE
+            cabecalho = CABECALHO_CACHE.pack(MAGICA_CACHE, VERSAO_CACHE, formato, estado.st_mtime_ns,
+                                             estado.st_size, hash_json)
+            with open(self.caminho_cache + ".tmp", "wb") as arquivo_cache:
+                arquivo_cache.write(cabecalho)
+                arquivo_cache.write(dados_cache)
+            os.replace(self.caminho_cache + ".tmp", self.caminho_cache)
+        except Exception:
+            pass
+
+    def gravar(self, dados, chave):
+        """
+        Persiste a inclusão ou alteração do registro dados[chave].
+        """
+        self.salvar(dados)
+
+    def excluir(self, dados, chave):
+        """
+        Persiste a exclusão do registro chave (já removido de dados).
+        """
+        self.salvar(dados)
+
+    def salvar(self, dados):
+        """
+        Regrava o arquivo JSON com todos os registros (e o seu cache). Dentro
+        de um lote, apenas anota que os dados devem ser gravados no fim.
+        """
+        if self.nivel_lote > 0:
+            self.dados_pendentes = dados
+            return
+        with self.trava:
+            self._gravar_json(dados)
+            self.versao = self._versao_atual()
+
+    @medido("gravar_json")
+    def _gravar_json(self, dados):
+        # Grava o JSON em partes e, com o hash calculado durante a escrita,
+        # o cache (a trava já está com quem chamou)
+        import hashlib
+        hash_json = hashlib.blake2b(digest_size=16)
+
+        def partes():
+            for parte in escrever_registros_json(dados):
+                hash_json.update(parte)
+                yield parte
+
+        gravar_arquivo_atomico(self.caminho, partes())
+        self._gravar_cache(dados, hash_json.digest())
+
+    def lote(self, ao_iniciar=None):
+        """
+        Retorna um contexto (with) que agrupa as alterações em uma gravação.
+        """
+        return Lote(self, ao_iniciar)
+
+    def iniciar_lote(self):
+        self.trava.adquirir()
+        self.nivel_lote += 1
+
+    def concluir_lote(self):
+        self.nivel_lote -= 1
+        try:
+            if self.nivel_lote == 0:
+                self._gravar_pendentes()
+        finally:
+            self.trava.liberar()
+
+    def _gravar_pendentes(self):
+        # Grava de uma vez o que o lote acumulou
+        if self.dados_pendentes != None:
+            dados = self.dados_pendentes
+            self.dados_pendentes = None
+            self.salvar(dados)
+
+
+class ArmazenamentoJournal(ArmazenamentoJSON):
+    """
+    Armazenamento com log de alterações (journal) e compactação periódica.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo JSON da coleção (snapshot)
+        limite_compactacao (int): Alterações no log antes de compactar
+
+    FUNCIONAMENTO:
+        1. gravar/excluir acrescentam uma linha ao log (custo proporcional
+           ao registro alterado, não ao tamanho do banco), gravada em disco
+           (fsync) antes de seguir; em um lote, as linhas são acumuladas e
+           acrescentadas juntas, com um único fsync
+        2. Ao atingir o limite de linhas, o JSON é regravado e o log esvaziado
+        3. carregar lê o JSON e reaplica o log por cima
+    """
+
+    def __init__(self, caminho, limite_compactacao=LIMITE_COMPACTACAO):
+        super().__init__(caminho)
+        self.caminho_log = caminho + ".log"
+        self.limite_compactacao = limite_compactacao
+        self.entradas_log = 0
+        self.linhas_pendentes = []
+
+    def _versao_atual(self):
+        # A versão inclui o log: outro processo pode só ter acrescentado linhas
+        try:
+            tamanho_log = os.path.getsize(self.caminho_log)
+        except OSError:
+            tamanho_log = None
+        return (super()._versao_atual(), tamanho_log)
+
+    def carregar(self):
+        """
+        Lê o snapshot JSON e reaplica as alterações registradas no log.
+
+        RETORNA:
+            dict: Registros {ID: registro} no estado mais recente
+
+        EXCEÇÕES:
+            Lança exceção se não houver nem snapshot nem log
+        """
+        with self.trava:
+            self.versao = self._versao_atual()
+            if os.path.exists(self.caminho):
+                dados = self._ler()
+            elif os.path.exists(self.caminho_log):
+                dados = {}
+            else:
+                raise FileNotFoundError(self.caminho)
+
+            self.entradas_log, log_completo = self._reaplicar_log(dados)
+            # Um log com linha incompleta é compactado na hora, para que as
+            # próximas alterações não sejam acrescentadas depois da linha quebrada
+            if self.entradas_log >= self.limite_compactacao or not log_completo:
+                self.compactar(dados)
+            return dados
+
+    def ler_alteracoes_novas(self):
+        """
+        Lê as linhas acrescentadas ao log por outros processos desde a última
+        leitura ou gravação (a versão guarda o tamanho do log naquele momento).
+
+        RETORNA:
+            list | None: Pares (ID, registro), com registro None nas exclusões,
+                         ou None se o snapshot foi regravado (compactação) ou
+                         o log terminar em uma linha incompleta
+        """
+        if self.versao == None:
+            return None
+        versao_json, tamanho_log = self._versao_atual()
+        versao_json_lida, posicao = self.versao
+        if posicao == None:
+            posicao = 0
+        if versao_json != versao_json_lida or tamanho_log == None or tamanho_log < posicao:
+            return None
+        with open(self.caminho_log, "rb") as arquivo_log:
+            arquivo_log.seek(posicao)
+            novas = arquivo_log.read(tamanho_log - posicao)
+        if novas and not novas.endswith(b"\n"):
+            return None
+        alteracoes = []
+        for linha in novas.splitlines():
+            alteracao = json.loads(linha)
+            alteracoes.append((alteracao["id"], alteracao.get("registro")))
+        self.entradas_log += len(alteracoes)
+        self.versao = (versao_json, tamanho_log)
+        return alteracoes
+
+    def _reaplicar_log(self, dados):
+        # Reaplica as alterações do log sobre os dados e retorna quantas eram
+        # e se o log foi lido até o fim
+        if not os.path.exists(self.caminho_log):
+            return 0, True
+        entradas = 0
+        with open(self.caminho_log, "r", encoding='utf-8') as arquivo_log:
+            for linha in arquivo_log:
+                try:
+                    alteracao = json.loads(linha)
+                except ValueError:
+                    # Linha incompleta: a gravação foi interrompida
+                    return entradas, False
+                if alteracao["op"] == "gravar":
+                    dados[alteracao["id"]] = alteracao["registro"]
+                else:
+                    dados.pop(alteracao["id"], None)
+                entradas += 1
+        return entradas, True
+
+    def _acrescentar(self, dados, alteracao):
+        self.linhas_pendentes.append(json.dumps(alteracao, ensure_ascii=False, default=_para_json) + "\n")
+        if self.nivel_lote > 0:
+            self.dados_pendentes = dados
+            return
+        self._gravar_linhas(dados)
+
+    @medido("gravar_journal")
+    def _gravar_linhas(self, dados):
+        # Acrescenta ao log as linhas pendentes, com um único fsync
+        with self.trava:
+            with open(self.caminho_log, "a", encoding='utf-8') as arquivo_log:
+                arquivo_log.write("".join(self.linhas_pendentes))
+                arquivo_log.flush()
+                os.fsync(arquivo_log.fileno())
+            self.entradas_log += len(self.linhas_pendentes)
+            self.linhas_pendentes = []
+            self.versao = self._versao_atual()
+            if self.entradas_log >= self.limite_compactacao:
+                self.compactar(dados)
+
+    def _gravar_pendentes(self):
+        if self.linhas_pendentes:
+            dados = self.dados_pendentes
+            self.dados_pendentes = None
+            self._gravar_linhas(dados)
+
+    def gravar(self, dados, chave):
+        self._acrescentar(dados, {"op": "gravar", "id": chave, "registro": dados[chave]})
+
+    def excluir(self, dados, chave):
+        self._acrescentar(dados, {"op": "excluir", "id": chave})
+
+    def salvar(self, dados):
+        self.compactar(dados)
+
+    def compactar(self, dados):
+        """
+        Regrava o snapshot JSON com o estado atual e esvazia o log.
+
+        FUNCIONAMENTO:
+            1. Grava o JSON completo de forma atômica e em partes
+           (gravar_arquivo_atomico, escrever_registros_json)
+            2. Esvazia o log, pois tudo já está no snapshot (inclusive as
+               linhas ainda pendentes de um lote)
+        """
+        with self.trava:
+            self._gravar_json(dados)
+            open(self.caminho_log, "w").close()
+            self.entradas_log = 0
+            self.linhas_pendentes = []
+            self.versao = self._versao_atual()
+
+
+def ler_registros_json(arquivo, tamanho_bloco=TAMANHO_BLOCO_LEITURA):
+    """
+    Lê um arquivo JSON no formato {ID: registro} aos pedaços, entregando os
+    registros assim que terminam de chegar.
+
+    PARÂMETROS:
+        arquivo: Arquivo JSON aberto em modo texto
+        tamanho_bloco (int): Caracteres lidos do arquivo por vez
+
+    RETORNA:
+        Gerador de pares (ID, registro), na ordem do arquivo
+
+    EXCEÇÕES:
+        json.JSONDecodeError (ValueError) se o arquivo não for um objeto JSON
+        válido, como json.load
+
+    FUNCIONAMENTO:
+        1. Só a estrutura de fora (chaves, ":" e ",") é percorrida aqui; os
+           IDs e registros são interpretados pelo decodificador do módulo json
+           (raw_decode), a partir da posição atual do texto já lido
+        2. Caminho rápido: o texto já lido é cortado no último "}" e
+           interpretado de uma vez como um objeto. Se o corte cair no fim de
+           um registro, todos os registros completos saem de uma só chamada
+           (na velocidade de json.loads, com os nomes dos campos
+           compartilhados entre os registros); se cair dentro de um texto ou
+           de um objeto interno, o resultado não é um JSON válido e o "}"
+           anterior é tentado (até TENTATIVAS_CORTE vezes)
+        3. Caso contrário, um registro é interpretado por vez. Se ele não
+           couber no texto já lido (erro de interpretação, ou termina no fim
+           do texto e pode continuar), o texto já interpretado é descartado,
+           mais um bloco é lido e o registro é interpretado de novo
+        4. Assim o texto em memória nunca passa de um bloco mais o registro
+           que está sendo lido
+    """
+    decodificar = json.JSONDecoder().raw_decode
+    pular_espacos = json.decoder.WHITESPACE.match
+    texto = ""
+    posicao = 0
+    fim_arquivo = False
+    # O caminho rápido falhou no texto atual: só volta a ser tentado no próximo bloco
+    cortar = True
+
+    def ler_bloco():
+        nonlocal texto, posicao, fim_arquivo, cortar
+        bloco = arquivo.read(tamanho_bloco)
+        fim_arquivo = not bloco
+        texto = texto[posicao:] + bloco
+        posicao = 0
+        cortar = True
+
+    def proximo_caractere():
+        # Próximo caractere fora de espaços, sem consumi-lo ("" no fim do arquivo)
+        nonlocal posicao
+        while True:
+            posicao = pular_espacos(texto, posicao).end()
+            if posicao < len(texto) or fim_arquivo:
+                return texto[posicao:posicao + 1]
+            ler_bloco()
+
+    def proximo_valor():
+        # Interpreta e consome o próximo valor JSON completo
+        nonlocal posicao
+        while True:
+            posicao = pular_espacos(texto, posicao).end()
+            try:
+                valor, fim = decodificar(texto, posicao)
+                # Um número cortado no fim do bloco (ex: "-3.5e") também é um
+                # número válido: só está completo se o caractere seguinte já
+                # chegou e não o continua
+                completo = fim < len(texto) and (type(valor) not in (int, float)
+                                                  or texto[fim] not in CARACTERES_NUMERO)
+                if completo or fim_arquivo:
+                    posicao = fim
+                    return valor
+            except json.JSONDecodeError:
+                if fim_arquivo:
+                    raise
+            ler_bloco()
+
+    def esperar(caractere):
+        nonlocal posicao
+        if proximo_caractere() != caractere:
+            raise json.JSONDecodeError(f"Esperado '{caractere}'", texto, posicao)
+        posicao += 1
+
+    def registros_completos():
+        # Caminho rápido (item 2): objeto com os registros completos já lidos,
+        # ou None
+        nonlocal posicao, cortar
+        corte = len(texto)
+        for _ in range(TENTATIVAS_CORTE):
+            corte = texto.rfind("}", posicao, corte)
+            if corte == -1:
+                break
+            trecho = "{" + texto[posicao:corte + 1] + "}"
+            try:
+                grupo, fim = decodificar(trecho)
+                if fim == len(trecho) and grupo:
+                    posicao = corte + 1
+                    return grupo
+            except json.JSONDecodeError:
+                pass
+        cortar = False
+        return None
+
+    esperar("{")
+    if proximo_caractere() == "}":
+        posicao += 1
+    else:
+        while True:
+            grupo = registros_completos() if cortar else None
+            if grupo != None:
+                yield from grupo.items()
+            else:
+                chave = proximo_valor()
+                if not isinstance(chave, str):
+                    raise json.JSONDecodeError("Esperado o ID do registro (texto)", texto, posicao)
+                esperar(":")
+                yield chave, proximo_valor()
+            if proximo_caractere() == "}":
+                posicao += 1
+                break
+            esperar(",")
+    if proximo_caractere() != "":
+        raise json.JSONDecodeError("Conteúdo após o fim do objeto", texto, posicao)
+
+
+def escrever_registros_json(dados, registros_por_parte=REGISTROS_POR_PARTE):
+    """
+    Converte os registros {ID: registro} em texto JSON aos pedaços, com o
+    mesmo resultado de json.dumps(dados, ensure_ascii=False).
+
+    PARÂMETROS:
+        dados (dict): Registros {ID: registro} (dicionários ou registros
+                      compactos, gravados da mesma forma)
+        registros_por_parte (int): Registros convertidos por vez
+
+    RETORNA:
+        Gerador de partes (bytes, UTF-8) do arquivo, em ordem
+    """
+    codificar = json.JSONEncoder(ensure_ascii=False, default=_para_json).encode
+    registros = iter(dados.items())
+    prefixo = "{"
+    while True:
+        grupo = dict(itertools.islice(registros, registros_por_parte))
+        if not grupo:
+            break
+        # Registros compactos viram dicionários aqui, o grupo inteiro de uma
+        # vez: mais rápido que a conversão registro a registro pelo json
+        # (default), que fica só para coleções misturadas
+        if isinstance(next(iter(grupo.values())), Registro):
+            grupo = {chave: registro if type(registro) is dict else registro.para_dict()
+                     for chave, registro in grupo.items()}
+        # O grupo é convertido como um objeto; as suas chaves de fora são
+        # trocadas pela continuação do objeto do arquivo
+        yield (prefixo + codificar(grupo)[1:-1]).encode("utf-8")
+        prefixo = ", "
+    yield b"{}" if prefixo == "{" else b"}"
+
+
+def _para_json(objeto):
+    # Conversão dos objetos que o módulo json não conhece: os registros
+    # compactos (registros.py) são gravados como os dicionários de sempre
+    if isinstance(objeto, Registro):
+        return objeto.para_dict()
+    raise TypeError(f"Object of type {type(objeto).__name__} is not JSON serializable")
+
+
+def _hash_conteudo(conteudo):
+    # Hash do conteúdo de um arquivo JSON, guardado no cabeçalho do cache
+    import hashlib
+    return hashlib.blake2b(conteudo, digest_size=16).digest()
+
+
+def _ler_dados_cache(arquivo_cache, formato):
+    # Lê os dados que seguem o cabeçalho do cache. O restante do arquivo é
+    # lido de uma vez: marshal.load direto do arquivo lê aos pedaços e fica
+    # mais lento que o próprio JSON
+    conteudo = arquivo_cache.read()
+    if formato == FORMATO_MARSHAL:
+        return marshal.loads(conteudo)
+    import pickle
+    return pickle.loads(conteudo)
+
+
+# ================================================================================
+# MODO SQLITE
+# ================================================================================
+
+def conectar_sqlite(caminho_banco):
+    """
+    Abre uma conexão com o banco SQLite e cria as tabelas.
+
+    PARÂMETROS:
+        caminho_banco (str): Caminho do arquivo .db
+
+    RETORNA:
+        sqlite3.Connection: Conexão em modo WAL
+
+    FUNCIONAMENTO:
+        - journal_mode=WAL: leitores não bloqueiam o escritor e vice-versa
+        - synchronous=NORMAL: seguro em modo WAL e bem mais rápido que FULL
+        - Cria as tabelas e índices do ESQUEMA_SQLITE se ainda não existirem
+        - Índices idx_<tabela>_* que não estão mais no esquema (bancos de
+          versões anteriores) são apagados. Bancos criados antes dos índices
+          únicos passam a tê-los (falha com sqlite3.IntegrityError se o banco
+          já tiver valores repetidos; ver migrar_para_sqlite)
+
+    OBSERVAÇÃO:
+        Cada armazenamento abre a sua própria conexão: a transação de um lote
+        é da conexão, e uma conexão compartilhada confirmaria (ou desfaria)
+        junto o lote em andamento de outra coleção ou de outro Sistema.
+    """
+    import sqlite3
+
+    conexao = sqlite3.connect(caminho_banco, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    with conexao:
+        conexao.execute("CREATE TABLE IF NOT EXISTS versoes (tabela TEXT PRIMARY KEY, versao INTEGER NOT NULL)")
+        for tabela, esquema in ESQUEMA_SQLITE.items():
+            colunas = ", ".join(f"{nome} {tipo}" for nome, tipo in esquema["colunas"])
+            conexao.execute(f"CREATE TABLE IF NOT EXISTS {tabela} (id TEXT PRIMARY KEY, {colunas})")
+            conexao.execute("INSERT OR IGNORE INTO versoes (tabela, versao) VALUES (?, 0)", (tabela,))
+            indices = {f"idx_{tabela}_{'_'.join(campos)}_unico": ("UNIQUE INDEX", campos)
+                       for campos in esquema["unicos"]}
+            indices.update({f"idx_{tabela}_{'_'.join(campos)}": ("INDEX", campos) for campos in esquema["indices"]})
+            existentes = conexao.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                         "AND name LIKE ?", (tabela, f"idx_{tabela}_%")).fetchall()
+            for (nome_indice,) in existentes:
+                if nome_indice not in indices:
+                    conexao.execute(f"DROP INDEX {nome_indice}")
+            for nome_indice, (tipo, campos) in indices.items():
+                conexao.execute(f"CREATE {tipo} IF NOT EXISTS {nome_indice} ON {tabela} ({', '.join(campos)})")
+    return conexao
+
+
+class TabelaSQLite(MutableMapping):
+    """
+    Tabela SQLite com a mesma interface de um dicionário {ID: registro}.
+
+    PARÂMETROS:
+        conexao (sqlite3.Connection): Conexão aberta por conectar_sqlite
+        tabela (str): "users", "disciplinas", "atividades" ou "turmas"
+
+    FUNCIONAMENTO:
+        - tabela[id] lê o registro do banco e devolve um dicionário novo
+        - tabela[id] = registro grava (insere ou atualiza) na hora
+        - del tabela[id] exclui do banco
+        - A iteração segue a ordem de inserção, como nos arquivos JSON
+        - selecionar/ids_onde/contar_onde fazem as consultas dos repositórios
+          no próprio banco, pelos índices do ESQUEMA_SQLITE
+
+    OBSERVAÇÃO:
+        Como cada leitura devolve uma cópia, alterar o dicionário retornado
+        não altera o banco: é preciso atribuir de volta (os repositórios já
+        fazem isso).
+    """
+
+    def __init__(self, conexao, tabela):
+        self.conexao = conexao
+        self.tabela = tabela
+        # Lotes em andamento: enquanto houver um, as gravações não confirmam
+        # a transação (ArmazenamentoSQLite.concluir_lote confirma tudo junto)
+        self.nivel_lote = 0
+        self.campos = [nome for nome, _ in ESQUEMA_SQLITE[tabela]["colunas"]]
+        self.booleanos = [nome for nome, tipo in ESQUEMA_SQLITE[tabela]["colunas"] if tipo == "BOOLEAN"]
+        lista_campos = ", ".join(self.campos)
+        self._sql_ler = f"SELECT {lista_campos} FROM {tabela} WHERE id = ?"
+        self._sql_listar = f"SELECT id, {lista_campos} FROM {tabela} ORDER BY rowid"
+        # Upsert: atualiza no lugar (mantém o rowid e, portanto, a ordem)
+        atribuicoes = ", ".join(f"{campo} = excluded.{campo}" for campo in self.campos)
+        self._sql_gravar = (f"INSERT INTO {tabela} (id, {lista_campos}) VALUES (?{', ?' * len(self.campos)}) "
+                            f"ON CONFLICT(id) DO UPDATE SET {atribuicoes}")
+        self._sql_versao = "SELECT versao FROM versoes WHERE tabela = ?"
+        self._sql_nova_versao = "UPDATE versoes SET versao = versao + 1 WHERE tabela = ?"
+
+    def _para_registro(self, linha):
+        registro = dict(zip(self.campos, linha))
+        for campo in self.booleanos:
+            if registro[campo] != None:
+                registro[campo] = bool(registro[campo])
+        return registro
+
+    def __getitem__(self, chave):
+        linha = self.conexao.execute(self._sql_ler, (chave,)).fetchone()
+        if linha == None:
+            raise KeyError(chave)
+        return self._para_registro(linha)
+
+    def _executar(self, sql, parametros):
+        # Executa uma alteração, aumenta a versão da tabela na mesma transação
+        # e a confirma, a menos que esteja em um lote
+        if self.nivel_lote > 0:
+            cursor = self.conexao.execute(sql, parametros)
+            self.conexao.execute(self._sql_nova_versao, (self.tabela,))
+            return cursor
+        with self.conexao:
+            cursor = self.conexao.execute(sql, parametros)
+            self.conexao.execute(self._sql_nova_versao, (self.tabela,))
+            return cursor
+
+    def versao(self):
+        """
+        Retorna o contador de gravações da tabela (de todos os processos).
+        """
+        return self.conexao.execute(self._sql_versao, (self.tabela,)).fetchone()[0]
+
+    def _filtro(self, condicoes):
+        # WHERE com "campo = ?" para cada par (campo, valor), ou "IS NULL"
+        # para None. Os nomes das colunas vêm do código, nunca do usuário,
+        # mas são conferidos com o esquema mesmo assim
+        partes = []
+        parametros = []
+        for campo, valor in condicoes:
+            if campo != "id" and campo not in self.campos:
+                raise ValueError(f"Campo desconhecido na tabela {self.tabela}: {campo}")
+            if valor == None:
+                partes.append(f"{campo} IS NULL")
+            else:
+                partes.append(f"{campo} = ?")
+                parametros.append(valor)
+        if not partes:
+            return "", parametros
+        return " WHERE " + " AND ".join(partes), parametros
+
+    def selecionar(self, colunas, *condicoes, limite=-1, deslocamento=0):
+        """
+        Consulta os registros cujos campos têm os valores informados.
+
+        PARÂMETROS:
+            colunas (tuple): Colunas devolvidas ("id" ou campos do esquema)
+            *condicoes: Pares (campo, valor), todos exigidos; valor None
+                        procura o campo vazio
+            limite (int): Máximo de linhas (-1 = todas)
+            deslocamento (int): Linhas puladas no início (paginação)
+
+        RETORNA:
+            list: Tuplas com as colunas, na ordem de inserção
+        """
+        for coluna in colunas:
+            if coluna != "id" and coluna not in self.campos:
+                raise ValueError(f"Campo desconhecido na tabela {self.tabela}: {coluna}")
+        filtro, parametros = self._filtro(condicoes)
+        sql = f"SELECT {', '.join(colunas)} FROM {self.tabela}{filtro} ORDER BY rowid LIMIT ? OFFSET ?"
+        return self.conexao.execute(sql, parametros + [limite, deslocamento]).fetchall()
+
+    def ids_onde(self, *condicoes, limite=-1, deslocamento=0):
+        """
+        IDs dos registros cujos campos têm os valores informados, na ordem
+        de inserção (ver selecionar).
+        """
+        return [linha[0] for linha in self.selecionar(("id",), *condicoes, limite=limite, deslocamento=deslocamento)]
+
+    def contar_onde(self, *condicoes):
+        """
+        Quantidade de registros cujos campos têm os valores informados.
+        """
+        filtro, parametros = self._filtro(condicoes)
+        return self.conexao.execute(f"SELECT COUNT(*) FROM {self.tabela}{filtro}", parametros).fetchone()[0]
+
+    def __setitem__(self, chave, registro):
+        self._executar(self._sql_gravar, [chave] + [registro.get(campo) for campo in self.campos])
+
+    def __delitem__(self, chave):
+        cursor = self._executar(f"DELETE FROM {self.tabela} WHERE id = ?", (chave,))
+        if cursor.rowcount == 0:
+            raise KeyError(chave)
+
+    def __contains__(self, chave):
+        return self.conexao.execute(f"SELECT 1 FROM {self.tabela} WHERE id = ?", (chave,)).fetchone() != None
+
+    def __iter__(self):
+        # Busca só os IDs; a lista é materializada para permitir alterações
+        # na tabela durante a iteração
+        ids = self.conexao.execute(f"SELECT id FROM {self.tabela} ORDER BY rowid").fetchall()
+        return iter([linha[0] for linha in ids])
+
+    def __len__(self):
+        return self.conexao.execute(f"SELECT COUNT(*) FROM {self.tabela}").fetchone()[0]
+
+    def items(self):
+        # Uma única consulta em vez de uma leitura por ID
+        for linha in self.conexao.execute(self._sql_listar).fetchall():
+            yield linha[0], self._para_registro(linha[1:])
+
+    def values(self):
+        for _, registro in self.items():
+            yield registro
+
+    def substituir(self, dados):
+        """
+        Troca todo o conteúdo da tabela pelos registros de dados.
+        """
+        with self.conexao:
+            self.conexao.execute(f"DELETE FROM {self.tabela}")
+            self.conexao.executemany(self._sql_gravar, ([chave] + [registro.get(campo) for campo in self.campos]
+                                                        for chave, registro in dados.items()))
+            self.conexao.execute(self._sql_nova_versao, (self.tabela,))
+
+
+class ArmazenamentoSQLite:
+    """
+    Armazenamento em banco SQLite: cada coleção é uma tabela.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo JSON da coleção; define a tabela
+                       (database_users.json -> tabela "users") e a pasta do
+                       banco database_unitech.db
+
+    FUNCIONAMENTO:
+        carregar() devolve uma TabelaSQLite, que grava cada alteração no banco
+        no momento em que o repositório a faz. Por isso gravar/excluir só
+        precisam agir quando os dados não são a própria tabela.
+
+    CONCORRÊNCIA:
+        Nada da coleção fica na memória: os registros são lidos do banco a
+        cada acesso e as consultas dos repositórios (login, cadastro,
+        listagens) são feitas no banco, pelos seus índices (ver
+        TabelaSQLite.selecionar). Então o que outro processo gravou já
+        aparece na próxima consulta, sem recarregar nada. Como nos outros
+        modos:
+        - a trava entre processos (database_*.json.lock) fica com cada
+          alteração e cada lote, então a verificação de unicidade e a
+          gravação não são separadas por outro processo
+        - desatualizado() compara o contador de gravações da tabela (tabela
+          "versoes", aumentado na mesma transação de cada gravação) com o da
+          última leitura ou gravação deste objeto (ex: para quem mantém
+          dados derivados da coleção)
+        Os índices únicos do banco (matrícula, e-mail e CPF) recusam repetições
+        vindas de quem não usa a trava. Um lote é uma transação: as alterações
+        da tabela são confirmadas juntas no fim.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.origem = "sqlite"
+        self.trava = TravaArquivo(caminho + ".lock")
+        self.versao = None
+        self.caminho_banco = os.path.join(os.path.dirname(caminho), NOME_BANCO_SQLITE)
+        nome_arquivo = os.path.splitext(os.path.basename(caminho))[0]
+        self.nome_tabela = nome_arquivo.removeprefix("database_")
+        self.tabela = TabelaSQLite(conectar_sqlite(self.caminho_banco), self.nome_tabela)
+
+    def carregar(self):
+        self.versao = self.tabela.versao()
+        return self.tabela
+
+    def _anotar_gravacao(self):
+        # A própria gravação aumentou a versão em 1. Se aumentou mais, alguém
+        # gravou a tabela desde a última leitura: a versão anotada continua a
+        # antiga, para que a próxima sincronização monte os índices de novo
+        versao = self.tabela.versao()
+        if self.versao != None and versao == self.versao + 1:
+            self.versao = versao
+
+    def gravar(self, dados, chave):
+        if dados is not self.tabela:
+            self.tabela[chave] = dados[chave]
+        self._anotar_gravacao()
+
+    def excluir(self, dados, chave):
+        if dados is not self.tabela and chave in self.tabela:
+            del self.tabela[chave]
+        self._anotar_gravacao()
+
+    def salvar(self, dados):
+        if dados is not self.tabela:
+            with self.trava:
+                self.tabela.substituir(dados)
+                self.versao = self.tabela.versao()
+
+    def desatualizado(self):
+        return self.tabela.versao() != self.versao
+
+    def ler_alteracoes_novas(self):
+        # Não há log das alterações: os índices são montados de novo
+        return None
+
+    def lote(self, ao_iniciar=None):
+        return Lote(self, ao_iniciar)
+
+    def iniciar_lote(self):
+        self.trava.adquirir()
+        self.tabela.nivel_lote += 1
+
+    def concluir_lote(self):
+        self.tabela.nivel_lote -= 1
+        try:
+            if self.tabela.nivel_lote == 0:
+                self.tabela.conexao.commit()
+        finally:
+            self.trava.liberar()
+
+
+def ler_colecao_json(caminho):
+    """
+    Lê uma coleção dos seus arquivos (snapshot JSON e log do modo journal)
+    sem alterar nada na pasta: sem trava, sem cache e sem compactar o log.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo JSON da coleção
+
+    RETORNA:
+        dict: Registros {ID: registro} no estado mais recente (uma última
+              linha incompleta do log é ignorada, como em carregar)
+
+    EXCEÇÕES:
+        FileNotFoundError se não houver nem snapshot nem log
+    """
+    # O objeto só serve para reaplicar o log: criá-lo não toca em arquivos
+    journal = ArmazenamentoJournal(caminho)
+    if os.path.exists(caminho):
+        with open(caminho, "r", encoding="utf-8-sig") as arquivo_leitura:
+            dados = dict(ler_registros_json(arquivo_leitura))
+    elif os.path.exists(journal.caminho_log):
+        dados = {}
+    else:
+        raise FileNotFoundError(caminho)
+    journal._reaplicar_log(dados)
+    return dados
+
+
+class ErroMigracao(Exception):
+    """
+    Migração recusada porque os dados têm valores repetidos em campos únicos
+    do banco (bases antigas, que o modo JSON aceita: vale o primeiro usuário).
+
+    ATRIBUTOS:
+        conflitos (list): Tuplas (tabela, campo, valor, [IDs que o usam])
+    """
+
+    def __init__(self, conflitos):
+        super().__init__(f"{len(conflitos)} valores repetidos em campos únicos")
+        self.conflitos = conflitos
+
+
+def conflitos_unicidade(tabela, dados):
+    """
+    Procura valores repetidos nos campos únicos (ESQUEMA_SQLITE) da tabela.
+
+    RETORNA:
+        list: Tuplas (tabela, campo, valor, [IDs que o usam]), na ordem dos dados
+    """
+    conflitos = []
+    for campos in ESQUEMA_SQLITE[tabela]["unicos"]:
+        donos = {}
+        for chave, registro in dados.items():
+            valor = tuple(registro.get(campo) for campo in campos)
+            # Como no banco, valores vazios (NULL) não conflitam entre si
+            if None not in valor:
+                donos.setdefault(valor, []).append(chave)
+        for valor, ids in donos.items():
+            if len(ids) > 1:
+                conflitos.append((tabela, ", ".join(campos), valor[0] if len(valor) == 1 else valor, ids))
+    return conflitos
+
+
+def migrar_para_sqlite(caminhos_json, caminho_banco):
+    """
+    Copia os arquivos JSON (e logs do modo journal) para o banco SQLite.
+
+    PARÂMETROS:
+        caminhos_json (list): Caminhos dos arquivos database_*.json
+        caminho_banco (str): Caminho do arquivo .db de destino
+
+    RETORNA:
+        dict: Quantidade de registros migrados por tabela
+
+    EXCEÇÕES:
+        ErroMigracao se algum campo único (matrícula, e-mail, CPF) tiver
+        valores repetidos; nesse caso o banco não é criado nem alterado
+
+    OBSERVAÇÕES:
+        - Os arquivos JSON e os logs só são lidos (ver ler_colecao_json):
+          migre com o sistema parado, para que nenhuma alteração fique de fora
+        - A migração é feita de uma vez (substitui o conteúdo das tabelas),
+          então pode ser repetida sem duplicar registros
+    """
+    colecoes = {}
+    for caminho in caminhos_json:
+        nome_tabela = os.path.splitext(os.path.basename(caminho))[0].removeprefix("database_")
+        try:
+            colecoes[nome_tabela] = ler_colecao_json(caminho)
+        except FileNotFoundError:
+            colecoes[nome_tabela] = {}
+
+    # Os índices únicos do banco recusariam a tabela inteira no primeiro valor
+    # repetido: todos são procurados antes, para serem corrigidos de uma vez
+    conflitos = [conflito for nome_tabela, dados in colecoes.items()
+                 for conflito in conflitos_unicidade(nome_tabela, dados)]
+    if conflitos:
+        raise ErroMigracao(conflitos)
+
+    conexao = conectar_sqlite(caminho_banco)
+    try:
+        for nome_tabela, dados in colecoes.items():
+            TabelaSQLite(conexao, nome_tabela).substituir(dados)
+    finally:
+        conexao.close()
+    return {nome_tabela: len(dados) for nome_tabela, dados in colecoes.items()}
+
+
+def abrir_armazenamento(caminho, modo=None):
+    """
+    Cria o armazenamento de uma coleção conforme o modo escolhido.
+
+    PARÂMETROS:
+        caminho (str): Caminho do arquivo JSON da coleção
+        modo (str): "json", "journal" ou "sqlite" (padrão: variável
+                    UNITECH_ARMAZENAMENTO, ou "json" se não estiver definida)
+
+    RETORNA:
+        ArmazenamentoJSON | ArmazenamentoJournal | ArmazenamentoSQLite
+    """
+    if modo == None:
+        modo = os.environ.get(VARIAVEL_MODO, "json")
+    if modo == "journal":
+        return ArmazenamentoJournal(caminho)
+    elif modo == "sqlite":
+        return ArmazenamentoSQLite(caminho)
+    elif modo == "json":
+        return ArmazenamentoJSON(caminho)
+    else:
+        raise ValueError(f"Modo de armazenamento desconhecido: {modo}")
@@ -0,0 +1,112 @@
+"""
+================================================================================
+SISTEMA UNITECH - BENCHMARK DO CACHE COMPACTO DOS BANCOS
+================================================================================
+
+DESCRIÇÃO:
+Mede o tempo de carregar a coleção de usuários conforme ela cresce,
+comparando os caminhos de leitura do ArmazenamentoJSON:
+- JSON: interpretação do texto com o módulo json (primeira leitura, ou JSON
+  alterado); inclui a gravação do cache
+- Cache: leitura do cache compacto (marshal) quando o JSON não mudou
+- Cache (hash): JSON com data de modificação diferente mas mesmo conteúdo;
+  o arquivo é lido e o hash conferido, sem interpretar o JSON
+- Pickle: leitura dos mesmos dados gravados com pickle (formato usado quando
+  os registros têm objetos que o marshal não aceita)
+JSON maiores que LIMITE_LEITURA_INTEIRA (ex: 1M usuários) são lidos em partes
+e não usam o cache: para eles, a coluna JSON mede a leitura em partes e as
+colunas do cache ficam vazias.
+
+USO:
+python benchmark_cache.py [max_usuarios]
+(padrão: 1000000 usuários; tamanhos medidos: 10k, 100k, 1M)
+
+RESULTADO ESPERADO:
+A leitura pelo cache leva cerca de metade do tempo da leitura do JSON nos
+tamanhos em que é usado (o que resta é o custo de criar os objetos dos registros);
+conferir o hash custa pouco perto de interpretar o texto. Marshal e pickle
+ficam próximos.
+================================================================================
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from armazenamento import ArmazenamentoJSON, LIMITE_LEITURA_INTEIRA
+from benchmark_cadastro import gerar_usuario
+
+# Tamanhos da base de usuários a serem medidos
+TAMANHOS = (10_000, 100_000, 1_000_000)
+
+# Leituras por medição (vale o menor tempo, o menos afetado por ruído)
+REPETICOES = 3
+
+
+def medir(funcao, preparar=None):
+    """
+    Executa a função algumas vezes e retorna o menor tempo em milissegundos.
+    """
+    melhor = None
+    for _ in range(REPETICOES):
+        if preparar != None:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempo = (time.perf_counter() - inicio) * 1000
+        melhor = tempo if melhor == None else min(melhor, tempo)
+    return melhor
+
+
+def main():
+    max_usuarios = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHOS[-1]
+
+    print(f"{'usuários':>10} | {'MB':>6} | {'JSON (ms)':>10} | {'cache (ms)':>10} | "
+          f"{'c/ hash (ms)':>12} | {'pickle (ms)':>11}")
+    print("-" * 74)
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "database_users.json")
+        for tamanho in TAMANHOS:
+            if tamanho > max_usuarios:
+                break
+            dados = {f"U{numero:07d}": gerar_usuario(numero) for numero in range(tamanho)}
+            armazenamento = ArmazenamentoJSON(caminho)
+            armazenamento.salvar(dados)
+            megabytes = os.path.getsize(caminho) / 1_000_000
+
+            def apagar_cache():
+                if os.path.exists(armazenamento.caminho_cache):
+                    os.remove(armazenamento.caminho_cache)
+
+            def alterar_data():
+                # Mesmo conteúdo, outra data de modificação (ex: arquivo copiado)
+                os.utime(caminho, ns=(time.time_ns(), time.time_ns()))
+
+            tempo_json = medir(armazenamento.carregar, apagar_cache)
+            if os.path.getsize(caminho) > LIMITE_LEITURA_INTEIRA:
+                # Lido em partes, sem cache
+                coluna_cache = f"{'-':>10} | {'-':>12}"
+            else:
+                tempo_cache = medir(armazenamento.carregar)
+                assert armazenamento.origem == "cache"
+                tempo_hash = medir(armazenamento.carregar, alterar_data)
+                assert armazenamento.origem == "cache"
+                coluna_cache = f"{tempo_cache:>10.1f} | {tempo_hash:>12.1f}"
+
+            caminho_pickle = os.path.join(pasta, "dados.pickle")
+            with open(caminho_pickle, "wb") as arquivo:
+                pickle.dump(dados, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+            def ler_pickle():
+                with open(caminho_pickle, "rb") as arquivo:
+                    pickle.load(arquivo)
+
+            tempo_pickle = medir(ler_pickle)
+            print(f"{tamanho:>10} | {megabytes:>6.1f} | {tempo_json:>10.1f} | {coluna_cache} | "
+                  f"{tempo_pickle:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
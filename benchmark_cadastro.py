@@ -0,0 +1,155 @@
+"""
+================================================================================
+SISTEMA UNITECH - BENCHMARK DAS VERIFICAÇÕES DE CADASTRO
+================================================================================
+
+DESCRIÇÃO:
+Mede o custo das verificações de unicidade feitas em um cadastro (matrícula,
+CPF e e-mail) conforme o número de usuários cresce, comparando:
+- Varredura: percorre os dicionários de todos os usuários para cada campo
+  (método antigo)
+- Índice: consulta direta aos índices do RepositorioUsuarios
+e mede o cadastro completo (Sistema.cadastrar_usuario: validações, ID,
+inserção e índices), sem as gravações em disco, que não dependem das
+verificações.
+
+USO:
+python benchmark_cadastro.py [max_usuarios]
+(padrão: 1000000 usuários; tamanhos medidos: 1k, 10k, 100k, 1M)
+
+RESULTADO ESPERADO:
+O tempo com índice e o tempo do cadastro ficam praticamente constantes,
+enquanto a varredura cresce linearmente com o número de usuários.
+================================================================================
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from armazenamento import ArmazenamentoJSON, TravaArquivo
+from gerar_dados import cpf_do_numero, matricula_do_numero
+from repositorios import RepositorioUsuarios
+from servicos import Sistema
+
+# Tamanhos da base de usuários a serem medidos
+TAMANHOS = (1_000, 10_000, 100_000, 1_000_000)
+
+# Quantidade de cadastros simulados por medição
+CADASTROS_INDICE = 100_000
+CADASTROS_VARREDURA = 5
+CADASTROS_SISTEMA = 2_000
+
+# Primeiro número dos usuários cadastrados na medição (depois de todos os da
+# base: matrícula, CPF e e-mail livres)
+PRIMEIRO_NOVO = 2 * TAMANHOS[-1]
+
+
+def gerar_usuario(numero):
+    """
+    Gera um usuário sintético com matrícula, CPF e e-mail únicos.
+    """
+    return {
+        "nome": f"Aluno {numero}",
+        "cargo": "aluno",
+        "matricula": matricula_do_numero(numero),
+        "cpf": cpf_do_numero(numero),
+        "data_nascimento": "01/01/2000",
+        "email": f"aluno{numero}@unitech.edu.br",
+        "senha": "",
+        "turma": "DS1P25",
+        "aprovado": True,
+        "admin": False
+    }
+
+
+class ArmazenamentoSemGravacao(ArmazenamentoJSON):
+    """
+    Armazenamento que não grava nem relê nada: o benchmark mede só o cadastro.
+    """
+
+    def __init__(self):
+        super().__init__(os.devnull)
+        self.trava = TravaArquivo(None)
+
+    def desatualizado(self):
+        return False
+
+    def salvar(self, dados):
+        pass
+
+
+def verificar_por_varredura(dados, matricula, cpf, email):
+    # Reproduz as três passagens completas do cadastro antigo
+    for campo, valor in (("matricula", matricula), ("cpf", cpf), ("email", email)):
+        for usuario in dados:
+            if dados[usuario][campo] == valor:
+                return True
+    return False
+
+
+def verificar_por_indice(repo, matricula, cpf, email):
+    return (repo.valor_em_uso("matricula", matricula)
+            or repo.valor_em_uso("cpf", cpf)
+            or repo.valor_em_uso("email", email))
+
+
+def cadastrar(sistema, numero):
+    novo = gerar_usuario(numero)
+    sistema.cadastrar_usuario(novo["nome"], "aluno", novo["matricula"], novo["cpf"], novo["data_nascimento"],
+                              novo["email"], "12345", novo["turma"])
+
+
+def medir_cadastros(dados, pasta):
+    """
+    Tempo médio (µs) de Sistema.cadastrar_usuario sobre uma cópia dos dados.
+    """
+    sistema = Sistema(pasta)
+    sistema.usuarios = RepositorioUsuarios(dict(dados), ArmazenamentoSemGravacao())
+    inicio = time.perf_counter()
+    for numero in range(PRIMEIRO_NOVO, PRIMEIRO_NOVO + CADASTROS_SISTEMA):
+        cadastrar(sistema, numero)
+    return (time.perf_counter() - inicio) / CADASTROS_SISTEMA * 1_000_000
+
+
+def medir(funcao, repeticoes, *argumentos):
+    """
+    Executa a função várias vezes e retorna o tempo médio em microssegundos.
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao(*argumentos)
+    return (time.perf_counter() - inicio) / repeticoes * 1_000_000
+
+
+def main():
+    max_usuarios = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHOS[-1]
+
+    dados = {}
+    print(f"{'usuários':>10} | {'varredura (µs)':>15} | {'índice (µs)':>12} | {'cadastro (µs)':>14}")
+    print("-" * 61)
+    for tamanho in TAMANHOS:
+        if tamanho > max_usuarios:
+            break
+        # Completa a base até o tamanho desejado
+        for numero in range(len(dados), tamanho):
+            dados[f"U{numero:07d}"] = gerar_usuario(numero)
+        # O repositório recebe uma cópia: ele converte os registros em objetos
+        # compactos, e a varredura deve percorrer os dicionários originais
+        repo = RepositorioUsuarios(dict(dados), ArmazenamentoSemGravacao())
+
+        # Valores inexistentes: o pior caso da varredura (percorre tudo)
+        novo = gerar_usuario(PRIMEIRO_NOVO - 1)
+        argumentos = (novo["matricula"], novo["cpf"], novo["email"])
+
+        tempo_varredura = medir(verificar_por_varredura, CADASTROS_VARREDURA, dados, *argumentos)
+        tempo_indice = medir(verificar_por_indice, CADASTROS_INDICE, repo, *argumentos)
+        # Pasta temporária: só o contador de IDs é gravado nela
+        with tempfile.TemporaryDirectory() as pasta:
+            tempo_cadastro = medir_cadastros(dados, pasta)
+        print(f"{tamanho:>10} | {tempo_varredura:>15.1f} | {tempo_indice:>12.3f} | {tempo_cadastro:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+================================================================================
+SISTEMA UNITECH - BENCHMARK DOS FLUXOS PRINCIPAIS
+================================================================================
+
+DESCRIÇÃO:
+Mede os fluxos principais do sistema sobre bases sintéticas de vários
+tamanhos (gerar_dados.py), pela mesma camada de serviços usada pelo menu e
+pela API:
+- carga: carregar as quatro coleções com os índices (ms, uma vez por base)
+- login: autenticar um aluno aprovado
+- verificacoes_cadastro: verificar matrícula, CPF e e-mail de um cadastro novo
+- disciplinas_aluno / disciplinas_professor: listar as disciplinas do
+  usuário com os seus nomes (menu Disciplinas)
+- aprovacoes: lista de aprovação completa com os nomes dos usuários
+- aprovacoes_turma: lista de aprovação de uma turma
+- presenca: gerar um relatório de presença (arquivo), em lotes de
+  TURMAS_PRESENCA turmas x DATAS_PRESENCA datas
+
+USO:
+python benchmark_fluxos.py [max_usuarios] [--saida arquivo.json] [--comparar anterior.json]
+(padrão: 1000000 usuários; tamanhos medidos: 10k, 100k, 1M; resultados em
+benchmark_fluxos.json)
+
+O modo de armazenamento é o da variável UNITECH_ARMAZENAMENTO (no modo
+sqlite a base gerada é migrada para o banco antes das medições). As bases e
+os relatórios são gerados em uma pasta temporária, apagada no fim.
+
+RESULTADOS (JSON):
+    {"versao": commit do git, "python": ..., "modo": ..., "semente": ...,
+     "tamanhos": {"10000": {"geracao_s": ..., "carga_ms": ...,
+                            "fluxos": {"login": {"operacoes": 1000,
+                                                 "us_por_operacao": ...}, ...}}}}
+us_por_operacao é a mediana de RODADAS rodadas (a menos afetada por ruído).
+
+COMPARAÇÃO ENTRE VERSÕES:
+Com --comparar, cada fluxo é comparado com o mesmo fluxo e tamanho de um
+resultado anterior; os que ficarem mais de LIMITE_REGRESSAO vezes mais lentos
+são marcados como regressão e o script termina com código 1.
+================================================================================
+"""
+
+import datetime    # Data da medição
+import json        # Resultados
+import os          # Caminhos
+import platform    # Versão do Python e sistema operacional
+import random      # Escolha dos usuários medidos (com semente fixa)
+import statistics  # Mediana das rodadas
+import subprocess  # Commit do git
+import sys         # Argumentos da linha de comando
+import tempfile    # Pasta das bases geradas
+import time        # Medições
+
+import relatorios
+from armazenamento import NOME_BANCO_SQLITE, VARIAVEL_MODO, migrar_para_sqlite
+from gerar_dados import SEMENTE_PADRAO, SENHA_PADRAO, cpf_do_numero, gerar_base, matricula_do_numero
+from servicos import COLECOES, Sistema
+
+# Tamanhos da base de usuários a serem medidos
+TAMANHOS = (10_000, 100_000, 1_000_000)
+
+# Operações por rodada de cada fluxo e rodadas por medição
+OPERACOES = 1_000
+OPERACOES_LISTAGEM = 100
+RODADAS = 5
+
+# Relatórios de presença de cada rodada: LOTES_PRESENCA lotes de
+# TURMAS_PRESENCA turmas x DATAS_PRESENCA datas
+LOTES_PRESENCA = 10
+TURMAS_PRESENCA = 5
+DATAS_PRESENCA = 20
+
+# Fluxo mais lento que o anterior por mais que este fator: regressão
+LIMITE_REGRESSAO = 1.5
+
+SAIDA_PADRAO = "benchmark_fluxos.json"
+
+
+def medir(funcao, argumentos, operacoes_por_chamada=1):
+    """
+    Chama a função com cada item de "argumentos", RODADAS vezes.
+
+    PARÂMETROS:
+        funcao: Fluxo medido (recebe um item de "argumentos")
+        argumentos (list): Entradas de uma rodada
+        operacoes_por_chamada (int): Operações feitas por chamada (ex:
+                                     relatórios gerados por lote)
+
+    RETORNA:
+        dict: {"operacoes": operações por rodada, "us_por_operacao": mediana}
+    """
+    operacoes = len(argumentos) * operacoes_por_chamada
+    tempos = []
+    for _ in range(RODADAS):
+        inicio = time.perf_counter()
+        for argumento in argumentos:
+            funcao(argumento)
+        tempos.append((time.perf_counter() - inicio) / operacoes * 1_000_000)
+    return {"operacoes": operacoes, "us_por_operacao": round(statistics.median(tempos), 3)}
+
+
+def medir_base(sistema, tamanho, sorteio):
+    """
+    Mede todos os fluxos sobre a base já carregada.
+
+    RETORNA:
+        dict: {nome do fluxo: resultado de medir}
+    """
+    # Usuários e turmas medidos (a escolha não entra nas medições)
+    aprovados = {"aluno": [], "professor": []}
+    for id_usuario, usuario in sistema.usuarios.dados.items():
+        if usuario["aprovado"] == True:
+            aprovados[usuario["cargo"]].append((id_usuario, usuario["matricula"]))
+    alunos = sorteio.sample(aprovados["aluno"], min(OPERACOES, len(aprovados["aluno"])))
+    professores = sorteio.sample(aprovados["professor"], min(OPERACOES, len(aprovados["professor"])))
+    turmas = sorted(sistema.turmas.dados)
+    # Cadastros novos: números depois dos da base (matrícula, CPF e e-mail livres)
+    novos = [(matricula_do_numero(numero), cpf_do_numero(numero), f"novo{numero}@unitech.edu.br")
+             for numero in range(tamanho, tamanho + OPERACOES)]
+
+    def login(usuario):
+        sistema.autenticar(usuario[1], SENHA_PADRAO)
+
+    def verificacoes_cadastro(novo):
+        sistema.verificar_matricula(novo[0])
+        sistema.verificar_cpf(novo[1])
+        sistema.verificar_email(novo[2])
+
+    def listar_disciplinas(id_usuario):
+        return [sistema.disciplinas[id_disciplina]["nome"]
+                for id_disciplina in sistema.disciplinas_do_usuario(id_usuario)]
+
+    def listar_aprovacoes(turma):
+        return [sistema.usuarios[id_pendente]["nome"] for id_pendente in sistema.cadastros_pendentes(turma)]
+
+    def gerar_presenca(lote):
+        sistema.gerar_relatorios_presenca(professores[0][0], lote, datas)
+
+    datas = relatorios.datas_do_periodo("01/03/2025", "30/06/2025", "seg,qua")[:DATAS_PRESENCA]
+    turmas_por_lote = min(TURMAS_PRESENCA, len(turmas))
+    lotes_presenca = [sorteio.sample(turmas, turmas_por_lote) for _ in range(LOTES_PRESENCA)]
+
+    # Os relatórios vão para a pasta do sistema medido (a temporária)
+    return {
+        "login": medir(login, alunos),
+        "verificacoes_cadastro": medir(verificacoes_cadastro, novos),
+        "disciplinas_aluno": medir(listar_disciplinas, [id_usuario for id_usuario, _ in alunos[:OPERACOES_LISTAGEM]]),
+        "disciplinas_professor": medir(listar_disciplinas, [id_usuario for id_usuario, _ in professores[:OPERACOES_LISTAGEM]]),
+        "aprovacoes": medir(listar_aprovacoes, [None]),
+        "aprovacoes_turma": medir(listar_aprovacoes, sorteio.sample(turmas, min(OPERACOES_LISTAGEM, len(turmas)))),
+        "presenca": medir(gerar_presenca, lotes_presenca, turmas_por_lote * len(datas)),
+    }
+
+
+def medir_tamanho(tamanho, modo):
+    """
+    Gera a base de "tamanho" usuários e mede a carga e os fluxos.
+
+    RETORNA:
+        dict: {"geracao_s", "carga_ms", "fluxos"}
+    """
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.perf_counter()
+        gerar_base(pasta, tamanho, SEMENTE_PADRAO)
+        if modo == "sqlite":
+            migrar_para_sqlite([os.path.join(pasta, arquivo) for arquivo, _ in COLECOES.values()],
+                               os.path.join(pasta, NOME_BANCO_SQLITE))
+        geracao = time.perf_counter() - inicio
+
+        sistema = Sistema(pasta, modo)
+        inicio = time.perf_counter()
+        sistema.carregar_tudo()
+        carga = time.perf_counter() - inicio
+
+        fluxos = medir_base(sistema, tamanho, random.Random(SEMENTE_PADRAO))
+    return {"geracao_s": round(geracao, 2), "carga_ms": round(carga * 1000, 1), "fluxos": fluxos}
+
+
+def versao_do_sistema():
+    # Commit atual (com "+" se houver alterações não gravadas), ou None fora do git
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=pasta, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        alteracoes = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=pasta,
+                                    capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + "+" if alteracoes else commit
+
+
+def comparar(resultados, anteriores):
+    """
+    Mostra a razão entre os tempos atuais e os anteriores de cada fluxo.
+
+    RETORNA:
+        list: Fluxos com regressão, como "tamanho/fluxo"
+    """
+    regressoes = []
+    print(f"\nComparação com a versão {anteriores.get('versao')}:")
+    print(f"{'usuários':>10} | {'fluxo':<22} | {'antes (µs)':>12} | {'agora (µs)':>12} | {'razão':>6}")
+    print("-" * 74)
+    for tamanho, atual in resultados["tamanhos"].items():
+        anterior = anteriores.get("tamanhos", {}).get(tamanho)
+        if anterior == None:
+            continue
+        medidas = [("carga", anterior["carga_ms"] * 1000, atual["carga_ms"] * 1000)]
+        medidas += [(fluxo, anterior["fluxos"][fluxo]["us_por_operacao"], medida["us_por_operacao"])
+                    for fluxo, medida in atual["fluxos"].items() if fluxo in anterior["fluxos"]]
+        for fluxo, antes, agora in medidas:
+            razao = agora / antes if antes > 0 else 1.0
+            marca = ""
+            if razao > LIMITE_REGRESSAO:
+                marca = "  REGRESSÃO"
+                regressoes.append(f"{tamanho}/{fluxo}")
+            print(f"{tamanho:>10} | {fluxo:<22} | {antes:>12.1f} | {agora:>12.1f} | {razao:>6.2f}{marca}")
+    return regressoes
+
+
+def main():
+    argumentos = sys.argv[1:]
+    opcoes = {}
+    for opcao in ("--saida", "--comparar"):
+        if opcao in argumentos:
+            posicao = argumentos.index(opcao)
+            if posicao + 1 >= len(argumentos):
+                print("Uso: python benchmark_fluxos.py [max_usuarios] [--saida arquivo.json] [--comparar anterior.json]")
+                sys.exit(2)
+            opcoes[opcao] = argumentos[posicao + 1]
+            del argumentos[posicao:posicao + 2]
+    max_usuarios = int(argumentos[0]) if argumentos else TAMANHOS[-1]
+    modo = os.environ.get(VARIAVEL_MODO, "json")
+
+    resultados = {
+        "versao": versao_do_sistema(),
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "modo": modo,
+        "semente": SEMENTE_PADRAO,
+        "tamanhos": {},
+    }
+    # Tamanhos acima do máximo ficam de fora; um máximo menor que todos é medido sozinho
+    tamanhos = [tamanho for tamanho in TAMANHOS if tamanho <= max_usuarios] or [max_usuarios]
+    for tamanho in tamanhos:
+        medicao = medir_tamanho(tamanho, modo)
+        resultados["tamanhos"][str(tamanho)] = medicao
+        print(f"\n{tamanho} usuários (base gerada em {medicao['geracao_s']:.2f} s, "
+              f"carga em {medicao['carga_ms']:.1f} ms)")
+        for fluxo, medida in medicao["fluxos"].items():
+            print(f"  {fluxo:<22} {medida['us_por_operacao']:>12.1f} µs/operação ({medida['operacoes']} operações)")
+
+    saida = opcoes.get("--saida", SAIDA_PADRAO)
+    with open(saida, "w", encoding="utf-8") as arquivo_saida:
+        json.dump(resultados, arquivo_saida, ensure_ascii=False, indent=2)
+    print(f"\nResultados gravados em {saida}")
+
+    if "--comparar" in opcoes:
+        with open(opcoes["--comparar"], "r", encoding="utf-8") as arquivo_anterior:
+            regressoes = comparar(resultados, json.load(arquivo_anterior))
+        if regressoes:
+            print(f"\n{len(regressoes)} fluxos com regressão: {', '.join(regressoes)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
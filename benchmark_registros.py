@@ -0,0 +1,96 @@
+"""
+================================================================================
+SISTEMA UNITECH - BENCHMARK DA MEMÓRIA DOS REGISTROS
+================================================================================
+
+DESCRIÇÃO:
+Mede a memória ocupada pela coleção de usuários na memória (registros e
+índices do RepositorioUsuarios) e o tempo para montá-la a partir do JSON,
+comparando:
+- Dicionários: cada usuário como o dicionário criado por json.loads (antes
+  dos registros compactos)
+- Compactos: cada usuário como um objeto Usuario (registros.py), com
+  __slots__ e cargo/turma internados
+
+USO:
+python benchmark_registros.py [max_usuarios]
+(padrão: 1000000 usuários; tamanhos medidos: 10k, 100k, 1M)
+
+A memória é medida com tracemalloc (blocos alocados pelo Python que
+continuam em uso depois da carga) e também mostrada por 100 mil usuários.
+
+RESULTADO ESPERADO:
+Com os registros compactos a coleção (registros e índices, que são os mesmos
+nos dois casos) ocupa cerca de 25% menos memória: ~96 MB -> ~72 MB por 100
+mil usuários. Em troca, a carga fica cerca de duas vezes mais lenta: os
+registros lidos são convertidos e cada registro["campo"] dos índices passa
+por __getitem__ em Python.
+================================================================================
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmark_cadastro import gerar_usuario
+from repositorios import RepositorioUsuarios
+
+# Tamanhos da base de usuários a serem medidos
+TAMANHOS = (10_000, 100_000, 1_000_000)
+
+
+class RepositorioUsuariosDicionarios(RepositorioUsuarios):
+    """
+    RepositorioUsuarios que mantém os registros como dicionários (como antes
+    dos registros compactos).
+    """
+
+    CLASSE_REGISTRO = None
+
+
+def medir_carga(classe_repositorio, texto):
+    """
+    Monta o repositório a partir do texto JSON.
+
+    RETORNA:
+        tuple: (memória em MB que continua em uso, tempo em segundos)
+    """
+    # Tempo medido sem o tracemalloc, que deixa as alocações mais lentas
+    inicio = time.perf_counter()
+    repositorio = classe_repositorio(json.loads(texto), None)
+    tempo = time.perf_counter() - inicio
+    del repositorio
+
+    gc.collect()
+    tracemalloc.start()
+    repositorio = classe_repositorio(json.loads(texto), None)
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0] / 1_000_000
+    tracemalloc.stop()
+    del repositorio
+    return memoria, tempo
+
+
+def main():
+    max_usuarios = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHOS[-1]
+
+    print(f"{'usuários':>10} | {'dicionários (MB)':>16} | {'compactos (MB)':>14} | "
+          f"{'MB/100k antes':>13} | {'MB/100k depois':>14} | {'carga antes (s)':>15} | "
+          f"{'carga depois (s)':>16}")
+    print("-" * 117)
+    for tamanho in TAMANHOS:
+        if tamanho > max_usuarios:
+            break
+        texto = json.dumps({f"U{numero:07d}": gerar_usuario(numero) for numero in range(tamanho)})
+        memoria_antes, tempo_antes = medir_carga(RepositorioUsuariosDicionarios, texto)
+        memoria_depois, tempo_depois = medir_carga(RepositorioUsuarios, texto)
+        escala = 100_000 / tamanho
+        print(f"{tamanho:>10} | {memoria_antes:>16.1f} | {memoria_depois:>14.1f} | "
+              f"{memoria_antes * escala:>13.1f} | {memoria_depois * escala:>14.1f} | "
+              f"{tempo_antes:>15.2f} | {tempo_depois:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+================================================================================
+SISTEMA UNITECH - GERADOR DE BASES SINTÉTICAS
+================================================================================
+
+DESCRIÇÃO:
+Gera os quatro bancos de dados (database_users.json, database_turmas.json,
+database_disciplinas.json e database_atividades.json) com a quantidade de
+usuários desejada, para medir o sistema em escala (ver benchmark_fluxos.py).
+Todos os registros passam pelas validações do cadastro: CPF com dígitos
+verificadores corretos, matrículas, turmas, datas e e-mails válidos, e
+matrícula, CPF e e-mail únicos.
+
+USO:
+python gerar_dados.py pasta usuarios [semente]
+(ex: python gerar_dados.py /tmp/base_100k 100000)
+
+A pasta precisa existir e não pode ter bancos de dados (nada é
+sobrescrito). Para usar a base, execute o sistema com os arquivos dessa pasta.
+
+DETERMINISMO:
+A mesma quantidade de usuários e a mesma semente geram sempre os mesmos
+arquivos, byte a byte: as medições de versões diferentes do sistema são
+feitas sobre a mesma base.
+
+COMPOSIÇÃO DA BASE (para N usuários):
+- Usuário 0: administrador (professor com admin = true)
+- 1 a cada PROFESSOR_A_CADA usuários é professor; os demais são alunos
+- PROPORCAO_PENDENTES dos cadastros aguardam aprovação e
+  PROPORCAO_REPROVADOS foram reprovados; os demais estão aprovados
+- Uma turma para cada ALUNOS_POR_TURMA alunos, que são distribuídos entre
+  elas; os cursos e semestres das turmas se alternam
+- DISCIPLINAS_POR_PROFESSOR disciplinas por professor, distribuídas entre os
+  cursos e semestres
+- ATIVIDADES_POR_DISCIPLINA postagens por disciplina, alternando atividades
+  (tipo "A", com prazo) e conteúdos de aula (tipo "C")
+Todos os usuários têm a senha SENHA_PADRAO.
+
+IDS:
+Os IDs são os do alocador do sistema (identificadores.py), na ordem usuários,
+disciplinas e atividades, e o contador database_ids.seq é gravado na pasta:
+os cadastros feitos depois sobre a base continuam a partir dele.
+
+MEMÓRIA:
+Os usuários são gerados e gravados em partes (escrever_registros_json), sem
+montar a coleção inteira na memória.
+================================================================================
+"""
+
+import os      # Caminhos dos arquivos gerados
+import random  # Nomes, datas e situação dos cadastros (com semente fixa)
+import sys     # Argumentos da linha de comando
+import time    # Tempo de geração
+
+from armazenamento import escrever_registros_json, gravar_arquivo_atomico
+from identificadores import ARQUIVO_CONTADOR, id_do_numero
+from servicos import COLECOES, senha_encode
+
+# Semente usada quando nenhuma é informada
+SEMENTE_PADRAO = 2025
+
+# Senha de todos os usuários gerados
+SENHA_PADRAO = "12345"
+
+# Composição da base
+PROFESSOR_A_CADA = 20
+PROPORCAO_PENDENTES = 0.05
+PROPORCAO_REPROVADOS = 0.01
+ALUNOS_POR_TURMA = 40
+DISCIPLINAS_POR_PROFESSOR = 1
+ATIVIDADES_POR_DISCIPLINA = 4
+
+# Cursos: (sigla usada no código da turma, nome do curso)
+CURSOS = (
+    ("DS", "análise e desenvolvimento de sistemas"),
+    ("AD", "administração"),
+    ("SI", "sistemas de informação"),
+    ("CC", "ciência da computação"),
+    ("EP", "engenharia de produção"),
+    ("CT", "ciências contábeis"),
+    ("MK", "marketing"),
+    ("PS", "psicologia"),
+)
+SEMESTRES = 4
+
+# Letras das turmas e das matrículas (1 milhão de matrículas por letra)
+LETRAS_TURMA = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETRAS_MATRICULA = "RSTUVWXYZ"
+
+# CPF: os 9 primeiros dígitos vêm de (numero * MULTIPLICADOR_CPF +
+# DESLOCAMENTO_CPF) % 10⁹, uma bijeção (o multiplicador não tem os fatores 2
+# e 5): números diferentes sempre dão CPFs diferentes
+MULTIPLICADOR_CPF = 7_919
+DESLOCAMENTO_CPF = 123_456_789
+
+# Ano (2 dígitos) das primeiras turmas
+ANO_TURMAS = 25
+
+NOMES = ("Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela",
+         "João", "Larissa", "Lucas", "Mariana", "Nicolas", "Olívia", "Pedro", "Rafaela", "Samuel",
+         "Talita", "Vinícius")
+SOBRENOMES = ("Almeida", "Barbosa", "Carvalho", "Dias", "Ferreira", "Gomes", "Lima", "Martins",
+              "Nascimento", "Oliveira", "Pereira", "Ribeiro", "Santos", "Silva", "Souza")
+TEMAS = ("python", "banco de dados", "estatística", "marketing", "contabilidade", "gestão de projetos",
+         "redes", "engenharia de software", "cálculo", "ética")
+
+
+def cpf_do_numero(numero):
+    """
+    Gera o CPF (11 dígitos, sem pontuação) de número "numero", com os dígitos
+    verificadores calculados pelo algoritmo oficial (ver cpf_valido).
+
+    PARÂMETROS:
+        numero (int): Número entre 0 e 10⁹ - 1; números diferentes geram
+                      CPFs diferentes
+
+    RETORNA:
+        str: CPF válido
+    """
+    cpf = f"{(numero * MULTIPLICADOR_CPF + DESLOCAMENTO_CPF) % 10 ** 9:09d}"
+    for tamanho in (9, 10):
+        soma_cpf = sum(int(cpf[indice]) * (tamanho + 1 - indice) for indice in range(tamanho))
+        cpf += str(0 if soma_cpf % 11 < 2 else 11 - soma_cpf % 11)
+    return cpf
+
+
+def matricula_do_numero(numero):
+    """
+    Matrícula do usuário "numero": letra + 6 números (ex: R000042).
+    """
+    letra, digitos = divmod(numero, 1_000_000)
+    return f"{LETRAS_MATRICULA[letra]}{digitos:06d}"
+
+
+def turma_do_numero(numero):
+    """
+    Código e registro da turma "numero" (ex: "DS2A25", {"curso": ..., "semestre": 2}).
+    As turmas seguidas alternam entre cursos e semestres.
+    """
+    posicao, indice_curso = divmod(numero, len(CURSOS))
+    grupo, indice_semestre = divmod(posicao, SEMESTRES)
+    indice_letra, indice_ano = divmod(grupo, 100)
+    sigla, curso = CURSOS[indice_curso]
+    ano = (ANO_TURMAS + indice_ano) % 100
+    return (f"{sigla}{indice_semestre + 1}{LETRAS_TURMA[indice_letra]}{ano:02d}",
+            {"curso": curso, "semestre": indice_semestre + 1})
+
+
+def tamanhos_da_base(usuarios):
+    """
+    Quantidade de registros de cada coleção na base de "usuarios" usuários.
+
+    RETORNA:
+        dict: {"professores", "alunos", "turmas", "disciplinas", "atividades"}
+    """
+    professores = (usuarios + PROFESSOR_A_CADA - 1) // PROFESSOR_A_CADA
+    alunos = usuarios - professores
+    disciplinas = professores * DISCIPLINAS_POR_PROFESSOR
+    return {
+        "professores": professores,
+        "alunos": alunos,
+        "turmas": max(1, (alunos + ALUNOS_POR_TURMA - 1) // ALUNOS_POR_TURMA),
+        "disciplinas": disciplinas,
+        "atividades": disciplinas * ATIVIDADES_POR_DISCIPLINA,
+    }
+
+
+def _data(sorteio, ano_inicial, ano_final):
+    # Data dd/mm/aaaa (dias até 28: válida em todos os meses)
+    return f"{sorteio.randint(1, 28):02d}/{sorteio.randint(1, 12):02d}/{sorteio.randint(ano_inicial, ano_final)}"
+
+
+def _usuarios(usuarios, total_turmas, sorteio):
+    # Gera os usuários em ordem, como pares (ID, registro)
+    senha = senha_encode(SENHA_PADRAO)
+    codigos_turmas = {}
+    for numero in range(usuarios):
+        professor = numero % PROFESSOR_A_CADA == 0
+        matricula = matricula_do_numero(numero)
+        situacao = sorteio.random()
+        if numero == 0:
+            aprovado = True  # O administrador sempre consegue entrar
+        elif situacao < PROPORCAO_PENDENTES:
+            aprovado = None
+        elif situacao < PROPORCAO_PENDENTES + PROPORCAO_REPROVADOS:
+            aprovado = False
+        else:
+            aprovado = True
+
+        if professor:
+            turma = None
+        else:
+            # Alunos distribuídos entre as turmas (código calculado uma vez por turma)
+            indice_turma = (numero - numero // PROFESSOR_A_CADA - 1) % total_turmas
+            turma = codigos_turmas.get(indice_turma)
+            if turma == None:
+                turma = codigos_turmas[indice_turma] = turma_do_numero(indice_turma)[0]
+
+        yield id_do_numero(numero), {
+            "nome": f"{sorteio.choice(NOMES)} {sorteio.choice(SOBRENOMES)}",
+            "cargo": "professor" if professor else "aluno",
+            "matricula": matricula,
+            "cpf": cpf_do_numero(numero),
+            "data_nascimento": _data(sorteio, 1960, 1995) if professor else _data(sorteio, 1985, 2007),
+            "email": f"{matricula.lower()}@unitech.edu.br",
+            "senha": senha,
+            "turma": turma,
+            "aprovado": aprovado,
+            "admin": numero == 0
+        }
+
+
+class _RegistrosGerados:
+    # Coleção gerada sob demanda: escrever_registros_json só precisa de items()
+    def __init__(self, pares):
+        self.pares = pares
+
+    def items(self):
+        return self.pares
+
+
+def _gravar(pasta, nome_colecao, dados):
+    arquivo = COLECOES[nome_colecao][0]
+    gravar_arquivo_atomico(os.path.join(pasta, arquivo), escrever_registros_json(dados))
+
+
+def gerar_base(pasta, usuarios, semente=SEMENTE_PADRAO):
+    """
+    Gera os quatro bancos de dados na pasta.
+
+    PARÂMETROS:
+        pasta (str): Pasta de destino (já existente)
+        usuarios (int): Quantidade de usuários (pelo menos 1)
+        semente (int): Semente dos sorteios; a mesma semente gera a mesma base
+
+    RETORNA:
+        dict: Quantidade de registros de cada coleção (ver tamanhos_da_base)
+    """
+    if usuarios < 1:
+        raise ValueError("A base precisa de pelo menos 1 usuário.")
+    tamanhos = tamanhos_da_base(usuarios)
+    sorteio = random.Random(semente)
+
+    _gravar(pasta, "usuarios", _RegistrosGerados(_usuarios(usuarios, tamanhos["turmas"], sorteio)))
+    _gravar(pasta, "turmas", dict(turma_do_numero(numero) for numero in range(tamanhos["turmas"])))
+
+    # Disciplinas: IDs depois dos usuários; os professores são os usuários
+    # 0, PROFESSOR_A_CADA, 2 * PROFESSOR_A_CADA, ...
+    proximo_numero = usuarios
+    disciplinas = {}
+    for numero in range(tamanhos["disciplinas"]):
+        indice_curso, indice_semestre = divmod(numero % (len(CURSOS) * SEMESTRES), SEMESTRES)
+        professor = numero // DISCIPLINAS_POR_PROFESSOR * PROFESSOR_A_CADA
+        disciplinas[id_do_numero(proximo_numero)] = {
+            "nome": f"{sorteio.choice(TEMAS)} {numero + 1}",
+            "curso": CURSOS[indice_curso][1],
+            "semestre": indice_semestre + 1,
+            "professor": id_do_numero(professor)
+        }
+        proximo_numero += 1
+    _gravar(pasta, "disciplinas", disciplinas)
+
+    atividades = {}
+    for id_disciplina, disciplina in disciplinas.items():
+        for numero in range(ATIVIDADES_POR_DISCIPLINA):
+            atividade = numero % 2 == 0
+            atividades[id_do_numero(proximo_numero)] = {
+                "titulo": f"{'Atividade' if atividade else 'Aula'} {numero // 2 + 1}",
+                "conteudo": f"Conteúdo {numero + 1} de {disciplina["nome"]}",
+                "prazo": _data(sorteio, 2025, 2026) if atividade else None,
+                "tipo": "A" if atividade else "C",
+                "disciplina": id_disciplina
+            }
+            proximo_numero += 1
+    del disciplinas
+    _gravar(pasta, "atividades", atividades)
+
+    # Contador dos IDs: novos cadastros continuam depois dos gerados
+    gravar_arquivo_atomico(os.path.join(pasta, ARQUIVO_CONTADOR), f"{proximo_numero}\n".encode("utf-8"))
+    return tamanhos
+
+
+def main():
+    if len(sys.argv) not in (3, 4):
+        print("Uso: python gerar_dados.py pasta usuarios [semente]")
+        sys.exit(2)
+    pasta = sys.argv[1]
+    usuarios = int(sys.argv[2])
+    semente = int(sys.argv[3]) if len(sys.argv) > 3 else SEMENTE_PADRAO
+
+    existentes = [arquivo for arquivo, _ in COLECOES.values() if os.path.exists(os.path.join(pasta, arquivo))]
+    if existentes:
+        print(f"A pasta já tem bancos de dados ({', '.join(existentes)}); escolha uma pasta vazia.")
+        sys.exit(1)
+
+    inicio = time.perf_counter()
+    tamanhos = gerar_base(pasta, usuarios, semente)
+    print(f"{usuarios} usuários ({tamanhos['alunos']} alunos, {tamanhos['professores']} professores), "
+          f"{tamanhos['turmas']} turmas, {tamanhos['disciplinas']} disciplinas e "
+          f"{tamanhos['atividades']} atividades gerados em {time.perf_counter() - inicio:.2f} s")
+    print(f"Senha de todos os usuários: {SENHA_PADRAO} (administrador: {matricula_do_numero(0)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+================================================================================
+SISTEMA UNITECH - ALOCAÇÃO DE IDS
+================================================================================
+
+DESCRIÇÃO:
+Gera os IDs de usuários, disciplinas e atividades no formato de sempre (3
+letras maiúsculas + 4 números, ex: ABC1234) sem sorteios repetidos e sem
+colisões, mesmo com vários processos cadastrando ao mesmo tempo.
+
+FUNCIONAMENTO:
+1. Um contador compartilhado (database_ids.seq, na pasta dos bancos) guarda
+   o próximo número livre. Cada processo reserva um bloco de números de uma
+   vez, com a trava entre processos do arquivo (ver armazenamento.py), e
+   depois entrega os IDs do bloco sem tocar no disco.
+2. O tamanho do bloco dobra a cada reserva do mesmo processo (até
+   BLOCO_MAXIMO): quem cadastra pouco reserva pouco e uma importação em lote
+   não fica reservando a todo momento. Números reservados e não usados (ex:
+   o processo terminou) apenas ficam sem uso.
+3. Cada número vira um ID por uma permutação fixa do espaço de IDs
+   (26³ x 10⁴ = 175.760.000), então números diferentes sempre dão IDs
+   diferentes, mas IDs consecutivos não ficam parecidos.
+4. IDs sorteados antes deste alocador continuam nos bancos: se um número cair
+   em um ID que já existe na coleção, ele é pulado.
+5. Dentro do processo, uma trava (threading.Lock) protege o bloco: o mesmo
+   alocador pode ser usado por várias threads (API, servidor de sessões).
+6. Um contador ilegível interrompe o cadastro com um erro, em vez de voltar
+   a 0 e repetir IDs já entregues a outros processos.
+================================================================================
+"""
+
+import os         # Caminho do contador
+import string     # Letras dos IDs
+import threading  # Trava do bloco entre as threads do processo
+
+from armazenamento import TravaArquivo, gravar_arquivo_atomico
+
+# Arquivo do contador compartilhado (na pasta dos bancos de dados)
+ARQUIVO_CONTADOR = "database_ids.seq"
+
+# Espaço de IDs: 3 letras (26³) x 4 números (10⁴)
+TOTAL_IDS = 26 ** 3 * 10 ** 4
+
+# Permutação numero -> (numero * MULTIPLICADOR + DESLOCAMENTO) % TOTAL_IDS.
+# TOTAL_IDS = 2⁷ x 5⁴ x 13³; um multiplicador sem os fatores 2, 5 e 13 torna a
+# conta uma bijeção (cada número gera um ID diferente)
+MULTIPLICADOR = 104_729
+DESLOCAMENTO = 12_345_678
+
+# Tamanho do primeiro bloco reservado por um processo e limite do crescimento
+BLOCO_INICIAL = 16
+BLOCO_MAXIMO = 4096
+
+
+def id_do_numero(numero):
+    """
+    Converte um número do contador no ID correspondente (ex: ABC1234).
+
+    PARÂMETROS:
+        numero (int): Número entre 0 e TOTAL_IDS - 1
+
+    RETORNA:
+        str: ID com 3 letras maiúsculas e 4 números
+    """
+    posicao = (numero * MULTIPLICADOR + DESLOCAMENTO) % TOTAL_IDS
+    letras, digitos = divmod(posicao, 10_000)
+    letra1, resto = divmod(letras, 26 * 26)
+    letra2, letra3 = divmod(resto, 26)
+    maiusculas = string.ascii_uppercase
+    return f"{maiusculas[letra1]}{maiusculas[letra2]}{maiusculas[letra3]}{digitos:04d}"
+
+
+class AlocadorIds:
+    """
+    Entrega IDs únicos entre coleções e entre processos.
+
+    PARÂMETROS:
+        pasta (str): Pasta dos bancos de dados (onde fica o contador)
+
+    USO:
+        alocador = AlocadorIds(pasta)
+        id_usuario = alocador.novo_id(repositorio_usuarios)
+    """
+
+    def __init__(self, pasta):
+        self.caminho = os.path.join(pasta, ARQUIVO_CONTADOR)
+        self.trava = TravaArquivo(self.caminho + ".lock")
+        # Trava entre as threads do processo (a do arquivo é entre processos)
+        self.trava_bloco = threading.Lock()
+        # Bloco reservado: próximo número a entregar e fim (exclusivo)
+        self.proximo = 0
+        self.fim = 0
+        self.tamanho_bloco = BLOCO_INICIAL
+
+    def _reservar_bloco(self):
+        # Lê o contador e o avança pelo tamanho do bloco, com a trava entre
+        # processos: dois processos nunca recebem o mesmo intervalo
+        with self.trava:
+            try:
+                with open(self.caminho, "r", encoding='utf-8') as arquivo_contador:
+                    conteudo = arquivo_contador.read()
+            except FileNotFoundError:
+                conteudo = "0"
+            try:
+                inicio = int(conteudo)
+            except ValueError:
+                inicio = -1
+            if inicio < 0:
+                raise RuntimeError(f"Contador de IDs ilegível: {self.caminho}. Corrija o arquivo "
+                                   "com o próximo número livre antes de cadastrar.")
+            if inicio + self.tamanho_bloco > TOTAL_IDS:
+                raise RuntimeError("Todos os IDs disponíveis já foram usados.")
+            gravar_arquivo_atomico(self.caminho, f"{inicio + self.tamanho_bloco}\n".encode("utf-8"))
+        self.proximo = inicio
+        self.fim = inicio + self.tamanho_bloco
+        self.tamanho_bloco = min(self.tamanho_bloco * 2, BLOCO_MAXIMO)
+
+    def novo_id(self, existentes=()):
+        """
+        Entrega o próximo ID livre.
+
+        PARÂMETROS:
+            existentes: Coleção (ou repositório) onde o ID será usado; IDs
+                        antigos que já estejam nela são pulados
+
+        RETORNA:
+            str: ID no formato ABC1234
+        """
+        with self.trava_bloco:
+            while True:
+                if self.proximo == self.fim:
+                    self._reservar_bloco()
+                novo = id_do_numero(self.proximo)
+                self.proximo += 1
+                if novo not in existentes:
+                    return novo
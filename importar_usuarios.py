@@ -0,0 +1,67 @@
+"""
+================================================================================
+SISTEMA UNITECH - IMPORTAÇÃO DE USUÁRIOS EM LOTE (CSV)
+================================================================================
+
+DESCRIÇÃO:
+Cadastra de uma só vez os usuários de um arquivo CSV (ex: os alunos
+matriculados no semestre), com as mesmas validações do cadastro pelo menu:
+matrícula, CPF (dígitos verificadores), data de nascimento, turma e e-mail,
+além de matrícula, CPF e e-mail únicos (inclusive entre as linhas do próprio
+arquivo). As linhas válidas são gravadas em database_users.json em uma única
+escrita; as inválidas são listadas com o número da linha e o motivo.
+
+USO:
+python importar_usuarios.py arquivo.csv [--aprovar]
+
+--aprovar: cadastra os usuários já aprovados (sem passar pela lista de
+aprovação do administrador)
+
+FORMATO DO CSV (primeira linha = cabeçalho, separador "," ou ";"):
+    nome,cargo,matricula,cpf,data_nascimento,email,senha,turma
+    Bia Carvalho,aluno,R758493,15303317811,19/05/2005,bia@gmail.com,12345,DS2P13
+    Helena Borges,professor,R839201,529.982.247-25,02/03/1980,helena@unitech.com,abc,
+
+O arquivo é lido linha a linha (não é carregado inteiro na memória) e o custo
+por linha é constante, então o tempo cresce linearmente com o tamanho do CSV.
+================================================================================
+"""
+
+import csv
+import sys
+import time
+
+from servicos import Sistema, COLUNAS_IMPORTACAO
+
+
+def main():
+    argumentos = [argumento for argumento in sys.argv[1:] if not argumento.startswith("--")]
+    if len(argumentos) != 1:
+        print("Uso: python importar_usuarios.py arquivo.csv [--aprovar]")
+        sys.exit(2)
+    aprovar = "--aprovar" in sys.argv[1:]
+
+    inicio = time.perf_counter()
+    # utf-8-sig: aceita também o CSV salvo pelo Excel (com BOM)
+    with open(argumentos[0], "r", encoding="utf-8-sig", newline="") as arquivo_csv:
+        cabecalho = arquivo_csv.readline()
+        separador = ";" if cabecalho.count(";") > cabecalho.count(",") else ","
+        colunas = [coluna.strip().lower() for coluna in next(csv.reader([cabecalho], delimiter=separador))]
+        faltando = [coluna for coluna in COLUNAS_IMPORTACAO if coluna not in colunas]
+        if faltando:
+            print(f"Colunas ausentes no cabeçalho: {', '.join(faltando)}")
+            sys.exit(2)
+
+        leitor = csv.DictReader(arquivo_csv, fieldnames=colunas, delimiter=separador)
+        importados, erros = Sistema().importar_usuarios(leitor, aprovar=aprovar)
+
+    for numero, mensagem in erros:
+        print(f"Linha {numero}: {mensagem}")
+    situacao = "aprovados" if aprovar else "aguardando aprovação"
+    print(f"{importados} usuários importados ({situacao}), {len(erros)} linhas com erro "
+          f"em {time.perf_counter() - inicio:.2f} s")
+    sys.exit(1 if erros else 0)
+
+
+if __name__ == "__main__":
+    main()
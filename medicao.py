@@ -0,0 +1,79 @@
+"""
+================================================================================
+SISTEMA UNITECH - PONTOS DE MEDIÇÃO DAS OPERAÇÕES
+================================================================================
+
+DESCRIÇÃO:
+Marcações usadas pelos módulos do sistema para indicar as operações medidas
+por metricas.py (ver lá o que é medido e os formatos do arquivo):
+
+    @medido("login")                # Função ou método inteiro
+    def autenticar(...): ...
+
+    with medir("executavel_c"):     # Trecho de uma função
+        subprocess.run(...)
+
+INÍCIO RÁPIDO:
+Este módulo é importado por todo o sistema e por isso é mínimo. O
+metricas.py (com threading e os formatos do arquivo) só é importado quando as
+métricas são ligadas: pela variável UNITECH_METRICAS, na importação deste
+módulo, ou por metricas.ativar(). Desligadas, medir() devolve sempre o mesmo
+contexto vazio e uma função com @medido só confere uma variável antes de ser
+chamada.
+================================================================================
+"""
+
+import functools  # Decorador @medido
+import os         # Variável de ambiente
+
+VARIAVEL_METRICAS = "UNITECH_METRICAS"
+
+# Coletor ativo (None = métricas desligadas); definido por metricas.ativar
+coletor = None
+
+
+class _MedicaoDesligada:
+    # Contexto vazio usado com as métricas desligadas (sempre o mesmo objeto)
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento):
+        return None
+
+
+_DESLIGADA = _MedicaoDesligada()
+
+
+def medir(nome):
+    """
+    Contexto que mede o trecho dentro do with como uma chamada da operação.
+
+    PARÂMETROS:
+        nome (str): Nome da operação (ex: "gravar_json")
+    """
+    if coletor == None:
+        return _DESLIGADA
+    return coletor.medicao(nome)
+
+
+def medido(nome):
+    """
+    Decorador que mede cada chamada da função como uma chamada da operação.
+    """
+    def decorar(funcao):
+        @functools.wraps(funcao)
+        def funcao_medida(*argumentos, **opcoes):
+            if coletor == None:
+                return funcao(*argumentos, **opcoes)
+            with coletor.medicao(nome):
+                return funcao(*argumentos, **opcoes)
+        return funcao_medida
+    return decorar
+
+
+# Liga as métricas se o arquivo de saída estiver definido
+if os.environ.get(VARIAVEL_METRICAS):
+    import metricas
+    metricas.ativar(os.environ[VARIAVEL_METRICAS])
@@ -0,0 +1,282 @@
+"""
+================================================================================
+SISTEMA UNITECH - MÉTRICAS DAS OPERAÇÕES
+================================================================================
+
+DESCRIÇÃO:
+Conta as operações do sistema e mede o tempo de cada uma: carga e gravação
+dos bancos, log-in, cadastro, listagens, aprovações, relatórios de presença,
+entregas de atividades, execução dos programas em C e requisições da API.
+Para cada operação são guardados o número de chamadas, de erros (exceções),
+o tempo total, o maior tempo e um histograma dos tempos.
+
+USO:
+Defina a variável de ambiente UNITECH_METRICAS com o arquivo de saída:
+    UNITECH_METRICAS=metricas.prom python api_http.py
+O formato vem da extensão do arquivo:
+- .json: JSON (ver formatar_json)
+- .prom: formato de texto do Prometheus (histograma unitech_operacao_segundos
+  e contador unitech_operacao_erros_total, com o rótulo "operacao")
+- qualquer outra: tabela em texto (chamadas, erros, média, p50, p95, máximo)
+O arquivo é gravado ao fim do processo e, enquanto ele estiver rodando, a
+cada INTERVALO_EXPORTACAO segundos (servidores). Cada processo grava o seu
+próprio arquivo: use um arquivo diferente para cada processo.
+
+INSTRUMENTAÇÃO:
+As operações são marcadas com @medido e medir(), de medicao.py.
+
+DESLIGADO (PADRÃO):
+Sem UNITECH_METRICAS nada é medido e este módulo nem é importado (medicao.py
+o importa só quando as métricas são ligadas): o início do sistema não paga
+por ele. Uma operação marcada custa alguns décimos de microssegundo a mais.
+================================================================================
+"""
+
+import atexit     # Gravação do arquivo ao fim do processo
+import bisect     # Faixa do histograma de cada tempo
+import os         # Extensão do arquivo
+import threading  # Trava (servidores medem operações de várias threads)
+import time       # Medição dos tempos
+
+# Limites superiores das faixas do histograma, em segundos (a última faixa,
+# acima de 10 s, é a +Inf do Prometheus)
+FAIXAS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# Intervalo mínimo entre duas gravações do arquivo durante a execução
+INTERVALO_EXPORTACAO = 10.0
+
+
+class Operacao:
+    """
+    Medidas acumuladas de uma operação.
+
+    ATRIBUTOS:
+        chamadas (int), erros (int): Totais de chamadas e das que terminaram
+                                     com exceção
+        soma (float), maximo (float): Tempo total e maior tempo, em segundos
+        faixas (list): Chamadas em cada faixa de FAIXAS (não acumuladas),
+                       mais a faixa acima da última
+    """
+
+    __slots__ = ("chamadas", "erros", "soma", "maximo", "faixas")
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+        self.faixas = [0] * (len(FAIXAS) + 1)
+
+    def percentil(self, fracao):
+        """
+        Estimativa do percentil (ex: 0.95): o limite superior da faixa do
+        histograma onde ele cai (na última faixa, o maior tempo).
+        """
+        alvo = fracao * self.chamadas
+        acumulado = 0
+        for limite, quantidade in zip(FAIXAS, self.faixas):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return min(limite, self.maximo)
+        return self.maximo
+
+
+class Coletor:
+    """
+    Guarda as medidas de todas as operações e grava o arquivo de métricas.
+
+    PARÂMETROS:
+        caminho (str): Arquivo de saída (None = só na memória, ex: testes e
+                       benchmarks que leem as medidas direto)
+    """
+
+    def __init__(self, caminho=None):
+        self.caminho = caminho
+        self.operacoes = {}
+        self.trava = threading.Lock()
+        self.inicio = time.time()
+        self.ultima_exportacao = time.perf_counter()
+
+    def medicao(self, nome):
+        """
+        Contexto que mede uma chamada da operação (usado por medicao.py).
+        """
+        return _Medicao(self, nome)
+
+    def registrar(self, nome, segundos, erro=False):
+        with self.trava:
+            operacao = self.operacoes.get(nome)
+            if operacao == None:
+                operacao = self.operacoes[nome] = Operacao()
+            operacao.chamadas += 1
+            operacao.soma += segundos
+            if segundos > operacao.maximo:
+                operacao.maximo = segundos
+            if erro:
+                operacao.erros += 1
+            # Faixa do tempo: a primeira cujo limite não é menor que ele
+            operacao.faixas[bisect.bisect_left(FAIXAS, segundos)] += 1
+            exportar_agora = (self.caminho != None
+                              and time.perf_counter() - self.ultima_exportacao >= INTERVALO_EXPORTACAO)
+            if exportar_agora:
+                self.ultima_exportacao = time.perf_counter()
+        if exportar_agora:
+            self.exportar()
+
+    def copia(self):
+        """
+        Cópia das medidas, para formatar sem segurar a trava.
+
+        RETORNA:
+            dict: {nome da operação: Operacao}
+        """
+        with self.trava:
+            copias = {}
+            for nome, operacao in self.operacoes.items():
+                copia = Operacao()
+                copia.chamadas, copia.erros = operacao.chamadas, operacao.erros
+                copia.soma, copia.maximo = operacao.soma, operacao.maximo
+                copia.faixas = list(operacao.faixas)
+                copias[nome] = copia
+            return copias
+
+    def exportar(self, caminho=None):
+        """
+        Grava as métricas no arquivo (de forma atômica), no formato da extensão.
+
+        RETORNA:
+            str: Caminho gravado (None se não houver arquivo)
+        """
+        from armazenamento import gravar_arquivo_atomico
+
+        caminho = caminho or self.caminho
+        if caminho == None:
+            return None
+        extensao = os.path.splitext(caminho)[1].lower()
+        formatar = {".json": formatar_json, ".prom": formatar_prometheus}.get(extensao, formatar_texto)
+        try:
+            gravar_arquivo_atomico(caminho, formatar(self.copia(), self.inicio).encode("utf-8"))
+        except OSError:
+            # As métricas nunca interrompem o sistema
+            return None
+        return caminho
+
+
+class _Medicao:
+    # Contexto de uma medição (with medir(nome))
+    __slots__ = ("coletor", "nome", "inicio")
+
+    def __init__(self, coletor, nome):
+        self.coletor = coletor
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento):
+        self.coletor.registrar(self.nome, time.perf_counter() - self.inicio, tipo != None)
+
+
+def ativar(caminho=None):
+    """
+    Liga as métricas (sem UNITECH_METRICAS, ex: em testes e benchmarks).
+
+    PARÂMETROS:
+        caminho (str): Arquivo gravado ao fim do processo (opcional)
+
+    RETORNA:
+        Coletor: Coletor das medidas
+    """
+    import medicao  # Aqui, e não no topo: medicao.py importa este módulo ao iniciar
+
+    coletor = medicao.coletor = Coletor(caminho)
+    if caminho != None:
+        atexit.register(coletor.exportar)
+    return coletor
+
+
+def desativar():
+    """
+    Desliga as métricas (o coletor anterior ainda grava o arquivo no fim).
+    """
+    import medicao
+
+    medicao.coletor = None
+
+
+def coletor_ativo():
+    """
+    RETORNA:
+        Coletor: Coletor das medidas, ou None se as métricas estiverem desligadas
+    """
+    import medicao
+
+    return medicao.coletor
+
+
+# ================================================================================
+# FORMATOS DO ARQUIVO
+# ================================================================================
+
+def formatar_texto(operacoes, inicio):
+    """
+    Tabela com uma linha por operação (tempos em milissegundos).
+    """
+    linhas = [f"Métricas do sistema UniTech desde {time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(inicio))}",
+              "",
+              f"{'operação':<28} {'chamadas':>9} {'erros':>6} {'média (ms)':>11} {'p50 (ms)':>9} "
+              f"{'p95 (ms)':>9} {'máximo (ms)':>12} {'total (s)':>10}"]
+    for nome in sorted(operacoes):
+        operacao = operacoes[nome]
+        linhas.append(f"{nome:<28} {operacao.chamadas:>9} {operacao.erros:>6} "
+                      f"{operacao.soma / operacao.chamadas * 1000:>11.3f} {operacao.percentil(0.5) * 1000:>9.3f} "
+                      f"{operacao.percentil(0.95) * 1000:>9.3f} {operacao.maximo * 1000:>12.3f} "
+                      f"{operacao.soma:>10.3f}")
+    return "\n".join(linhas) + "\n"
+
+
+def formatar_json(operacoes, inicio):
+    """
+    JSON no formato:
+        {"inicio": ..., "faixas_s": [...], "operacoes": {"login": {"chamadas": ...,
+         "erros": ..., "soma_s": ..., "maximo_s": ..., "faixas": [...]}}}
+    "faixas" tem as chamadas de cada faixa de "faixas_s" (não acumuladas),
+    mais as acima da última.
+    """
+    import json
+    return json.dumps({
+        "inicio": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(inicio)),
+        "faixas_s": list(FAIXAS),
+        "operacoes": {nome: {"chamadas": operacao.chamadas, "erros": operacao.erros,
+                             "soma_s": operacao.soma, "maximo_s": operacao.maximo,
+                             "faixas": operacao.faixas}
+                      for nome, operacao in sorted(operacoes.items())},
+    }, ensure_ascii=False, indent=2) + "\n"
+
+
+def formatar_prometheus(operacoes, inicio):
+    """
+    Formato de texto do Prometheus (ex: para o textfile collector do
+    node_exporter).
+    """
+    linhas = ["# HELP unitech_operacao_segundos Duração das operações do sistema UniTech.",
+              "# TYPE unitech_operacao_segundos histogram"]
+    for nome in sorted(operacoes):
+        operacao = operacoes[nome]
+        acumulado = 0
+        for limite, quantidade in zip(FAIXAS, operacao.faixas):
+            acumulado += quantidade
+            linhas.append(f'unitech_operacao_segundos_bucket{{operacao="{nome}",le="{limite}"}} {acumulado}')
+        linhas.append(f'unitech_operacao_segundos_bucket{{operacao="{nome}",le="+Inf"}} {operacao.chamadas}')
+        linhas.append(f'unitech_operacao_segundos_sum{{operacao="{nome}"}} {operacao.soma}')
+        linhas.append(f'unitech_operacao_segundos_count{{operacao="{nome}"}} {operacao.chamadas}')
+    linhas += ["# HELP unitech_operacao_erros_total Operações do sistema UniTech que terminaram com erro.",
+               "# TYPE unitech_operacao_erros_total counter"]
+    linhas += [f'unitech_operacao_erros_total{{operacao="{nome}"}} {operacoes[nome].erros}'
+               for nome in sorted(operacoes)]
+    linhas += ["# HELP unitech_inicio_segundos Início da coleta (epoch).",
+               "# TYPE unitech_inicio_segundos gauge",
+               f"unitech_inicio_segundos {inicio}"]
+    return "\n".join(linhas) + "\n"
+
@@ -0,0 +1,57 @@
+"""
+================================================================================
+SISTEMA UNITECH - MIGRAÇÃO DOS ARQUIVOS JSON PARA O SQLITE
+================================================================================
+
+DESCRIÇÃO:
+Copia de uma só vez os bancos JSON das coleções do sistema (servicos.COLECOES:
+database_users.json, database_disciplinas.json, database_atividades.json e
+database_turmas.json), incluindo alterações pendentes em logs do modo journal,
+para as tabelas do banco database_unitech.db.
+
+USO:
+python migrar_sqlite.py [pasta]
+(padrão: a pasta deste script)
+
+Depois da migração, execute o sistema com UNITECH_ARMAZENAMENTO=sqlite.
+Os arquivos JSON e os logs só são lidos (migre com o sistema parado) e a
+migração pode ser repetida (as tabelas são substituídas, sem duplicar
+registros). Se a base tiver matrículas, e-mails ou CPFs repetidos, nada é
+migrado: os registros em conflito são listados para serem corrigidos antes.
+================================================================================
+"""
+
+import os   # Caminhos dos arquivos
+import sys  # Argumentos e código de saída
+
+from armazenamento import NOME_BANCO_SQLITE, ErroMigracao, migrar_para_sqlite
+from servicos import COLECOES
+
+# Pasta padrão dos bancos de dados (a mesma deste script)
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else PASTA
+    if not os.path.isdir(pasta):
+        print(f"Pasta não encontrada: {pasta}")
+        sys.exit(1)
+    caminho_banco = os.path.join(pasta, NOME_BANCO_SQLITE)
+    caminhos_json = [os.path.join(pasta, arquivo) for arquivo, _ in COLECOES.values()]
+
+    print("Migrando bancos JSON para o SQLite...")
+    try:
+        migrados = migrar_para_sqlite(caminhos_json, caminho_banco)
+    except ErroMigracao as erro:
+        print("Migração cancelada: valores repetidos em campos únicos.")
+        for tabela, campo, valor, ids in erro.conflitos:
+            print(f"Tabela {tabela}, {campo} = {valor}: registros {', '.join(ids)}")
+        print("Corrija os registros acima nos arquivos JSON e execute a migração novamente.")
+        sys.exit(1)
+    for tabela, quantidade in migrados.items():
+        print(f"Tabela {tabela}: {quantidade} registros")
+    print(f"Migração concluída! Banco: {caminho_banco}")
+
+
+if __name__ == "__main__":
+    main()
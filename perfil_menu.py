@@ -0,0 +1,258 @@
+"""
+================================================================================
+SISTEMA UNITECH - PERFIL DAS AÇÕES DO MENU
+================================================================================
+
+DESCRIÇÃO:
+Modo opcional do menu (pim_python.py) que mede o tempo (cProfile) e a
+memória (tracemalloc) de cada ação, para descobrir qual parte de um fluxo
+está lenta (ex: "Administrar disciplinas", opção 3, que lista os
+professores).
+
+USO:
+    python pim_python.py --perfil
+    UNITECH_PERFIL=tempo python pim_python.py
+Valores de UNITECH_PERFIL:
+- "tempo": só cProfile
+- "memoria": só tracemalloc
+- "tudo" (ou qualquer outro valor, e --perfil): os dois
+UNITECH_PERFIL_TOP define quantas linhas o resumo mostra (padrão: 10).
+
+O QUE É UMA AÇÃO:
+O menu pergunta (input), o usuário responde e o sistema trabalha até a
+próxima pergunta. Cada um desses trechos é uma ação, medida sozinha: o tempo
+em que o menu espera o usuário digitar fica de fora. A ação recebe o número
+de ordem, o texto da pergunta respondida e, se for uma opção curta (ex: "3",
+"<", "S"), a resposta: ex: 014_o_que_voce_gostaria_de_alterar_3. Respostas
+mais longas e as respostas a perguntas sobre dados pessoais (senha, CPF,
+matrícula, e-mail, data de nascimento), mesmo curtas, nunca entram no nome.
+
+ARQUIVOS GERADOS (perfis/<AAAA-MM-DD_HHMMSS>/, um diretório por sessão):
+- <ação>.pstats: perfil do cProfile (python -m pstats <arquivo>, snakeviz...)
+- <ação>.tracemalloc: memória alocada ao fim da ação
+  (tracemalloc.Snapshot.load(<arquivo>))
+- resumo.txt: o mesmo resumo mostrado ao fim da sessão
+
+RESUMO (ao sair do menu, na saída de erros):
+As ações mais lentas, com o tempo e a memória alocada por cada uma, seguidas
+das funções mais demoradas e das linhas que mais alocaram memória na ação
+mais lenta.
+
+CUSTO:
+Com o perfil ligado tudo fica mais lento (o tracemalloc, várias vezes mais),
+então compare as ações entre si, e não com os tempos do uso normal.
+Desligado, o menu não importa este módulo.
+================================================================================
+"""
+
+import builtins    # input original
+import cProfile    # Perfil de tempo
+import datetime    # Nome do diretório da sessão
+import io          # Texto do resumo do pstats
+import os          # Caminhos e variáveis de ambiente
+import pstats      # Resumo dos perfis de tempo
+import re          # Nomes das ações
+import sys         # Saída de erros
+import time        # Tempo de cada ação
+import tracemalloc  # Perfil de memória
+import unicodedata  # Nomes das ações sem acentos
+
+VARIAVEL_PERFIL = "UNITECH_PERFIL"
+VARIAVEL_TOP = "UNITECH_PERFIL_TOP"
+
+# Pasta onde ficam os diretórios das sessões (a mesma deste módulo)
+PASTA_PERFIS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfis")
+
+TOP_PADRAO = 10
+
+# Respostas com até este tamanho entram no nome da ação (opções do menu)
+TAMANHO_MAXIMO_OPCAO = 2
+# Tamanho máximo do texto da pergunta no nome da ação
+TAMANHO_MAXIMO_NOME = 40
+# Perguntas (sem acentos) cujas respostas nunca entram no nome da ação
+PERGUNTAS_SIGILOSAS = ("senha", "cpf", "matricula", "e-mail", "nascimento")
+
+
+def modo_perfil(argumentos):
+    """
+    Modo de perfil pedido na linha de comando ou em UNITECH_PERFIL.
+
+    PARÂMETROS:
+        argumentos (list): Argumentos da linha de comando (sys.argv[1:])
+
+    RETORNA:
+        str: "tempo", "memoria" ou "tudo" (None = perfil desligado)
+    """
+    if "--perfil" in argumentos:
+        return "tudo"
+    valor = os.environ.get(VARIAVEL_PERFIL, "").strip().lower()
+    if valor == "":
+        return None
+    return valor if valor in ("tempo", "memoria") else "tudo"
+
+
+def _nome_acao(numero, pergunta, resposta):
+    # Ex: (14, "O que você gostaria de alterar? ", "3") -> 014_o_que_voce_gostaria_de_alterar_3
+    texto = unicodedata.normalize("NFKD", pergunta).encode("ascii", "ignore").decode("ascii").lower()
+    partes = [f"{numero:03d}", re.sub(r"[^a-z0-9]+", "_", texto).strip("_")[:TAMANHO_MAXIMO_NOME].strip("_")]
+    resposta = resposta.strip()
+    if 0 < len(resposta) <= TAMANHO_MAXIMO_OPCAO and not any(palavra in texto for palavra in PERGUNTAS_SIGILOSAS):
+        partes.append(re.sub(r"[^A-Za-z0-9]", lambda caractere: f"x{ord(caractere.group()):02x}", resposta))
+    return "_".join(parte for parte in partes if parte)
+
+
+class Acao:
+    """
+    Medidas de uma ação já encerrada.
+
+    ATRIBUTOS:
+        nome (str): Nome da ação (também o nome dos seus arquivos)
+        segundos (float): Tempo da ação
+        memoria (int): Bytes alocados na ação e ainda em uso no fim (pode ser
+                       negativo, se a ação liberou memória)
+        pico (int): Maior quantidade de bytes em uso durante a ação, acima do
+                    que já estava em uso no início
+        arquivo_perfil (str): Arquivo .pstats da ação (None sem o cProfile)
+        comparacao (list): Linhas que mais alocaram memória na ação
+                           (tracemalloc.StatisticDiff; None sem o tracemalloc)
+    """
+
+    __slots__ = ("nome", "segundos", "memoria", "pico", "arquivo_perfil", "comparacao")
+
+    def __init__(self, nome, segundos, memoria, pico, arquivo_perfil, comparacao):
+        self.nome = nome
+        self.segundos = segundos
+        self.memoria = memoria
+        self.pico = pico
+        self.arquivo_perfil = arquivo_perfil
+        self.comparacao = comparacao
+
+
+class PerfilMenu:
+    """
+    Mede cada ação do menu (ver O QUE É UMA AÇÃO).
+
+    PARÂMETROS:
+        modo (str): "tempo", "memoria" ou "tudo"
+        pasta (str): Pasta onde é criado o diretório da sessão
+        top (int): Linhas de cada parte do resumo
+
+    USO:
+        perfil = PerfilMenu("tudo")
+        input = perfil.input   # o menu passa a chamar perfil.input
+        ...
+        perfil.encerrar()      # grava a última ação e mostra o resumo
+    """
+
+    def __init__(self, modo="tudo", pasta=PASTA_PERFIS, top=None):
+        self.tempo = modo in ("tempo", "tudo")
+        self.memoria = modo in ("memoria", "tudo")
+        self.top = top if top != None else int(os.environ.get(VARIAVEL_TOP, TOP_PADRAO))
+        self.pasta = os.path.join(pasta, datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S"))
+        os.makedirs(self.pasta, exist_ok=True)
+        self.acoes = []
+        self.encerrado = False
+        self.snapshot_anterior = None
+        # O tracemalloc só é parado no fim se tiver sido ligado aqui
+        self.ligou_tracemalloc = self.memoria and not tracemalloc.is_tracing()
+        if self.ligou_tracemalloc:
+            tracemalloc.start()
+        if self.memoria:
+            self.snapshot_anterior = tracemalloc.take_snapshot()
+        self._iniciar_acao(_nome_acao(0, "inicio", ""))
+
+    def _iniciar_acao(self, nome):
+        self.nome_acao = nome
+        self.memoria_inicio = 0
+        if self.memoria:
+            tracemalloc.reset_peak()
+            self.memoria_inicio = tracemalloc.get_traced_memory()[0]
+        self.perfil = None
+        if self.tempo:
+            self.perfil = cProfile.Profile()
+            self.perfil.enable()
+        self.inicio_acao = time.perf_counter()
+
+    def _encerrar_acao(self):
+        segundos = time.perf_counter() - self.inicio_acao
+        if self.perfil != None:
+            self.perfil.disable()
+        caminho = os.path.join(self.pasta, self.nome_acao)
+
+        memoria = pico = 0
+        comparacao = None
+        if self.memoria:
+            atual, maximo = tracemalloc.get_traced_memory()
+            memoria, pico = atual - self.memoria_inicio, maximo - self.memoria_inicio
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, arquivo) for arquivo in (tracemalloc.__file__, cProfile.__file__, __file__)])
+            snapshot.dump(caminho + ".tracemalloc")
+            if self.snapshot_anterior != None:
+                comparacao = snapshot.compare_to(self.snapshot_anterior, "lineno")[:self.top]
+            self.snapshot_anterior = snapshot
+        arquivo_perfil = None
+        if self.perfil != None:
+            arquivo_perfil = caminho + ".pstats"
+            self.perfil.dump_stats(arquivo_perfil)
+            self.perfil = None
+
+        self.acoes.append(Acao(self.nome_acao, segundos, memoria, pico, arquivo_perfil, comparacao))
+
+    def input(self, pergunta=""):
+        """
+        Substituto de input() para o menu: encerra a ação atual antes de
+        esperar a resposta e começa a próxima depois dela.
+        """
+        self._encerrar_acao()
+        resposta = ""
+        try:
+            resposta = builtins.input(pergunta)
+            return resposta
+        finally:
+            # Mesmo sem resposta (ex: fim da entrada), o que vier depois é medido
+            self._iniciar_acao(_nome_acao(len(self.acoes), pergunta, resposta))
+
+    def encerrar(self):
+        """
+        Encerra a última ação, grava resumo.txt e mostra o resumo na saída de
+        erros. Chamadas seguintes não fazem nada.
+        """
+        if self.encerrado:
+            return
+        self.encerrado = True
+        self._encerrar_acao()
+        if self.ligou_tracemalloc:
+            tracemalloc.stop()
+        resumo = self.resumo()
+        with open(os.path.join(self.pasta, "resumo.txt"), "w", encoding="utf-8") as arquivo_resumo:
+            arquivo_resumo.write(resumo)
+        print(resumo, file=sys.stderr)
+
+    def resumo(self):
+        """
+        Texto do resumo da sessão (ver RESUMO).
+        """
+        linhas = [f"Perfil das ações do menu: {len(self.acoes)} ações em {self.pasta}", "",
+                  "Ações mais lentas:",
+                  f"{'tempo (ms)':>11} {'alocado (KB)':>13} {'pico (KB)':>10}  ação"]
+        lentas = sorted(self.acoes, key=lambda acao: acao.segundos, reverse=True)[:self.top]
+        for acao in lentas:
+            if self.memoria:
+                memoria = f"{acao.memoria / 1024:>13.1f} {acao.pico / 1024:>10.1f}"
+            else:
+                memoria = f"{'-':>13} {'-':>10}"  # Sem o tracemalloc
+            linhas.append(f"{acao.segundos * 1000:>11.1f} {memoria}  {acao.nome}")
+        if not lentas:
+            return "\n".join(linhas) + "\n"
+
+        mais_lenta = lentas[0]
+        if mais_lenta.arquivo_perfil != None:
+            texto = io.StringIO()
+            estatisticas = pstats.Stats(mais_lenta.arquivo_perfil, stream=texto)
+            estatisticas.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            linhas += ["", f"Funções mais demoradas em {mais_lenta.nome} (tempo acumulado):",
+                       texto.getvalue().strip("\n")]
+        if mais_lenta.comparacao != None:
+            linhas += ["", f"Linhas que mais alocaram memória em {mais_lenta.nome}:"]
+            linhas += [f"  {diferenca}" for diferenca in mais_lenta.comparacao]
+        return "\n".join(linhas) + "\n"
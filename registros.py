@@ -0,0 +1,244 @@
+"""
+================================================================================
+SISTEMA UNITECH - REGISTROS COMPACTOS
+================================================================================
+
+DESCRIÇÃO:
+Classes dos registros das coleções mantidas na memória (modos "json" e
+"journal"): Usuario, Disciplina, Atividade e Turma. Cada registro lido do
+arquivo deixa de ser um dicionário e passa a ser um objeto com __slots__,
+que guarda só os valores (os nomes dos campos ficam na classe).
+
+USO:
+Os registros continuam sendo usados como dicionários (usuario["nome"],
+usuario.get("turma"), registro.update(...), dict(registro), {**registro}),
+então o restante do sistema não muda. São criados pelos repositórios (ver
+CLASSE_REGISTRO em repositorios.py) e gravados no arquivo JSON com o mesmo
+formato de antes.
+
+ECONOMIA DE MEMÓRIA:
+1. Um dicionário guarda a sua própria tabela de chaves e valores; o objeto
+   com __slots__ guarda apenas um ponteiro por campo (ex: usuário com 10
+   campos: 272 bytes como dicionário, 120 como Usuario)
+2. Campos com poucos valores diferentes (cargo, turma, curso, tipo e os IDs
+   de disciplina e professor) são internados (sys.intern): todos os
+   registros com o mesmo valor apontam para um único texto, em vez de cada
+   leitura do JSON criar uma cópia
+3. Campos fora da lista da classe (ex: bases de versões futuras) ficam em um
+   dicionário à parte, criado só para os registros que os tiverem
+
+MEDIÇÃO (100 mil usuários com os índices do repositório, ver
+benchmark_registros.py):
+    dicionários (json.loads):   ~96 MB
+    registros compactos:        ~72 MB
+O custo é a conversão na carga e o acesso aos campos (registro["campo"]
+passa por __getitem__ em Python): montar a coleção leva cerca de duas vezes
+mais tempo.
+================================================================================
+"""
+
+import sys  # Internação de textos repetidos (sys.intern)
+from collections.abc import MutableMapping  # Interface de dicionário
+
+
+def _internar(valor):
+    # Internação dos campos com poucos valores diferentes (None e outros
+    # tipos ficam como estão)
+    return sys.intern(valor) if type(valor) is str else valor
+
+
+class Registro(MutableMapping):
+    """
+    Base dos registros compactos: campos em __slots__ com interface de
+    dicionário.
+
+    Subclasses definem:
+        CAMPOS: nomes dos campos, na ordem em que são gravados no JSON
+        CAMPOS_INTERNADOS: campos cujos textos são internados
+        __slots__ = CAMPOS
+        __init__ com um parâmetro por campo e _campos_em_dict com um
+        dicionário literal dos campos (as formas mais rápidas de criar e de
+        converter o registro, usadas por de_dict e para_dict)
+
+    Um campo que não estava no registro lido fica vazio no objeto e continua
+    ausente para quem o consulta (KeyError, get devolve o padrão) e no JSON.
+    """
+
+    __slots__ = ("_extras",)
+
+    CAMPOS = ()
+    CAMPOS_INTERNADOS = ()
+    _CONJUNTO_CAMPOS = frozenset()
+
+    def __init_subclass__(cls, **argumentos):
+        super().__init_subclass__(**argumentos)
+        # Consulta "campo in ..." mais rápida que na tupla (usada a cada
+        # registro["campo"])
+        cls._CONJUNTO_CAMPOS = frozenset(cls.CAMPOS)
+
+    @classmethod
+    def de_dict(cls, dados):
+        """
+        Cria o registro a partir de um dicionário (ex: lido do JSON).
+
+        PARÂMETROS:
+            dados (dict): Campos do registro
+
+        RETORNA:
+            Registro: Objeto da classe com os mesmos campos
+        """
+        try:
+            # Caminho comum: exatamente os campos da classe
+            return cls(**dados)
+        except TypeError:
+            registro = cls.__new__(cls)
+            registro._extras = None
+            for campo, valor in dados.items():
+                registro[campo] = valor
+            return registro
+
+    def para_dict(self):
+        """
+        Converte o registro em dicionário (ex: para gravar no JSON).
+        """
+        try:
+            dados = self._campos_em_dict()
+        except AttributeError:
+            # Algum campo ausente: só os presentes
+            dados = {campo: getattr(self, campo) for campo in self.CAMPOS if hasattr(self, campo)}
+        if self._extras:
+            dados.update(self._extras)
+        return dados
+
+    def __getitem__(self, campo):
+        if campo in self._CONJUNTO_CAMPOS:
+            try:
+                return getattr(self, campo)
+            except AttributeError:
+                raise KeyError(campo) from None
+        if self._extras:
+            return self._extras[campo]
+        raise KeyError(campo)
+
+    def __setitem__(self, campo, valor):
+        if campo in self._CONJUNTO_CAMPOS:
+            if campo in self.CAMPOS_INTERNADOS:
+                valor = _internar(valor)
+            setattr(self, campo, valor)
+        else:
+            if self._extras == None:
+                self._extras = {}
+            self._extras[campo] = valor
+
+    def __delitem__(self, campo):
+        if campo in self._CONJUNTO_CAMPOS:
+            try:
+                delattr(self, campo)
+            except AttributeError:
+                raise KeyError(campo) from None
+        elif self._extras:
+            del self._extras[campo]
+        else:
+            raise KeyError(campo)
+
+    def __iter__(self):
+        for campo in self.CAMPOS:
+            if hasattr(self, campo):
+                yield campo
+        if self._extras:
+            yield from self._extras
+
+    def __len__(self):
+        return sum(1 for campo in self.CAMPOS if hasattr(self, campo)) + len(self._extras or ())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.para_dict()!r})"
+
+
+class Usuario(Registro):
+    """
+    Usuário (database_users.json).
+    """
+
+    CAMPOS = ("nome", "cargo", "matricula", "cpf", "data_nascimento", "email", "senha",
+              "turma", "aprovado", "admin")
+    CAMPOS_INTERNADOS = ("cargo", "turma")
+    __slots__ = CAMPOS
+
+    def __init__(self, nome, cargo, matricula, cpf, data_nascimento, email, senha, turma, aprovado, admin):
+        self.nome = nome
+        self.cargo = _internar(cargo)
+        self.matricula = matricula
+        self.cpf = cpf
+        self.data_nascimento = data_nascimento
+        self.email = email
+        self.senha = senha
+        self.turma = _internar(turma)
+        self.aprovado = aprovado
+        self.admin = admin
+        self._extras = None
+
+    def _campos_em_dict(self):
+        return {"nome": self.nome, "cargo": self.cargo, "matricula": self.matricula, "cpf": self.cpf,
+                "data_nascimento": self.data_nascimento, "email": self.email, "senha": self.senha,
+                "turma": self.turma, "aprovado": self.aprovado, "admin": self.admin}
+
+
+class Disciplina(Registro):
+    """
+    Disciplina (database_disciplinas.json).
+    """
+
+    CAMPOS = ("nome", "curso", "semestre", "professor")
+    CAMPOS_INTERNADOS = ("curso", "professor")
+    __slots__ = CAMPOS
+
+    def __init__(self, nome, curso, semestre, professor):
+        self.nome = nome
+        self.curso = _internar(curso)
+        self.semestre = semestre
+        self.professor = _internar(professor)
+        self._extras = None
+
+    def _campos_em_dict(self):
+        return {"nome": self.nome, "curso": self.curso, "semestre": self.semestre, "professor": self.professor}
+
+
+class Atividade(Registro):
+    """
+    Atividade ou conteúdo de aula (database_atividades.json).
+    """
+
+    CAMPOS = ("titulo", "conteudo", "prazo", "tipo", "disciplina")
+    CAMPOS_INTERNADOS = ("tipo", "disciplina")
+    __slots__ = CAMPOS
+
+    def __init__(self, titulo, conteudo, prazo, tipo, disciplina):
+        self.titulo = titulo
+        self.conteudo = conteudo
+        self.prazo = prazo
+        self.tipo = _internar(tipo)
+        self.disciplina = _internar(disciplina)
+        self._extras = None
+
+    def _campos_em_dict(self):
+        return {"titulo": self.titulo, "conteudo": self.conteudo, "prazo": self.prazo, "tipo": self.tipo,
+                "disciplina": self.disciplina}
+
+
+class Turma(Registro):
+    """
+    Turma (database_turmas.json).
+    """
+
+    CAMPOS = ("curso", "semestre")
+    CAMPOS_INTERNADOS = ("curso",)
+    __slots__ = CAMPOS
+
+    def __init__(self, curso, semestre):
+        self.curso = _internar(curso)
+        self.semestre = semestre
+        self._extras = None
+
+    def _campos_em_dict(self):
+        return {"curso": self.curso, "semestre": self.semestre}
@@ -0,0 +1,253 @@
+"""
+================================================================================
+SISTEMA UNITECH - GERAÇÃO DE RELATÓRIOS E ENTREGAS DE ATIVIDADES
+================================================================================
+
+DESCRIÇÃO:
+Versão em Python dos programas em C relatorio_presenca.c e atividade_aluno.c.
+Os arquivos gerados têm exatamente o mesmo conteúdo (byte a byte) dos
+programas em C, mas são escritos pelo próprio processo do sistema, sem abrir
+um novo processo por relatório e sem o limite de tamanho da linha de comando.
+
+GERAÇÃO EM LOTE:
+gerar_relatorios_lote() gera de uma vez os relatórios de várias turmas em
+várias datas (ex: todas as aulas do semestre), com a lista de alunos de cada
+turma montada uma única vez e os arquivos escritos em paralelo (threads).
+
+ARQUIVOS GERADOS (na pasta de dados do sistema, Sistema.pasta):
+- relatorios_presenca/<turma>_<data>.txt   (relatório de presença)
+- atividades_alunos/<id_atividade>_<matricula>.txt   (entrega de atividade)
+As pastas são criadas se ainda não existirem.
+
+PROGRAMAS EM C (OPCIONAL):
+Com a variável de ambiente UNITECH_EXECUTAVEIS_C=1, os arquivos voltam a ser
+gerados pelos executáveis em output/ (relatorio_presenca.exe e
+atividade_aluno.exe), recebendo os dados pela linha de comando como antes.
+================================================================================
+"""
+
+import datetime    # Datas dos relatórios em lote (períodos e dias de aula)
+import os          # Caminhos e variáveis de ambiente
+import time        # Data e hora da entrega (mesmo formato do ctime em C)
+
+from medicao import medir  # Tempo dos programas em C (UNITECH_METRICAS)
+
+# subprocess (programas em C) e concurrent.futures (escrita em lote) são
+# importados apenas nas funções que os usam: juntos custam mais que todo o
+# resto do início do sistema e a maioria das sessões não precisa deles
+
+# Pasta do sistema (onde ficam os executáveis)
+PASTA_SISTEMA = os.path.dirname(os.path.abspath(__file__))
+
+# Pastas de saída, dentro da pasta de dados (os programas em C usam os
+# mesmos nomes, relativos à pasta em que rodam)
+NOME_PASTA_RELATORIOS = "relatorios_presenca"
+NOME_PASTA_ATIVIDADES = "atividades_alunos"
+
+# Executáveis em C usados apenas com UNITECH_EXECUTAVEIS_C=1
+EXECUTAVEL_RELATORIO = os.path.join(PASTA_SISTEMA, "output", "relatorio_presenca.exe")
+EXECUTAVEL_ATIVIDADE = os.path.join(PASTA_SISTEMA, "output", "atividade_aluno.exe")
+VARIAVEL_EXECUTAVEIS = "UNITECH_EXECUTAVEIS_C"
+
+# Linha separadora usada nos dois arquivos
+SEPARADOR = "======================\n"
+
+# Abreviações dos dias da semana aceitas no calendário de aulas (segunda = 0)
+DIAS_SEMANA = {"seg": 0, "ter": 1, "qua": 2, "qui": 3, "sex": 4, "sab": 5, "sáb": 5, "dom": 6}
+
+
+def usar_executaveis_c():
+    """
+    Indica se os arquivos devem ser gerados pelos programas em C.
+
+    RETORNA:
+        bool: True se UNITECH_EXECUTAVEIS_C estiver definida como 1
+    """
+    return os.environ.get(VARIAVEL_EXECUTAVEIS) == "1"
+
+
+# ================================================================================
+# RELATÓRIO DE PRESENÇA
+# ================================================================================
+
+def formatar_relatorio_presenca(data, alunos, info_turma, professor):
+    """
+    Monta o texto do relatório de presença (mesmo formato de relatorio_presenca.c).
+
+    PARÂMETROS:
+        data (str): Data da aula (dd/mm/aaaa)
+        alunos (list): Linhas "Nome - Matrícula", já em ordem
+        info_turma (str): "Turma X, curso Y, Zº semestre"
+        professor (str): Nome do professor
+
+    RETORNA:
+        str: Conteúdo do arquivo
+    """
+    linhas = ["Relatório de Presença\n", SEPARADOR,
+              f"Professor {professor}\n", f"{info_turma}\n",
+              f"Data: {data}\n", SEPARADOR]
+    linhas.extend(f"{aluno}      [  ]  Presente? \n" for aluno in alunos)
+    return "".join(linhas)
+
+
+def escrever_relatorio_presenca(pasta, data, alunos, info_turma, professor, nome_arquivo):
+    """
+    Gera o arquivo <pasta>/relatorios_presenca/<nome_arquivo>.txt (a pasta
+    relatorios_presenca já deve existir).
+
+    PARÂMETROS:
+        pasta (str): Pasta de dados do sistema
+        data, alunos, info_turma, professor: ver formatar_relatorio_presenca
+        nome_arquivo (str): Nome do arquivo sem extensão (ex: DS2P13_25102025)
+
+    RETORNA:
+        str: Caminho do arquivo gerado
+
+    FUNCIONAMENTO:
+        Por padrão o arquivo é escrito diretamente em Python. Com
+        UNITECH_EXECUTAVEIS_C=1 é chamado relatorio_presenca.exe com os mesmos
+        argumentos de antes: data, alunos, turma, professor e nome do arquivo,
+        rodando na pasta de dados.
+    """
+    caminho = os.path.join(pasta, NOME_PASTA_RELATORIOS, f"{nome_arquivo}.txt")
+    if usar_executaveis_c():
+        import subprocess
+        with medir("executavel_c_relatorio"):
+            subprocess.run([EXECUTAVEL_RELATORIO, data] + list(alunos) + [info_turma, professor, nome_arquivo],
+                           cwd=pasta, check=True)
+        return caminho
+
+    with open(caminho, "w", encoding='utf-8') as arquivo_relatorio:
+        arquivo_relatorio.write(formatar_relatorio_presenca(data, alunos, info_turma, professor))
+    return caminho
+
+
+def datas_do_periodo(inicio, fim, dias_aula=""):
+    """
+    Lista as datas de aula de um período.
+
+    PARÂMETROS:
+        inicio (str): Primeira data (dd/mm/aaaa)
+        fim (str): Última data (dd/mm/aaaa), inclusive
+        dias_aula (str): Dias da semana com aula, separados por vírgula
+                         (ex: "seg,qua"); vazio = todos os dias
+
+    RETORNA:
+        list: Datas no formato dd/mm/aaaa, em ordem
+
+    EXCEÇÕES:
+        ValueError se alguma data ou dia da semana for inválido
+    """
+    data_inicio = datetime.datetime.strptime(inicio, "%d/%m/%Y").date()
+    data_fim = datetime.datetime.strptime(fim, "%d/%m/%Y").date()
+    if dias_aula.strip() == "":
+        dias_semana = set(range(7))
+    else:
+        try:
+            dias_semana = {DIAS_SEMANA[dia.strip().lower()] for dia in dias_aula.split(",")}
+        except KeyError:
+            raise ValueError(f"Dia da semana inválido: {dias_aula}")
+
+    datas = []
+    data = data_inicio
+    while data <= data_fim:
+        if data.weekday() in dias_semana:
+            datas.append(data.strftime("%d/%m/%Y"))
+        data += datetime.timedelta(days=1)
+    return datas
+
+
+def gerar_relatorios_lote(pasta, turmas, datas, professor, max_threads=None):
+    """
+    Gera os relatórios de presença de várias turmas em várias datas.
+
+    PARÂMETROS:
+        pasta (str): Pasta de dados do sistema (os arquivos vão para
+                     <pasta>/relatorios_presenca)
+        turmas (dict): {CODIGO_TURMA: (info_turma, alunos)}, com a lista de
+                       alunos de cada turma já montada e ordenada
+        datas (list): Datas das aulas (dd/mm/aaaa)
+        professor (str): Nome do professor
+        max_threads (int): Máximo de threads de escrita (padrão do Python)
+
+    RETORNA:
+        list: Caminhos dos arquivos gerados
+
+    FUNCIONAMENTO:
+        Cada par (turma, data) vira um arquivo <turma>_<data>.txt. Como a
+        lista de alunos já vem pronta, o custo é só o de escrever os
+        arquivos, feito em paralelo por um conjunto de threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    os.makedirs(os.path.join(pasta, NOME_PASTA_RELATORIOS), exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        tarefas = [executor.submit(escrever_relatorio_presenca, pasta, data, alunos, info_turma, professor,
+                                   f"{codigo_turma}_{data.replace('/', '')}")
+                   for codigo_turma, (info_turma, alunos) in turmas.items()
+                   for data in datas]
+        return [tarefa.result() for tarefa in tarefas]
+
+
+# ================================================================================
+# ENTREGA DE ATIVIDADE
+# ================================================================================
+
+def formatar_atividade_aluno(titulo, conteudo, nome, matricula, resposta, disciplina, momento=None):
+    """
+    Monta o texto da entrega de atividade (mesmo formato de atividade_aluno.c).
+
+    PARÂMETROS:
+        titulo (str): Título da atividade
+        conteudo (str): Enunciado da atividade
+        nome (str): Nome do aluno
+        matricula (str): Matrícula do aluno
+        resposta (str): Resposta do aluno
+        disciplina (str): Nome da disciplina
+        momento (float): Horário da entrega (padrão: agora)
+
+    RETORNA:
+        str: Conteúdo do arquivo
+
+    OBSERVAÇÃO:
+        A data segue o formato do ctime() em C ("Sun Oct 19 14:03:00 2025"),
+        que termina com uma quebra de linha; por isso há uma linha em branco
+        depois dela.
+    """
+    if momento == None:
+        momento = time.time()
+    return "".join([f"Disciplina: {disciplina}\n", f"Atividade: {titulo}\n", SEPARADOR,
+                    f"Nome: {nome}\n", f"Matrícula: {matricula}\n",
+                    f"Data de Entrega: {time.ctime(momento)}\n\n", SEPARADOR,
+                    f"{conteudo}\n\n", f"Resposta: {resposta}\n"])
+
+
+def escrever_atividade_aluno(pasta, id_atividade, titulo, conteudo, nome, matricula, resposta, disciplina):
+    """
+    Gera o arquivo <pasta>/atividades_alunos/<id_atividade>_<matricula>.txt.
+
+    PARÂMETROS:
+        pasta (str): Pasta de dados do sistema
+        id_atividade (str): ID da atividade
+        demais: ver formatar_atividade_aluno
+
+    RETORNA:
+        str: Caminho do arquivo gerado
+
+    FUNCIONAMENTO:
+        Por padrão o arquivo é escrito diretamente em Python. Com
+        UNITECH_EXECUTAVEIS_C=1 é chamado atividade_aluno.exe com os argumentos
+        na mesma ordem de antes, rodando na pasta de dados.
+    """
+    caminho = os.path.join(pasta, NOME_PASTA_ATIVIDADES, f"{id_atividade}_{matricula}.txt")
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    if usar_executaveis_c():
+        import subprocess
+        with medir("executavel_c_atividade"):
+            subprocess.run([EXECUTAVEL_ATIVIDADE, id_atividade, titulo, conteudo, nome, matricula, resposta,
+                            disciplina], cwd=pasta, check=True)
+        return caminho
+
+    with open(caminho, "w", encoding='utf-8') as arquivo_atividade:
+        arquivo_atividade.write(formatar_atividade_aluno(titulo, conteudo, nome, matricula, resposta, disciplina))
+    return caminho
@@ -0,0 +1,739 @@
+"""
+================================================================================
+SISTEMA UNITECH - REPOSITÓRIOS DE DADOS
+================================================================================
+
+DESCRIÇÃO:
+Camada de acesso aos dados do Sistema UniTech. Os repositórios envolvem os
+dicionários carregados dos arquivos JSON e mantêm índices secundários em
+memória, para que as buscas mais frequentes (login, verificação de cadastro)
+sejam feitas diretamente pela chave, sem percorrer todos os registros.
+
+REPOSITÓRIOS:
+- Repositorio: base genérica
+- RepositorioUsuarios: usuários (database_users.json), indexados por
+  matrícula, e-mail e CPF, com a lista de alunos de cada turma e a fila de
+  cadastros aguardando aprovação
+- RepositorioDisciplinas: disciplinas (database_disciplinas.json), indexadas
+  por curso e semestre e por professor
+- RepositorioTurmas: turmas (database_turmas.json), indexadas por curso
+- RepositorioAtividades: atividades (database_atividades.json), indexadas por
+  disciplina na ordem de postagem, com paginação
+
+PERSISTÊNCIA:
+Cada alteração é repassada ao armazenamento da coleção (ver armazenamento.py)
+informando apenas o registro alterado. Conforme o modo escolhido, o
+armazenamento regrava o JSON inteiro, apenas acrescenta a alteração ao log ou
+grava a linha correspondente no banco SQLite.
+
+Cada alteração é feita com a trava do armazenamento (entre processos). Se
+outro processo tiver gravado a coleção desde a última leitura, os dados e os
+índices são recarregados antes, e a alteração é aplicada (e verificada) sobre
+o estado mais recente. Várias alterações seguidas podem ser agrupadas em uma
+única gravação com "with repositorio.lote():".
+
+Fora das alterações, sincronizar() mantém a coleção em dia com o que outros
+processos gravaram: se o arquivo não mudou, custa apenas um os.stat; se
+mudou, recarrega a coleção e monta os índices de novo ou, quando o
+armazenamento consegue informar só as alterações novas (modo journal),
+aplica apenas essas, atualizando os índices registro a registro.
+
+MODO SQLITE:
+Com os dados em uma TabelaSQLite (ver armazenamento.py), nenhum registro
+fica na memória: os repositórios não montam os índices acima, e cada
+consulta (buscar, valor_em_uso, disciplinas_do_*, atividades_da_disciplina,
+alunos_da_turma, ...) vira uma consulta SQL que usa os índices do banco.
+Como a consulta já lê o estado atual do banco, o que outro processo gravou
+aparece sem recarregar a coleção.
+
+RESTRIÇÕES DE UNICIDADE:
+Matrícula, e-mail e CPF não podem se repetir entre usuários. Os próprios
+índices (tabelas hash) garantem a regra: a verificação é uma consulta direta
+ao índice, feita no cadastro e em toda alteração, que é recusada com
+ErroUnicidade se o valor já pertencer a outro usuário.
+
+REGISTROS COMPACTOS:
+Com as coleções na memória (modos "json" e "journal"), cada registro é
+guardado como um objeto da classe da coleção (ver registros.py), que ocupa
+menos memória que um dicionário e continua sendo usado como um. Os
+registros recebidos como dicionário (lidos do arquivo, do log de outro
+processo ou passados para inserir) são convertidos pelo repositório.
+
+REGRA IMPORTANTE:
+Toda alteração (inserção, atualização ou exclusão) deve passar pelos métodos
+do repositório. Alterar o dicionário diretamente deixa os índices
+desatualizados e a alteração não é salva.
+================================================================================
+"""
+
+import bisect     # Inserção ordenada nas listas de alunos das turmas
+import itertools  # Fatias de índices ordenados (paginação)
+
+from medicao import medido  # Tempo das listagens (UNITECH_METRICAS)
+from registros import Usuario, Disciplina, Atividade, Turma
+
+# Quantidade padrão de itens por página nas listagens paginadas
+TAMANHO_PAGINA = 20
+
+
+class ErroUnicidade(Exception):
+    """
+    Erro lançado quando uma alteração repetiria um valor que deve ser único.
+
+    ATRIBUTOS:
+        campo (str): Campo da restrição violada (ex: "email")
+        valor (str): Valor já em uso
+        id_existente (str): ID do registro que já possui o valor
+    """
+
+    def __init__(self, campo, valor, id_existente):
+        super().__init__(f"{campo} '{valor}' já pertence ao registro {id_existente}")
+        self.campo = campo
+        self.valor = valor
+        self.id_existente = id_existente
+
+
+def _retirar(indice, chave, id_registro):
+    # Retira um ID do grupo da chave no índice e apaga o grupo se ficar vazio
+    grupo = indice.get(chave)
+    if grupo != None:
+        grupo.pop(id_registro, None)
+        if len(grupo) == 0:
+            del indice[chave]
+
+
+def _entra_na_lista_da_turma(usuario):
+    # Apenas alunos aprovados entram na lista de presença da turma
+    return usuario["cargo"] == "aluno" and usuario["aprovado"] == True and usuario["turma"] != None
+
+
+def _linha_lista_presenca(usuario):
+    # Linha do aluno no relatório de presença (também é a chave da ordenação)
+    return f"{usuario['nome']} - {usuario['matricula']}"
+
+
+class Repositorio:
+    """
+    Repositório genérico de uma coleção {ID: registro}.
+
+    PARÂMETROS:
+        dados (dict): Dicionário {ID: registro} carregado do armazenamento
+                      (no modo SQLite, uma TabelaSQLite com a mesma interface)
+        armazenamento: Objeto de armazenamento da coleção (armazenamento.py)
+
+    FUNCIONAMENTO:
+        1. Na criação, monta os índices da coleção (se houver)
+        2. inserir/atualizar/remover alteram o dicionário, mantêm os índices
+           em dia e avisam o armazenamento qual registro mudou
+        3. Subclasses definem seus índices sobrescrevendo _limpar_indices,
+           _indexar, _desindexar e _verificar, e listam em CAMPOS_INDEXADOS
+           os campos usados nos índices
+        4. Subclasses indicam em CLASSE_REGISTRO a classe dos registros
+           compactos (registros.py); com os dados em um dicionário, os
+           registros são convertidos para ela ao entrar no repositório
+        5. Uma atualização que não mexe em CAMPOS_INDEXADOS não reindexa o
+           registro (ex: trocar a senha de um usuário, o título de uma
+           atividade), preservando também a sua posição nos índices
+        6. No modo SQLite (no_banco = True) não há índices na memória: as
+           subclasses consultam o banco (ver MODO SQLITE)
+    """
+
+    # Campos usados pelos índices da coleção (a base não possui índices)
+    CAMPOS_INDEXADOS = ()
+
+    # Classe dos registros compactos da coleção (None: mantém os dicionários)
+    CLASSE_REGISTRO = None
+
+    def __init__(self, dados, armazenamento):
+        self.dados = dados
+        self.armazenamento = armazenamento
+        # No modo SQLite os registros não ficam na memória: cada leitura
+        # devolve um dicionário novo, não há o que compactar e as consultas
+        # são feitas no banco, sem índices na memória
+        self.no_banco = not isinstance(dados, dict)
+        self.compactar = self.CLASSE_REGISTRO != None and not self.no_banco
+        self._compactar_registros()
+        self.reconstruir_indices()
+
+    def _compactar_registros(self):
+        # Converte os registros ainda em dicionário (trocar o valor de uma
+        # chave existente não altera o dicionário durante a iteração)
+        if self.compactar:
+            de_dict = self.CLASSE_REGISTRO.de_dict
+            for chave, registro in self.dados.items():
+                if type(registro) is dict:
+                    self.dados[chave] = de_dict(registro)
+
+    def _compactar(self, registro):
+        # Registro que entra no repositório: compacto, se a coleção usar
+        if self.compactar and type(registro) is dict:
+            return self.CLASSE_REGISTRO.de_dict(registro)
+        return registro
+
+    def reconstruir_indices(self):
+        """
+        Monta novamente todos os índices a partir do dicionário da coleção
+        (no modo SQLite não há índices na memória: nada a fazer).
+        """
+        self._limpar_indices()
+        if self.no_banco:
+            return
+        for chave, registro in self.dados.items():
+            self._indexar(chave, registro)
+
+    # Pontos de extensão das subclasses (a base não possui índices)
+    def _limpar_indices(self):
+        pass
+
+    def _indexar(self, chave, registro):
+        pass
+
+    def _desindexar(self, chave, registro):
+        pass
+
+    def _verificar(self, chave, registro):
+        pass
+
+    # ============================================================================
+    # CONSULTAS
+    # ============================================================================
+
+    def sincronizar(self):
+        """
+        Recarrega os dados e os índices se outro processo gravou a coleção
+        desde a última leitura ou gravação.
+
+        RETORNA:
+            bool: True se os dados foram recarregados
+        """
+        if not self.armazenamento.desatualizado():
+            return False
+        with self.armazenamento.trava:
+            alteracoes = self.armazenamento.ler_alteracoes_novas()
+            if alteracoes != None:
+                for chave, registro in alteracoes:
+                    self._aplicar_alteracao_externa(chave, registro)
+                return True
+            try:
+                dados = self.armazenamento.carregar()
+            except FileNotFoundError:
+                # O arquivo foi apagado por outro processo
+                dados = {}
+            # Mantém o mesmo dicionário (quem o guardou continua vendo a
+            # coleção). No modo SQLite os dados já são a própria tabela
+            if dados is not self.dados:
+                self.dados.clear()
+                self.dados.update(dados)
+            self._compactar_registros()
+            self.reconstruir_indices()
+        return True
+
+    def _aplicar_alteracao_externa(self, chave, registro):
+        # Aplica uma alteração feita por outro processo (registro None =
+        # exclusão), reindexando só se algum campo dos índices mudou
+        antigo = self.dados.get(chave)
+        if registro == None:
+            if antigo != None:
+                del self.dados[chave]
+                self._desindexar(chave, antigo)
+            return
+        registro = self._compactar(registro)
+        reindexar = antigo == None or any(antigo.get(campo) != registro.get(campo)
+                                          for campo in self.CAMPOS_INDEXADOS)
+        if antigo != None and reindexar:
+            self._desindexar(chave, antigo)
+        self.dados[chave] = registro
+        if reindexar:
+            self._indexar(chave, registro)
+
+    def lote(self):
+        """
+        Agrupa as alterações feitas dentro de "with repositorio.lote():" em
+        uma única gravação no fim. A trava da coleção fica com o lote do
+        início ao fim e os dados são sincronizados ao entrar, então consultas
+        feitas dentro do lote (ex: verificar se um valor está em uso antes de
+        inserir) não são invalidadas por outro processo.
+        """
+        return self.armazenamento.lote(self.sincronizar)
+
+    def __contains__(self, chave):
+        return chave in self.dados
+
+    def __getitem__(self, chave):
+        return self.dados[chave]
+
+    def __len__(self):
+        return len(self.dados)
+
+    # ============================================================================
+    # ALTERAÇÕES
+    # ============================================================================
+
+    def inserir(self, chave, registro):
+        """
+        Cadastra um novo registro, atualiza os índices e salva a alteração.
+
+        PARÂMETROS:
+            chave (str): ID único do registro (ex: ABC1234)
+            registro (dict): Dados do registro
+        """
+        with self.armazenamento.trava:
+            self.sincronizar()
+            registro = self._compactar(registro)
+            self._verificar(chave, registro)
+            self.dados[chave] = registro
+            if not self.no_banco:
+                self._indexar(chave, registro)
+            self.armazenamento.gravar(self.dados, chave)
+
+    def atualizar(self, chave, **campos):
+        """
+        Atualiza campos de um registro existente mantendo os índices em dia.
+
+        PARÂMETROS:
+            chave (str): ID do registro
+            **campos: Campos a alterar (ex: semestre=2)
+
+        RETORNA:
+            dict: O registro atualizado
+
+        OBSERVAÇÃO:
+            Com as coleções em dicionário (JSON/journal) o registro é alterado
+            no próprio lugar. No modo SQLite cada leitura devolve uma cópia,
+            e se outro processo alterou a coleção o registro é recarregado,
+            então quem guarda o registro (ex: usuário logado) deve usar o
+            valor retornado.
+        """
+        with self.armazenamento.trava:
+            self.sincronizar()
+            registro = self.dados[chave]
+            self._verificar(chave, {**registro, **campos})
+            reindexar = not self.no_banco and any(campo in self.CAMPOS_INDEXADOS for campo in campos)
+            if reindexar:
+                self._desindexar(chave, registro)
+            registro.update(campos)
+            # Reatribui para que coleções em banco (SQLite) recebam a alteração
+            self.dados[chave] = registro
+            if reindexar:
+                self._indexar(chave, registro)
+            self.armazenamento.gravar(self.dados, chave)
+            return registro
+
+    def remover(self, chave):
+        """
+        Exclui um registro, retira-o dos índices e salva a alteração.
+
+        PARÂMETROS:
+            chave (str): ID do registro a ser excluído
+        """
+        with self.armazenamento.trava:
+            self.sincronizar()
+            registro = self.dados.pop(chave)
+            if not self.no_banco:
+                self._desindexar(chave, registro)
+            self.armazenamento.excluir(self.dados, chave)
+
+    def salvar(self):
+        """
+        Salva a coleção inteira (compacta o log no modo journal).
+        """
+        self.armazenamento.salvar(self.dados)
+
+
+class RepositorioUsuarios(Repositorio):
+    """
+    Repositório de usuários com índices secundários por matrícula, e-mail e CPF.
+
+    ÍNDICES:
+        indices["matricula"] = {matricula: ID_USUARIO}
+        indices["email"]     = {email: ID_USUARIO}
+        indices["cpf"]       = {cpf: ID_USUARIO}
+        alunos_por_turma     = {CODIGO_TURMA: [("Nome - Matrícula", ID_USUARIO), ...]}
+        pendentes            = {ID_USUARIO: None} (fila de aprovação, na ordem
+                               de cadastro)
+
+    FUNCIONAMENTO:
+        1. Na criação, percorre os usuários uma única vez e monta os índices
+        2. Cada inserção, atualização ou exclusão atualiza os índices
+        3. As buscas consultam o índice (O(1)) em vez de varrer os usuários
+        4. Inserções e atualizações que repetiriam matrícula, e-mail ou CPF
+           de outro usuário são recusadas (ErroUnicidade)
+        5. A lista de alunos de cada turma (alunos aprovados) é mantida
+           sempre em ordem com bisect: aprovar, excluir ou trocar um aluno de
+           turma apenas insere/retira a sua linha na posição certa
+        6. A fila de aprovação guarda só os cadastros com aprovado = None:
+           listar os pendentes percorre a fila, não todos os usuários, e
+           aprovar ou reprovar retira o usuário da fila
+        7. No modo SQLite os mesmos dados vêm do banco: o índice de cada
+           campo único, o de (turma, cargo) e o de aprovado
+    """
+
+    # Campos únicos, cada um com seu índice secundário
+    CAMPOS_UNICOS = ("matricula", "email", "cpf")
+    CAMPOS_INDEXADOS = CAMPOS_UNICOS + ("nome", "cargo", "turma", "aprovado")
+    CLASSE_REGISTRO = Usuario
+
+    def __init__(self, dados, armazenamento):
+        self.indices = {campo: {} for campo in self.CAMPOS_UNICOS}
+        self.alunos_por_turma = {}
+        self.pendentes = {}
+        super().__init__(dados, armazenamento)
+
+    def _limpar_indices(self):
+        for indice in self.indices.values():
+            indice.clear()
+        self.alunos_por_turma.clear()
+        self.pendentes.clear()
+
+    def _indexar(self, id_usuario, usuario):
+        # Em caso de valores repetidos (bases antigas), vale o primeiro usuário,
+        # que era o encontrado pela busca sequencial
+        for campo, indice in self.indices.items():
+            indice.setdefault(usuario[campo], id_usuario)
+        if _entra_na_lista_da_turma(usuario):
+            lista = self.alunos_por_turma.setdefault(usuario["turma"], [])
+            bisect.insort(lista, (_linha_lista_presenca(usuario), id_usuario))
+        if usuario["aprovado"] == None:
+            self.pendentes[id_usuario] = None
+
+    def _desindexar(self, id_usuario, usuario):
+        # Só remove a entrada se ela apontar para este usuário
+        for campo, indice in self.indices.items():
+            if indice.get(usuario[campo]) == id_usuario:
+                del indice[usuario[campo]]
+        self.pendentes.pop(id_usuario, None)
+        if _entra_na_lista_da_turma(usuario):
+            lista = self.alunos_por_turma.get(usuario["turma"], [])
+            item = (_linha_lista_presenca(usuario), id_usuario)
+            posicao = bisect.bisect_left(lista, item)
+            if posicao < len(lista) and lista[posicao] == item:
+                del lista[posicao]
+            if len(lista) == 0:
+                self.alunos_por_turma.pop(usuario["turma"], None)
+
+    def _verificar(self, id_usuario, usuario):
+        # Recusa valores que já pertencem a outro usuário
+        for campo in self.CAMPOS_UNICOS:
+            id_existente = self._id_com_valor(campo, usuario[campo])
+            if id_existente != None and id_existente != id_usuario:
+                raise ErroUnicidade(campo, usuario[campo], id_existente)
+
+    def _id_com_valor(self, campo, valor):
+        # Usuário que usa o valor de um campo único (None se nenhum)
+        if self.no_banco:
+            ids = self.dados.ids_onde((campo, valor), limite=1)
+            return ids[0] if ids else None
+        return self.indices[campo].get(valor)
+
+    # ============================================================================
+    # CONSULTAS
+    # ============================================================================
+
+    def valor_em_uso(self, campo, valor):
+        """
+        Verifica se um valor de campo único já está cadastrado.
+
+        PARÂMETROS:
+            campo (str): "matricula", "email" ou "cpf"
+            valor (str): Valor a verificar
+
+        RETORNA:
+            bool: True se algum usuário já usa o valor
+        """
+        return self._id_com_valor(campo, valor) != None
+
+    def buscar(self, campo, valor):
+        """
+        Busca um usuário por um campo indexado.
+
+        PARÂMETROS:
+            campo (str): "matricula", "email" ou "cpf"
+            valor (str): Valor procurado
+
+        RETORNA:
+            tuple: (ID_USUARIO, usuario) ou (None, None) se não encontrado
+        """
+        id_usuario = self._id_com_valor(campo, valor)
+        if id_usuario == None:
+            return None, None
+        return id_usuario, self.dados[id_usuario]
+
+    def alunos_da_turma(self, codigo_turma):
+        """
+        Lista os alunos aprovados de uma turma, em ordem alfabética.
+
+        PARÂMETROS:
+            codigo_turma (str): Código da turma (ex: DS2P13)
+
+        RETORNA:
+            list: Linhas "Nome - Matrícula", prontas para o relatório de presença
+        """
+        if self.no_banco:
+            alunos = self.dados.selecionar(("nome", "matricula", "id"), ("turma", codigo_turma),
+                                           ("cargo", "aluno"), ("aprovado", True))
+            # Mesma ordem da lista na memória: (linha, ID)
+            return [linha for linha, _ in sorted((_linha_lista_presenca({"nome": nome, "matricula": matricula}),
+                                                  id_usuario) for nome, matricula, id_usuario in alunos)]
+        return [linha for linha, _ in self.alunos_por_turma.get(codigo_turma, ())]
+
+    def pendente(self, id_usuario):
+        """
+        Indica se o usuário está na fila de aprovação (aprovado = None).
+        """
+        if self.no_banco:
+            return self.dados.contar_onde(("id", id_usuario), ("aprovado", None)) > 0
+        return id_usuario in self.pendentes
+
+    def cadastros_pendentes(self, turma=None, padrao=None):
+        """
+        Lista os cadastros aguardando aprovação.
+
+        PARÂMETROS:
+            turma (str): Apenas os alunos desta turma (opcional)
+            padrao (str): Apenas os usuários cuja matrícula ou e-mail combina
+                          com o padrão, com * e ? (ex: "R25*",
+                          "*@unitech.edu.br"); opcional
+
+        RETORNA:
+            list: IDs dos usuários, na ordem de cadastro
+        """
+        if self.no_banco:
+            condicoes = [("aprovado", None)] + ([("turma", turma)] if turma != None else [])
+            pendentes = self.dados.ids_onde(*condicoes)
+        else:
+            pendentes = list(self.pendentes)
+            if turma != None:
+                pendentes = [id_usuario for id_usuario in pendentes if self.dados[id_usuario]["turma"] == turma]
+        if padrao != None:
+            from fnmatch import fnmatchcase
+            pendentes = [id_usuario for id_usuario in pendentes
+                         if fnmatchcase(self.dados[id_usuario]["matricula"], padrao.upper())
+                         or fnmatchcase(self.dados[id_usuario]["email"].lower(), padrao.lower())]
+        return pendentes
+
+    def buscar_por_matricula(self, matricula):
+        """
+        Busca um usuário pela matrícula (usado no login).
+
+        RETORNA:
+            tuple: (ID_USUARIO, usuario) ou (None, None) se não encontrado
+        """
+        return self.buscar("matricula", matricula)
+
+    def buscar_por_email(self, email):
+        """
+        Busca um usuário pelo e-mail.
+
+        RETORNA:
+            tuple: (ID_USUARIO, usuario) ou (None, None) se não encontrado
+        """
+        return self.buscar("email", email)
+
+    def buscar_por_cpf(self, cpf):
+        """
+        Busca um usuário pelo CPF.
+
+        RETORNA:
+            tuple: (ID_USUARIO, usuario) ou (None, None) se não encontrado
+        """
+        return self.buscar("cpf", cpf)
+
+
+class RepositorioDisciplinas(Repositorio):
+    """
+    Repositório de disciplinas indexadas por (curso, semestre) e por professor.
+
+    ÍNDICES:
+        por_curso_semestre = {(curso, semestre): {ID_DISCIPLINA: None}}
+        por_professor      = {ID_PROFESSOR: {ID_DISCIPLINA: None}}
+        (dicionários usados como conjuntos ordenados, na ordem de cadastro)
+
+    FUNCIONAMENTO:
+        As disciplinas de uma turma são as do mesmo curso e semestre da
+        turma. Com o índice, listar as disciplinas de um aluno é uma consulta
+        direta pela chave (curso, semestre) da turma, sem percorrer todas as
+        disciplinas. Como a chave vem da própria turma, alterar o curso ou o
+        semestre de uma turma já muda o resultado da consulta.
+        Da mesma forma, as disciplinas de um professor são consultadas pelo
+        ID do professor. Disciplinas sem professor (None) não entram nesse
+        índice.
+    """
+
+    CAMPOS_INDEXADOS = ("curso", "semestre", "professor")
+    CLASSE_REGISTRO = Disciplina
+
+    def __init__(self, dados, armazenamento):
+        self.por_curso_semestre = {}
+        self.por_professor = {}
+        super().__init__(dados, armazenamento)
+
+    def _limpar_indices(self):
+        self.por_curso_semestre.clear()
+        self.por_professor.clear()
+
+    def _indexar(self, id_disciplina, disciplina):
+        chave = (disciplina["curso"], disciplina["semestre"])
+        self.por_curso_semestre.setdefault(chave, {})[id_disciplina] = None
+        if disciplina["professor"] != None:
+            self.por_professor.setdefault(disciplina["professor"], {})[id_disciplina] = None
+
+    def _desindexar(self, id_disciplina, disciplina):
+        _retirar(self.por_curso_semestre, (disciplina["curso"], disciplina["semestre"]), id_disciplina)
+        _retirar(self.por_professor, disciplina["professor"], id_disciplina)
+
+    def disciplinas_do_curso_semestre(self, curso, semestre):
+        """
+        Lista as disciplinas de um curso em um semestre.
+
+        RETORNA:
+            list: IDs das disciplinas, na ordem de cadastro
+        """
+        if self.no_banco:
+            return self.dados.ids_onde(("curso", curso), ("semestre", semestre))
+        return list(self.por_curso_semestre.get((curso, semestre), ()))
+
+    def disciplinas_do_professor(self, id_professor):
+        """
+        Lista as disciplinas de um professor.
+
+        PARÂMETROS:
+            id_professor (str): ID do professor (ex: usuário logado)
+
+        RETORNA:
+            list: IDs das disciplinas, na ordem de cadastro
+        """
+        if self.no_banco:
+            # Disciplinas sem professor (None) não são de ninguém
+            return self.dados.ids_onde(("professor", id_professor)) if id_professor != None else []
+        return list(self.por_professor.get(id_professor, ()))
+
+    def disciplinas_da_turma(self, turma):
+        """
+        Lista as disciplinas cursadas por uma turma.
+
+        PARÂMETROS:
+            turma (dict): Registro da turma ({"curso": str, "semestre": int})
+
+        RETORNA:
+            list: IDs das disciplinas, na ordem de cadastro
+        """
+        return self.disciplinas_do_curso_semestre(turma["curso"], turma["semestre"])
+
+
+class RepositorioTurmas(Repositorio):
+    """
+    Repositório de turmas indexadas por curso.
+
+    ÍNDICE:
+        por_curso = {curso: {CODIGO_TURMA: None}}
+
+    FUNCIONAMENTO:
+        Usado para listar as turmas que podem cursar uma disciplina (mesmo
+        curso) sem percorrer todas as turmas.
+    """
+
+    CAMPOS_INDEXADOS = ("curso",)
+    CLASSE_REGISTRO = Turma
+
+    def __init__(self, dados, armazenamento):
+        self.por_curso = {}
+        super().__init__(dados, armazenamento)
+
+    def _limpar_indices(self):
+        self.por_curso.clear()
+
+    def _indexar(self, codigo_turma, turma):
+        self.por_curso.setdefault(turma["curso"], {})[codigo_turma] = None
+
+    def _desindexar(self, codigo_turma, turma):
+        _retirar(self.por_curso, turma["curso"], codigo_turma)
+
+    def turmas_do_curso(self, curso):
+        """
+        Lista as turmas de um curso.
+
+        RETORNA:
+            list: Códigos das turmas, na ordem de cadastro
+        """
+        if self.no_banco:
+            return self.dados.ids_onde(("curso", curso))
+        return list(self.por_curso.get(curso, ()))
+
+
+class RepositorioAtividades(Repositorio):
+    """
+    Repositório de atividades e conteúdos indexados por disciplina.
+
+    ÍNDICE:
+        por_disciplina = {ID_DISCIPLINA: {ID_ATIVIDADE: None}}
+        (conjunto ordenado na ordem de postagem)
+
+    FUNCIONAMENTO:
+        1. As postagens de uma disciplina são consultadas direto pelo ID da
+           disciplina, sem percorrer todas as atividades
+        2. A ordem é a de postagem (a mesma em que o menu sempre mostrou as
+           postagens): novas postagens entram no fim, e editar título,
+           conteúdo ou prazo não muda a posição. O prazo não entra na
+           ordem, porque conteúdos de aula não têm prazo
+        3. Disciplinas com muitas postagens podem ser listadas por páginas
+    """
+
+    CAMPOS_INDEXADOS = ("disciplina",)
+    CLASSE_REGISTRO = Atividade
+
+    def __init__(self, dados, armazenamento):
+        self.por_disciplina = {}
+        super().__init__(dados, armazenamento)
+
+    def _limpar_indices(self):
+        self.por_disciplina.clear()
+
+    def _indexar(self, id_atividade, atividade):
+        self.por_disciplina.setdefault(atividade["disciplina"], {})[id_atividade] = None
+
+    def _desindexar(self, id_atividade, atividade):
+        _retirar(self.por_disciplina, atividade["disciplina"], id_atividade)
+
+    def total_da_disciplina(self, id_disciplina):
+        """
+        Retorna a quantidade de postagens de uma disciplina.
+        """
+        if self.no_banco:
+            return self.dados.contar_onde(("disciplina", id_disciplina))
+        return len(self.por_disciplina.get(id_disciplina, ()))
+
+    def total_paginas(self, id_disciplina, tamanho_pagina=TAMANHO_PAGINA):
+        """
+        Retorna em quantas páginas as postagens da disciplina são divididas
+        (no mínimo 1, mesmo sem postagens).
+        """
+        return max(1, -(-self.total_da_disciplina(id_disciplina) // tamanho_pagina))
+
+    @medido("listar_atividades")
+    def atividades_da_disciplina(self, id_disciplina, pagina=None, tamanho_pagina=TAMANHO_PAGINA):
+        """
+        Lista as postagens de uma disciplina na ordem de postagem.
+
+        PARÂMETROS:
+            id_disciplina (str): ID da disciplina
+            pagina (int): Página desejada, começando em 1 (None = todas)
+            tamanho_pagina (int): Postagens por página
+
+        RETORNA:
+            list: IDs das atividades/conteúdos (vazia depois da última página)
+
+        EXCEÇÕES:
+            ValueError se a página ou o tamanho da página forem menores que 1
+        """
+        if pagina != None and (pagina < 1 or tamanho_pagina < 1):
+            raise ValueError(f"Página inválida: {pagina} (tamanho {tamanho_pagina})")
+        if self.no_banco:
+            if pagina == None:
+                return self.dados.ids_onde(("disciplina", id_disciplina))
+            return self.dados.ids_onde(("disciplina", id_disciplina), limite=tamanho_pagina,
+                                       deslocamento=(pagina - 1) * tamanho_pagina)
+        grupo = self.por_disciplina.get(id_disciplina, {})
+        if pagina == None:
+            return list(grupo)
+        inicio = (pagina - 1) * tamanho_pagina
+        return list(itertools.islice(grupo, inicio, inicio + tamanho_pagina))
@@ -0,0 +1,669 @@
+"""
+================================================================================
+SISTEMA UNITECH - SERVIÇOS (NÚCLEO DO SISTEMA)
+================================================================================
+
+DESCRIÇÃO:
+Regras do sistema sem nenhuma interação com o usuário: cadastro, log-in,
+aprovação de cadastros, postagem e entrega de atividades e relatórios de
+presença. É a base do menu do console (pim_python.py), do servidor de sessões
+(servidor_sessoes.py) e da API HTTP (api_http.py), e pode ser usado também
+por scripts e benchmarks.
+
+USO:
+    from servicos import Sistema
+    sistema = Sistema()              # Carrega os bancos da pasta do sistema
+    id_usuario, usuario = sistema.autenticar("R758493", "12345")
+
+IMPORTAÇÃO SEM EFEITOS E CARGA SOB DEMANDA:
+Importar este módulo não lê arquivos nem imprime nada, e criar um Sistema
+também não: cada coleção é carregada no primeiro acesso (ex: um log-in lê
+apenas os usuários; as atividades só são lidas ao abrir uma disciplina).
+
+ERROS:
+As operações lançam ErroServico (ou uma de suas subclasses) com a mesma
+mensagem que o menu mostra ao usuário:
+- ErroValidacao: dado em formato inválido
+  - ErroDuplicado: matrícula, CPF ou e-mail já usados por outro usuário
+- ErroAutenticacao: matrícula ou senha incorretas, cadastro não aprovado
+- ErroPermissao: operação não permitida para o usuário
+- ErroNaoEncontrado: registro inexistente
+================================================================================
+"""
+
+import hashlib    # Criptografia de senhas usando SHA-256
+import os         # Caminhos dos bancos de dados
+import re         # Validação de e-mail e datas
+import threading  # Trava para uso do sistema por várias threads
+import time       # Tempo de carga de cada coleção
+
+import relatorios  # Relatórios de presença e entregas de atividades (.txt)
+from armazenamento import abrir_armazenamento
+from identificadores import AlocadorIds
+from medicao import medido, medir
+from repositorios import RepositorioUsuarios, RepositorioDisciplinas, RepositorioTurmas, RepositorioAtividades
+
+# Pasta padrão dos bancos de dados (a mesma deste módulo)
+PASTA_PADRAO = os.path.dirname(os.path.abspath(__file__))
+
+"""
+ESTRUTURA DO BANCO DE DADOS:
+O sistema utiliza 4 arquivos JSON como banco de dados:
+
+1. database_users.json - Armazena informações de todos os usuários
+   Estrutura: {
+       "ID_USUARIO": {
+           "nome": str,
+           "cargo": "aluno" | "professor",
+           "matricula": str,
+           "cpf": str,
+           "data_nascimento": str,
+           "email": str,
+           "senha": str (hash SHA-256),
+           "turma": str | None,
+           "aprovado": True | False | None,
+           "admin": bool
+       }
+   }
+
+2. database_disciplinas.json - Armazena informações das disciplinas
+   Estrutura: {
+       "ID_DISCIPLINA": {
+           "nome": str,
+           "curso": str,
+           "semestre": int,
+           "professor": str (ID do professor) | None
+       }
+   }
+
+3. database_atividades.json - Armazena atividades e conteúdos de aula
+   Estrutura: {
+       "ID_ATIVIDADE": {
+           "titulo": str,
+           "conteudo": str,
+           "prazo": str | None,
+           "tipo": "A" | "C",
+           "disciplina": str (ID da disciplina)
+       }
+   }
+
+4. database_turmas.json - Armazena informações das turmas
+   Estrutura: {
+       "CODIGO_TURMA": {
+           "curso": str,
+           "semestre": int
+       }
+   }
+"""
+
+# Coleções do sistema: {nome do atributo: (arquivo, classe do repositório)}
+COLECOES = {
+    "usuarios": ("database_users.json", RepositorioUsuarios),
+    "disciplinas": ("database_disciplinas.json", RepositorioDisciplinas),
+    "atividades": ("database_atividades.json", RepositorioAtividades),
+    "turmas": ("database_turmas.json", RepositorioTurmas),
+}
+
+# Formatos aceitos (os mesmos do menu)
+PADRAO_DATA = r"^(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}$"
+PADRAO_EMAIL = r"^\S+@\S+\.\S+$"
+
+# Colunas da importação de usuários em lote (turma só é exigida de alunos)
+COLUNAS_IMPORTACAO = ("nome", "cargo", "matricula", "cpf", "data_nascimento", "email", "senha", "turma")
+
+
+# ================================================================================
+# ERROS
+# ================================================================================
+
+class ErroServico(Exception):
+    """
+    Erro de uma operação do sistema, com a mensagem a ser mostrada ao usuário.
+    """
+
+    def __init__(self, mensagem):
+        super().__init__(mensagem)
+        self.mensagem = mensagem
+
+
+class ErroValidacao(ErroServico):
+    pass
+
+
+class ErroDuplicado(ErroValidacao):
+    pass
+
+
+class ErroAutenticacao(ErroServico):
+    pass
+
+
+class ErroPermissao(ErroServico):
+    pass
+
+
+class ErroNaoEncontrado(ErroServico):
+    pass
+
+
+# ================================================================================
+# FUNÇÕES UTILITÁRIAS E VALIDAÇÕES
+# ================================================================================
+
+def senha_encode(senha):
+    """
+    Criptografa uma senha usando o algoritmo SHA-256.
+
+    PARÂMETROS:
+        senha (str): Senha em texto puro a ser criptografada
+
+    RETORNA:
+        str: Hash hexadecimal da senha (64 caracteres)
+
+    SEGURANÇA:
+        - SHA-256 é uma função hash unidirecional (não pode ser revertida)
+        - O mesmo texto sempre gera o mesmo hash
+        - Impossível descobrir a senha original a partir do hash
+    """
+    senha_hash = hashlib.sha256()
+    senha_hash.update(senha.encode())
+    return senha_hash.hexdigest()
+
+
+def matricula_valida(matricula):
+    """
+    Matrícula: 7 caracteres, começando por letra e terminando por número.
+    """
+    return len(matricula) == 7 and matricula[0].isalpha() and matricula[-1].isdigit()
+
+
+def cpf_valido(cpf):
+    """
+    Valida um CPF pelo algoritmo oficial dos dígitos verificadores.
+
+    ALGORITMO DE VALIDAÇÃO:
+    1º dígito verificador:
+      - Multiplica os 9 primeiros dígitos por 10, 9, 8, ..., 2
+      - Soma os resultados
+      - Calcula o resto da divisão por 11
+      - Se resto < 2, dígito = 0; senão dígito = 11 - resto
+
+    2º dígito verificador:
+      - Multiplica os 10 primeiros dígitos por 11, 10, 9, ..., 2
+      - Segue a mesma lógica do 1º dígito
+    """
+    if len(cpf) != 11 or not cpf.isdigit():
+        return False
+    for tamanho in (9, 10):
+        soma_cpf = sum(int(cpf[indice]) * (tamanho + 1 - indice) for indice in range(tamanho))
+        digito = 0 if soma_cpf % 11 < 2 else 11 - soma_cpf % 11
+        if int(cpf[tamanho]) != digito:
+            return False
+    return True
+
+
+def data_valida(data):
+    """
+    Data no formato dd/mm/aaaa (não verifica datas impossíveis como 31/02).
+    """
+    return re.match(PADRAO_DATA, data) != None
+
+
+def turma_valida(turma):
+    """
+    Turma: 2 letras (curso) + 1 número (semestre) + 1 letra (turma) + 2 números (ano).
+    Exemplo: SI1A23
+    """
+    return len(turma) == 6 and turma[0:2].isalpha() and turma[2].isdigit() and turma[3].isalpha() and turma[4:6].isdigit()
+
+
+def email_valido(email):
+    """
+    E-mail no formato básico texto@texto.texto.
+    """
+    return re.match(PADRAO_EMAIL, email) != None
+
+
+# ================================================================================
+# SISTEMA
+# ================================================================================
+
+class Sistema:
+    """
+    Dados e operações do sistema UniTech.
+
+    ATRIBUTOS:
+        usuarios, disciplinas, atividades, turmas: repositórios das coleções,
+                      carregados no primeiro acesso
+        ausentes (set): coleções sem arquivo (ou ilegíveis), iniciadas vazias
+        tempos_carga (dict): {coleção: segundos gastos para carregá-la}
+        trava (Lock): trava para quem compartilha o sistema entre threads
+                      (servidor de sessões); as operações em si não travam. A
+                      API usa a sua própria trava de leitura e escrita
+        ids (AlocadorIds): gerador dos IDs de usuários, disciplinas e atividades,
+                      únicos entre processos (ver identificadores.py)
+
+    PARÂMETROS:
+        pasta (str): Pasta dos bancos de dados (padrão: a pasta do sistema),
+                     onde também ficam relatorios_presenca/ e atividades_alunos/
+        modo (str): Modo de armazenamento ("json", "journal" ou "sqlite");
+                    padrão: variável de ambiente UNITECH_ARMAZENAMENTO
+    """
+
+    def __init__(self, pasta=PASTA_PADRAO, modo=None):
+        self.pasta = pasta
+        self.modo = modo
+        self.ausentes = set()
+        self.tempos_carga = {}
+        self.trava = threading.Lock()
+        self.ids = AlocadorIds(pasta)
+
+    def __getattr__(self, nome):
+        # Chamado só para atributos que ainda não existem: o primeiro acesso a
+        # uma coleção a carrega, e os seguintes já encontram o repositório
+        if nome not in COLECOES:
+            raise AttributeError(nome)
+        return self.carregar_colecao(nome)
+
+    def carregar_colecao(self, nome):
+        """
+        Carrega uma coleção e cria o seu repositório (com os índices).
+
+        RETORNA:
+            Repositorio: Repositório da coleção
+        """
+        inicio = time.perf_counter()
+        arquivo, classe_repositorio = COLECOES[nome]
+        with medir(f"carregar_{nome}"):
+            armazenamento = abrir_armazenamento(os.path.join(self.pasta, arquivo), self.modo)
+            try:
+                dados = armazenamento.carregar()
+            except Exception:
+                # Se o arquivo não existir ou estiver vazio, começa sem registros
+                dados = {}
+                self.ausentes.add(nome)
+            repositorio = classe_repositorio(dados, armazenamento)
+        setattr(self, nome, repositorio)
+        self.tempos_carga[nome] = time.perf_counter() - inicio
+        return repositorio
+
+    @medido("sincronizar")
+    def sincronizar(self):
+        """
+        Recarrega as coleções já carregadas que outro processo alterou (ex:
+        aprovações feitas em outro menu, disciplinas e atividades novas).
+        Coleções que não mudaram custam apenas uma consulta ao sistema de
+        arquivos; as que ainda não foram carregadas não são tocadas.
+
+        RETORNA:
+            list: Nomes das coleções recarregadas
+        """
+        carregadas = [nome for nome in COLECOES if nome in vars(self)]
+        return [nome for nome in carregadas if getattr(self, nome).sincronizar()]
+
+    def desatualizado(self):
+        """
+        Indica, sem recarregar nada, se alguma coleção já carregada foi
+        alterada por outro processo (ex: para quem só pode sincronizar com
+        uma trava exclusiva decidir se precisa dela).
+        """
+        return any(getattr(self, nome).armazenamento.desatualizado() for nome in COLECOES if nome in vars(self))
+
+    def carregar_tudo(self):
+        """
+        Carrega todas as coleções ainda não carregadas (ex: servidores, que
+        preferem pagar a carga no início a atrasar as primeiras requisições).
+        """
+        for nome in COLECOES:
+            getattr(self, nome)
+
+    # ----------------------------------------------------------------------------
+    # CADASTRO E CONTA DO USUÁRIO
+    # ----------------------------------------------------------------------------
+
+    def verificar_matricula(self, matricula):
+        if self.usuarios.valor_em_uso("matricula", matricula):
+            raise ErroDuplicado("Esta matrícula já está cadastrada! Por favor, entre em contato com a administração.")
+        if not matricula_valida(matricula):
+            raise ErroValidacao("Digite uma matrícula válida!")
+
+    def verificar_cpf(self, cpf):
+        if self.usuarios.valor_em_uso("cpf", cpf):
+            raise ErroDuplicado("Este CPF já está cadastrado! Por favor, entre em contato com a administração.")
+        if not cpf_valido(cpf):
+            raise ErroValidacao("Digite um CPF válido!")
+
+    def verificar_email(self, email):
+        if self.usuarios.valor_em_uso("email", email):
+            raise ErroDuplicado("Esse e-mail já pertence a outro usuário. Não gostaria de fazer seu log-in?")
+        if not email_valido(email):
+            raise ErroValidacao("E-mail inválido!")
+
+    @medido("cadastro")
+    def cadastrar_usuario(self, nome, cargo, matricula, cpf, data_nascimento, email, senha, turma=None):
+        """
+        Cadastra um novo usuário, que aguarda a aprovação de um administrador.
+
+        PARÂMETROS:
+            senha (str): Senha em texto puro (é guardado apenas o hash SHA-256)
+            turma (str): Código da turma (obrigatório para alunos)
+
+        RETORNA:
+            str: ID do novo usuário
+
+        EXCEÇÕES:
+            ErroValidacao se algum campo for inválido
+            (ErroDuplicado se matrícula, CPF ou e-mail já estiverem em uso)
+        """
+        if cargo not in ("aluno", "professor"):
+            raise ErroValidacao("Escolha uma opção válida!")
+        # Verificações e inserção no mesmo lote: outro processo não consegue
+        # cadastrar a mesma matrícula (ou o mesmo ID) entre uma e outra
+        with self.usuarios.lote():
+            self.verificar_matricula(matricula)
+            self.verificar_cpf(cpf)
+            if not data_valida(data_nascimento):
+                raise ErroValidacao("Digite uma data válida!")
+            if cargo == "aluno":
+                if turma == None or not turma_valida(turma):
+                    raise ErroValidacao("Digite uma turma válida!")
+            else:
+                turma = None  # Professores não pertencem a turmas
+            self.verificar_email(email)
+
+            id_usuario = self.ids.novo_id(self.usuarios)
+            self.usuarios.inserir(id_usuario, {
+                "nome": nome,
+                "cargo": cargo,
+                "matricula": matricula,
+                "cpf": cpf,
+                "data_nascimento": data_nascimento,
+                "email": email,
+                "senha": senha_encode(senha),
+                "turma": turma,
+                "aprovado": None,  # Novo usuário aguarda aprovação
+                "admin": False     # Por padrão, usuários não são administradores
+            })
+        return id_usuario
+
+    @medido("importacao_usuarios")
+    def importar_usuarios(self, linhas, aprovar=False, primeira_linha=2):
+        """
+        Cadastra muitos usuários de uma vez (ex: alunos matriculados no
+        semestre), com as mesmas validações do cadastro pelo menu.
+
+        PARÂMETROS:
+            linhas: Iterável de dicionários com as colunas de COLUNAS_IMPORTACAO
+                    (ex: csv.DictReader); é percorrido uma única vez, sem ser
+                    guardado em memória
+            aprovar (bool): Cadastra os usuários já aprovados (padrão: aguardando
+                            aprovação, como no cadastro pelo menu)
+            primeira_linha (int): Número da primeira linha nos erros (padrão: 2,
+                                  a linha seguinte ao cabeçalho do CSV)
+
+        RETORNA:
+            tuple: (quantidade de usuários importados,
+                    lista de erros [(número da linha, mensagem)])
+
+        FUNCIONAMENTO:
+            1. Tudo acontece em um único lote do repositório de usuários: cada
+               linha válida é inserida na memória (e nos índices) e o arquivo é
+               gravado uma única vez no fim
+            2. Matrícula, CPF e e-mail são verificados nos índices, que já
+               incluem as linhas anteriores do próprio arquivo: repetições
+               dentro do arquivo também são recusadas
+            3. Uma linha inválida vira um erro com o seu número e não impede as
+               demais; o custo por linha é constante (consultas aos índices)
+        """
+        importados = 0
+        erros = []
+        with self.usuarios.lote():
+            for numero, linha in enumerate(linhas, start=primeira_linha):
+                campos = {coluna: (linha.get(coluna) or "").strip() for coluna in COLUNAS_IMPORTACAO}
+                try:
+                    if campos["nome"] == "":
+                        raise ErroValidacao("Digite um nome!")
+                    if campos["senha"] == "":
+                        raise ErroValidacao("Digite uma senha!")
+                    id_usuario = self.cadastrar_usuario(
+                        campos["nome"],
+                        campos["cargo"].lower(),
+                        campos["matricula"].upper(),
+                        # CPF aceito também com pontuação (123.456.789-09)
+                        campos["cpf"].replace(".", "").replace("-", ""),
+                        campos["data_nascimento"],
+                        campos["email"],
+                        campos["senha"],
+                        campos["turma"].upper() or None)
+                    if aprovar:
+                        self.usuarios.atualizar(id_usuario, aprovado=True)
+                    importados += 1
+                except ErroValidacao as erro:
+                    erros.append((numero, erro.mensagem))
+        return importados, erros
+
+    @medido("login")
+    def autenticar(self, matricula, senha):
+        """
+        Faz o log-in de um usuário.
+
+        RETORNA:
+            tuple: (ID_USUARIO, usuario)
+
+        EXCEÇÕES:
+            ErroAutenticacao se a matrícula não existir, o cadastro não estiver
+            aprovado ou a senha estiver incorreta
+        """
+        id_usuario, usuario = self.usuarios.buscar_por_matricula(matricula.upper())
+        if usuario == None:
+            raise ErroAutenticacao("Não foi possível identificar sua matrícula. Não se esqueça de fazer seu cadastro!")
+        if usuario["aprovado"] == None:
+            raise ErroAutenticacao("Sua matrícula ainda está em análise. Por favor, tente novamente mais tarde.")
+        if usuario["aprovado"] == False:
+            raise ErroAutenticacao("Sua matrícula foi reprovada. Por favor, entre em contato com a administração.")
+        if usuario["senha"] != senha_encode(senha):
+            raise ErroAutenticacao("Senha incorreta. Tente novamente!")
+        return id_usuario, usuario
+
+    def atualizar_email(self, id_usuario, email):
+        self.verificar_email(email)
+        return self.usuarios.atualizar(id_usuario, email=email)
+
+    def atualizar_senha(self, id_usuario, senha_atual, senha_nova):
+        if senha_encode(senha_atual) != self.usuarios[id_usuario]["senha"]:
+            raise ErroAutenticacao("Senha inválida! Tente novamente.")
+        return self.usuarios.atualizar(id_usuario, senha=senha_encode(senha_nova))
+
+    def excluir_usuario(self, id_usuario):
+        self.usuarios.remover(id_usuario)
+
+    # ----------------------------------------------------------------------------
+    # APROVAÇÃO DE CADASTROS
+    # ----------------------------------------------------------------------------
+
+    @medido("lista_aprovacao")
+    def cadastros_pendentes(self, turma=None, padrao=None):
+        """
+        Consulta a fila de aprovação do repositório (não percorre os usuários).
+
+        PARÂMETROS:
+            turma (str): Apenas os alunos desta turma (opcional)
+            padrao (str): Apenas matrícula ou e-mail que combinem com o padrão,
+                          ex: "R25*" ou "*@unitech.edu.br" (opcional)
+
+        RETORNA:
+            list: IDs dos usuários aguardando aprovação, em ordem de cadastro
+        """
+        return self.usuarios.cadastros_pendentes(turma, padrao)
+
+    @medido("avaliar_cadastro")
+    def avaliar_cadastro(self, id_usuario, aprovado):
+        """
+        Aprova (aprovado=True) ou reprova (aprovado=False) um cadastro.
+
+        EXCEÇÕES:
+            ErroNaoEncontrado se o ID não existir, ou ErroValidacao se o
+            usuário não estiver na fila de aprovação (ex: já aprovado,
+            administrador)
+        """
+        if id_usuario not in self.usuarios:
+            raise ErroNaoEncontrado("Usuário não encontrado.")
+        if not self.usuarios.pendente(id_usuario):
+            raise ErroValidacao("Usuário sem cadastro pendente.")
+        return self.usuarios.atualizar(id_usuario, aprovado=aprovado)
+
+    @medido("avaliar_cadastros")
+    def avaliar_cadastros(self, ids_usuarios, aprovado):
+        """
+        Aprova ou reprova vários cadastros pendentes de uma vez, com uma
+        única gravação.
+
+        PARÂMETROS:
+            ids_usuarios: Iterável de IDs (percorrido uma única vez)
+            aprovado (bool): True para aprovar, False para reprovar
+
+        RETORNA:
+            list: IDs avaliados
+
+        EXCEÇÕES:
+            ErroNaoEncontrado se algum ID não existir, ou ErroValidacao se
+            algum usuário não estiver na fila de aprovação (ex: já aprovado,
+            administrador); nesses casos nenhum cadastro é avaliado
+        """
+        ids = list(ids_usuarios)
+        with self.usuarios.lote():
+            desconhecidos = [id_usuario for id_usuario in ids if id_usuario not in self.usuarios]
+            if desconhecidos:
+                raise ErroNaoEncontrado(f"Usuário não encontrado: {', '.join(desconhecidos)}.")
+            avaliados = [id_usuario for id_usuario in ids if not self.usuarios.pendente(id_usuario)]
+            if avaliados:
+                raise ErroValidacao(f"Usuário sem cadastro pendente: {', '.join(avaliados)}.")
+            for id_usuario in ids:
+                self.usuarios.atualizar(id_usuario, aprovado=aprovado)
+        return ids
+
+    def avaliar_pendentes(self, aprovado, turma=None, padrao=None):
+        """
+        Aprova ou reprova, com uma única gravação, todos os cadastros
+        pendentes de uma turma e/ou que combinem com um padrão (ver
+        cadastros_pendentes).
+
+        RETORNA:
+            list: IDs avaliados
+        """
+        with self.usuarios.lote():
+            return self.avaliar_cadastros(self.cadastros_pendentes(turma, padrao), aprovado)
+
+    # ----------------------------------------------------------------------------
+    # DISCIPLINAS E ATIVIDADES
+    # ----------------------------------------------------------------------------
+
+    @medido("listar_disciplinas")
+    def disciplinas_do_usuario(self, id_usuario):
+        """
+        Disciplinas visíveis para o usuário: alunos veem as da sua turma,
+        professores as que lecionam e administradores todas.
+        """
+        usuario = self.usuarios[id_usuario]
+        if usuario["cargo"] == "aluno":
+            turma = self.turmas.dados.get(usuario["turma"])
+            return self.disciplinas.disciplinas_da_turma(turma) if turma != None else []
+        if usuario["cargo"] == "professor":
+            return self.disciplinas.disciplinas_do_professor(id_usuario)
+        return list(self.disciplinas.dados)
+
+    @medido("publicar_atividade")
+    def publicar_atividade(self, id_disciplina, tipo, titulo, conteudo, prazo=None):
+        """
+        Publica um conteúdo de aula (tipo "C") ou uma atividade (tipo "A", com prazo).
+
+        RETORNA:
+            str: ID da nova postagem
+        """
+        if id_disciplina not in self.disciplinas:
+            raise ErroNaoEncontrado("Digite uma disciplina válida!")
+        if tipo not in ("A", "C"):
+            raise ErroValidacao("Digite um tipo de postagem!")
+        if tipo == "A":
+            if prazo == None or not data_valida(prazo):
+                raise ErroValidacao("Digite uma data válida!")
+        else:
+            prazo = None  # Conteúdos de aula não têm prazo
+
+        with self.atividades.lote():
+            id_atividade = self.ids.novo_id(self.atividades)
+            self.atividades.inserir(id_atividade, {
+                "titulo": titulo,
+                "conteudo": conteudo,
+                "prazo": prazo,
+                "tipo": tipo,
+                "disciplina": id_disciplina
+            })
+        return id_atividade
+
+    def editar_atividade(self, id_atividade, titulo, conteudo, prazo=None):
+        if prazo != None and not data_valida(prazo):
+            raise ErroValidacao("Digite uma data válida!")
+        return self.atividades.atualizar(id_atividade, titulo=titulo, conteudo=conteudo, prazo=prazo)
+
+    def excluir_atividade(self, id_atividade):
+        self.atividades.remover(id_atividade)
+
+    @medido("entrega_atividade")
+    def entregar_atividade(self, id_usuario, id_atividade, resposta):
+        """
+        Registra a entrega de uma atividade por um aluno.
+
+        RETORNA:
+            str: Caminho do arquivo atividades_alunos/<id_atividade>_<matricula>.txt,
+                 na pasta dos bancos de dados
+        """
+        aluno = self.usuarios[id_usuario]
+        if aluno["cargo"] != "aluno":
+            raise ErroPermissao("Apenas alunos entregam atividades.")
+        if id_atividade not in self.atividades:
+            raise ErroNaoEncontrado("Digite uma atividade válida!")
+        atividade = self.atividades[id_atividade]
+        # Apenas atividades (tipo "A") podem ser entregues; conteúdos de aula não
+        if atividade["tipo"] != "A":
+            raise ErroValidacao("Conteúdos de aula não podem ser entregues.")
+        return relatorios.escrever_atividade_aluno(
+            self.pasta, id_atividade, atividade["titulo"], atividade["conteudo"], aluno["nome"], aluno["matricula"],
+            resposta, self.disciplinas[atividade["disciplina"]]["nome"].title())
+
+    # ----------------------------------------------------------------------------
+    # RELATÓRIOS DE PRESENÇA
+    # ----------------------------------------------------------------------------
+
+    def descricao_turma(self, codigo_turma):
+        turma = self.turmas[codigo_turma]
+        return f"Turma {codigo_turma}, curso {turma["curso"].title()}, {turma["semestre"]}º semestre"
+
+    def turmas_da_disciplina(self, id_disciplina):
+        """
+        Turmas do curso da disciplina (as que podem ter relatório de presença).
+        """
+        return self.turmas.turmas_do_curso(self.disciplinas[id_disciplina]["curso"])
+
+    @medido("relatorio_presenca")
+    def gerar_relatorios_presenca(self, id_professor, turmas, datas):
+        """
+        Gera os relatórios de presença das turmas nas datas informadas.
+
+        PARÂMETROS:
+            id_professor (str): ID do professor (nome no cabeçalho do relatório)
+            turmas (list): Códigos das turmas
+            datas (list): Datas das aulas (dd/mm/aaaa)
+
+        RETORNA:
+            list: Caminhos dos arquivos relatorios_presenca/<turma>_<data>.txt,
+                  na pasta dos bancos de dados
+        """
+        if len(turmas) == 0 or not all(turma in self.turmas for turma in turmas):
+            raise ErroValidacao("Digite uma turma válida!")
+        if len(datas) == 0 or not all(data_valida(data) for data in datas):
+            raise ErroValidacao("Digite uma data válida!")
+        # A lista de alunos aprovados de cada turma vem do índice do
+        # repositório de usuários, que já a mantém em ordem alfabética
+        turmas_lote = {turma: (self.descricao_turma(turma), self.usuarios.alunos_da_turma(turma)) for turma in turmas}
+        return relatorios.gerar_relatorios_lote(self.pasta, turmas_lote, datas, self.usuarios[id_professor]["nome"])
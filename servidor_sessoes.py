@@ -0,0 +1,184 @@
+"""
+================================================================================
+SISTEMA UNITECH - SERVIDOR DE SESSÕES (TCP)
+================================================================================
+
+DESCRIÇÃO:
+Atende vários usuários ao mesmo tempo a partir de um único processo, com uma
+única cópia dos dados em memória. Cada cliente que se conecta (ex: telnet ou
+nc) recebe o mesmo menu do console (cadastro, log-in, disciplinas, aprovações,
+turmas e disciplinas do administrador), executado por menu_principal() de
+pim_python.py.
+
+USO:
+python servidor_sessoes.py [porta] [max_sessoes]
+(padrão: porta 8023, até 256 sessões simultâneas)
+
+Cliente: telnet localhost 8023   ou   nc localhost 8023
+
+FUNCIONAMENTO:
+1. O servidor asyncio aceita as conexões e faz toda a leitura e escrita na
+   rede sem bloquear
+2. O menu é código síncrono (input/print), então cada sessão roda em uma
+   thread de um conjunto limitado (max_sessoes); conexões além do limite
+   aguardam na fila até uma sessão terminar
+3. sys.stdin e sys.stdout são trocados por fluxos que encaminham cada
+   input()/print() para a conexão da sessão da thread atual; fora das
+   sessões continuam indo para o console
+4. A trava do Sistema protege os dados: a sessão só a solta enquanto espera
+   o usuário digitar, então as alterações (e os índices dos repositórios)
+   nunca são feitas por duas sessões ao mesmo tempo
+================================================================================
+"""
+
+import asyncio    # Servidor TCP e E/S de rede sem bloqueio
+import sys        # Troca de stdin/stdout e argumentos da linha de comando
+import threading  # Fluxo de cada sessão por thread
+import traceback  # Registro de erros inesperados de uma sessão
+from concurrent.futures import ThreadPoolExecutor  # Threads que executam os menus
+
+import pim_python  # Menu do sistema
+from servicos import Sistema  # Dados compartilhados por todas as sessões
+
+PORTA_PADRAO = 8023
+MAX_SESSOES_PADRAO = 256
+
+# Código ANSI que limpa a tela do terminal do cliente
+LIMPAR_TELA_ANSI = "\033[2J\033[H"
+
+# Fluxo da sessão atendida por cada thread
+_sessao_local = threading.local()
+
+
+class FluxoSessao:
+    """
+    Entrada e saída de uma sessão (conexão TCP) para input() e print().
+
+    A escrita é agendada no loop do asyncio; a leitura espera a próxima linha
+    enviada pelo cliente, soltando a trava dos dados durante a espera.
+    """
+
+    def __init__(self, loop, leitor, escritor, trava):
+        self.loop = loop
+        self.leitor = leitor
+        self.escritor = escritor
+        self.trava = trava
+
+    def write(self, texto):
+        self.loop.call_soon_threadsafe(self.escritor.write, texto.encode("utf-8"))
+        return len(texto)
+
+    def flush(self):
+        pass
+
+    def readline(self):
+        self.trava.release()
+        try:
+            return asyncio.run_coroutine_threadsafe(self._ler_linha(), self.loop).result()
+        finally:
+            self.trava.acquire()
+
+    async def _ler_linha(self):
+        # Garante que o cliente recebeu a pergunta antes de esperar a resposta
+        await self.escritor.drain()
+        linha = await self.leitor.readline()
+        # Linha vazia (sem "\n") = conexão encerrada: input() lança EOFError
+        return linha.decode("utf-8", errors="replace").replace("\r", "")
+
+    def limpar_tela(self):
+        self.write(LIMPAR_TELA_ANSI)
+
+
+class _FluxoPorThread:
+    """
+    Substituto de sys.stdin/sys.stdout que encaminha cada operação para o
+    fluxo da sessão da thread atual ou, fora das sessões, para o original.
+    """
+
+    def __init__(self, original):
+        self._original = original
+
+    def __getattr__(self, nome):
+        fluxo = getattr(_sessao_local, "fluxo", None)
+        return getattr(fluxo if fluxo != None else self._original, nome)
+
+
+def instalar_fluxos():
+    """
+    Troca sys.stdin e sys.stdout pelos fluxos por thread (apenas uma vez).
+    """
+    if not isinstance(sys.stdout, _FluxoPorThread):
+        sys.stdin = _FluxoPorThread(sys.stdin)
+        sys.stdout = _FluxoPorThread(sys.stdout)
+
+
+def executar_sessao(sistema, fluxo):
+    """
+    Executa o menu do sistema para uma sessão (dentro de uma thread).
+
+    PARÂMETROS:
+        sistema (Sistema): Dados compartilhados por todas as sessões
+        fluxo (FluxoSessao): Entrada e saída da conexão do cliente
+    """
+    _sessao_local.fluxo = fluxo
+    sistema.trava.acquire()
+    try:
+        pim_python.menu_principal(sistema)
+    except EOFError:
+        # O cliente desconectou no meio do menu
+        pass
+    except Exception:
+        # Um erro em uma sessão não derruba o servidor nem as demais sessões
+        traceback.print_exc(file=sys.__stderr__)
+    finally:
+        sistema.trava.release()
+        _sessao_local.fluxo = None
+
+
+async def atender_cliente(sistema, leitor, escritor, executor):
+    """
+    Atende uma conexão: executa o menu em uma thread e encerra a conexão no fim.
+    """
+    loop = asyncio.get_running_loop()
+    fluxo = FluxoSessao(loop, leitor, escritor, sistema.trava)
+    try:
+        await loop.run_in_executor(executor, executar_sessao, sistema, fluxo)
+        await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+
+
+async def iniciar_servidor(porta=PORTA_PADRAO, max_sessoes=MAX_SESSOES_PADRAO, host="0.0.0.0"):
+    """
+    Inicia o servidor de sessões e atende conexões até ser interrompido.
+
+    PARÂMETROS:
+        porta (int): Porta TCP
+        max_sessoes (int): Máximo de sessões atendidas ao mesmo tempo
+        host (str): Endereço de escuta
+    """
+    sistema = Sistema()
+    sistema.carregar_tudo()
+    instalar_fluxos()
+    executor = ThreadPoolExecutor(max_workers=max_sessoes, thread_name_prefix="sessao")
+    servidor = await asyncio.start_server(
+        lambda leitor, escritor: atender_cliente(sistema, leitor, escritor, executor), host, porta)
+    print(f"Servidor de sessões UniTech na porta {porta} (até {max_sessoes} sessões simultâneas)",
+          file=sys.__stdout__)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main():
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA_PADRAO
+    max_sessoes = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_SESSOES_PADRAO
+    try:
+        asyncio.run(iniciar_servidor(porta, max_sessoes))
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.", file=sys.__stdout__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+================================================================================
+SISTEMA UNITECH - TESTES DA API HTTP/JSON
+================================================================================
+
+DESCRIÇÃO:
+Sobe o servidor da API (api_http.py) em uma porta livre, sobre uma base
+sintética gerada em uma pasta temporária (gerar_dados.py), e confere as
+respostas das rotas.
+
+USO:
+python -m unittest test_api_http
+================================================================================
+"""
+
+import http.client  # Cliente das requisições
+import json         # Corpo das requisições e respostas
+import shutil       # Remoção da pasta temporária
+import tempfile     # Pasta da base de testes
+import threading    # Thread do servidor
+import unittest     # Casos de teste
+
+import api_http
+from gerar_dados import gerar_base, matricula_do_numero, SENHA_PADRAO
+from servicos import Sistema, ErroServico
+
+# Usuários da base de testes (o usuário 0 é o administrador)
+USUARIOS_BASE = 200
+
+
+class TesteAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pasta = tempfile.mkdtemp()
+        gerar_base(cls.pasta, USUARIOS_BASE)
+        cls.sistema = Sistema(cls.pasta)
+        cls.sistema.carregar_tudo()
+        cls.servidor = api_http.ServidorAPI(("127.0.0.1", 0), cls.sistema)
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+        status, resposta = cls.requisitar("POST", "/login", {"matricula": matricula_do_numero(0),
+                                                             "senha": SENHA_PADRAO})
+        cls.id_admin = resposta["id"]
+        cls.token_admin = resposta["token"]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+        shutil.rmtree(cls.pasta, ignore_errors=True)
+
+    @classmethod
+    def requisitar(cls, metodo, caminho, corpo=None, token=None, cabecalhos=None):
+        conexao = http.client.HTTPConnection("127.0.0.1", cls.servidor.server_address[1])
+        cabecalhos = dict(cabecalhos or {})
+        if token != None:
+            cabecalhos["Authorization"] = f"Bearer {token}"
+        conexao.request(metodo, caminho, json.dumps(corpo) if corpo != None else None, cabecalhos)
+        resposta = conexao.getresponse()
+        conteudo = json.loads(resposta.read())
+        conexao.close()
+        return resposta.status, conteudo
+
+    def aprovado(self):
+        # Algum usuário já aprovado (que não seja o administrador)
+        return next(id_usuario for id_usuario in self.sistema.usuarios.dados
+                    if id_usuario != self.id_admin and self.sistema.usuarios[id_usuario]["aprovado"] == True)
+
+    # ------------------------------------------------------------------------
+    # POST /usuarios/<id>/aprovacao
+    # ------------------------------------------------------------------------
+
+    def test_aprovacao_de_pendente(self):
+        id_pendente = self.sistema.cadastros_pendentes()[0]
+        status, resposta = self.requisitar("POST", f"/usuarios/{id_pendente}/aprovacao",
+                                           {"aprovado": True}, self.token_admin)
+        self.assertEqual(status, 200)
+        self.assertEqual(self.sistema.usuarios[id_pendente]["aprovado"], True)
+        self.assertNotIn(id_pendente, self.sistema.cadastros_pendentes())
+
+    def test_aprovacao_de_usuario_aprovado(self):
+        id_aprovado = self.aprovado()
+        status, resposta = self.requisitar("POST", f"/usuarios/{id_aprovado}/aprovacao",
+                                           {"aprovado": False}, self.token_admin)
+        self.assertEqual(status, 409)
+        self.assertEqual(self.sistema.usuarios[id_aprovado]["aprovado"], True)
+
+    def test_aprovacao_do_proprio_cadastro(self):
+        status, resposta = self.requisitar("POST", f"/usuarios/{self.id_admin}/aprovacao",
+                                           {"aprovado": False}, self.token_admin)
+        self.assertEqual(status, 400)
+        self.assertEqual(self.sistema.usuarios[self.id_admin]["aprovado"], True)
+        # O administrador continua conseguindo entrar
+        status, _ = self.requisitar("POST", "/login", {"matricula": matricula_do_numero(0),
+                                                       "senha": SENHA_PADRAO})
+        self.assertEqual(status, 200)
+
+    def test_aprovacao_de_usuario_inexistente(self):
+        status, resposta = self.requisitar("POST", "/usuarios/XXX0000/aprovacao",
+                                           {"aprovado": True}, self.token_admin)
+        self.assertEqual(status, 404)
+
+    # ------------------------------------------------------------------------
+    # ARQUIVOS GERADOS
+    # ------------------------------------------------------------------------
+
+    def entrar(self, id_usuario):
+        status, resposta = self.requisitar("POST", "/login", {"matricula": self.sistema.usuarios[id_usuario]["matricula"],
+                                                              "senha": SENHA_PADRAO})
+        self.assertEqual(status, 200)
+        return resposta["token"]
+
+    def test_entrega_devolve_caminho_relativo(self):
+        # Aluno aprovado de uma turma com alguma atividade (tipo "A")
+        for id_aluno in self.sistema.usuarios.dados:
+            aluno = self.sistema.usuarios[id_aluno]
+            if aluno["cargo"] != "aluno" or aluno["aprovado"] != True:
+                continue
+            atividades = [id_atividade for id_disciplina in self.sistema.disciplinas_do_usuario(id_aluno)
+                          for id_atividade in self.sistema.atividades.atividades_da_disciplina(id_disciplina)
+                          if self.sistema.atividades[id_atividade]["tipo"] == "A"]
+            if atividades:
+                break
+        status, resposta = self.requisitar("POST", f"/atividades/{atividades[0]}/entregas",
+                                           {"resposta": "Resposta"}, self.entrar(id_aluno))
+        self.assertEqual(status, 201)
+        self.assertTrue(resposta["arquivo"].startswith("atividades_alunos/"))
+
+    def test_relatorio_devolve_caminhos_relativos(self):
+        id_disciplina = next(id_disciplina for id_disciplina in self.sistema.disciplinas.dados
+                             if self.sistema.turmas_da_disciplina(id_disciplina))
+        id_professor = self.sistema.disciplinas[id_disciplina]["professor"]
+        status, resposta = self.requisitar("POST", "/relatorios/presenca",
+                                           {"disciplina": id_disciplina, "data": "02/03/2026"},
+                                           self.entrar(id_professor))
+        self.assertEqual(status, 201)
+        self.assertTrue(resposta["arquivos"])
+        for arquivo in resposta["arquivos"]:
+            self.assertTrue(arquivo.startswith("relatorios_presenca/"))
+
+    # ------------------------------------------------------------------------
+    # ERROS
+    # ------------------------------------------------------------------------
+
+    def test_content_length_invalido(self):
+        for tamanho in ("abc", "-5"):
+            status, resposta = self.requisitar("POST", "/login", cabecalhos={"Content-Length": tamanho})
+            self.assertEqual(status, 400)
+
+    def test_erro_de_servico_sem_status(self):
+        indice = next(indice for indice, rota in enumerate(api_http.ROTAS) if rota[2] == api_http.listar_disciplinas)
+        original = api_http.ROTAS[indice]
+
+        def falhar(*_argumentos):
+            raise ErroServico("Erro do serviço.")
+
+        api_http.ROTAS[indice] = original[:2] + (falhar,) + original[3:]
+        try:
+            status, resposta = self.requisitar("GET", "/disciplinas", token=self.token_admin)
+        finally:
+            api_http.ROTAS[indice] = original
+        self.assertEqual(status, api_http.STATUS_ERRO_SERVICO)
+        self.assertEqual(resposta, {"erro": "Erro do serviço."})
+
+
+if __name__ == "__main__":
+    unittest.main()